@@ -0,0 +1,447 @@
+# python
+import atexit
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_index = []
+_index_lock = threading.Lock()
+
+
+def worker_id():
+    """Name of the parallel worker this process runs as ('' when running serially)."""
+    return os.getenv('WORKER_ID', '')
+
+
+def artifact_root():
+    """Directory all artifacts of this process go under.
+
+    Serial runs keep the historical layout (screenshots/, artifacts/ in the cwd).
+    Parallel workers get ARTIFACT_ROOT/<WORKER_ID>/ so they never overwrite each other.
+    """
+    root = os.getenv('ARTIFACT_ROOT', '.')
+    wid = worker_id()
+    return os.path.join(root, wid) if wid else root
+
+
+def artifact_dir(kind):
+    path = os.path.join(artifact_root(), kind)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def current_test():
+    # PYTEST_CURRENT_TEST looks like "test_scenarios.py::test_x[id] (call)"
+    return os.getenv('PYTEST_CURRENT_TEST', '').split(' ')[0]
+
+
+def artifact_path(kind, filename):
+    """Return a worker-namespaced path for a new artifact and record it in the index."""
+    path = os.path.join(artifact_dir(kind), filename)
+    with _index_lock:
+        _index.append({
+            'path': path,
+            'kind': kind,
+            'test': current_test(),
+            'worker': worker_id(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+    return path
+
+
+def write_index():
+    """Persist this process' artifact index next to its artifacts."""
+    path = os.path.join(artifact_root(), 'artifact_index.json')
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with _index_lock:
+        entries = list(_index)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, indent=2)
+    logger.info(f"[ARTIFACTS] index with {len(entries)} entries written to {path}")
+    return path
+
+
+@contextmanager
+def file_lock(path, timeout=10.0, stale_s=60.0):
+    """Cross-process lock next to `path` (O_EXCL lock file, portable); a lock older than stale_s is broken."""
+    lock = f"{path}.lock"
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock) > stale_s:
+                    os.remove(lock)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                logger.warning(f"Lock {lock} still held after {timeout}s; proceeding without it.")
+                lock = None
+                break
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        if lock is not None:
+            try:
+                os.remove(lock)
+            except OSError:
+                pass
+
+
+class ArtifactWriter:
+    """Background writer so artifact I/O stays off the test thread.
+
+    The test thread only grabs raw bytes/text from the driver and calls submit();
+    encoding, optional gzip compression and the disk write happen on a small
+    thread pool. The queue is bounded: when it is full, submit() blocks, which
+    applies backpressure instead of buffering unbounded screenshots in memory.
+    """
+
+    def __init__(self, max_queue=64, workers=2, compress_text=False):
+        self.compress_text = compress_text
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self.max_depth = 0
+        self.written = 0
+        self.failed = 0
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+        self.max_write_seconds = 0.0
+        # daemon threads so a forgotten close() can never hang interpreter exit
+        self._threads = [threading.Thread(target=self._run, name=f'artifact-writer-{i}', daemon=True)
+                         for i in range(workers)]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, path, data, compress=None):
+        """Queue `data` (bytes, or str to be UTF-8 encoded) for writing; returns the final path.
+
+        Text is gzip-compressed (and the path suffixed with .gz) when compress is
+        True, or when it is None and the writer was created with compress_text.
+        `data` may also be a callable job(path) that encodes and writes the file
+        itself (e.g. streaming compression) and returns the number of bytes written.
+        """
+        if compress is None:
+            compress = self.compress_text and isinstance(data, str)
+        if compress and not callable(data):
+            path = f"{path}.gz"
+        self._queue.put((path, data, compress))
+        with self._lock:
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return path
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path, data, compress):
+        start = time.perf_counter()
+        try:
+            if callable(data):
+                size = data(path)
+            else:
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                if compress:
+                    data = gzip.compress(data, compresslevel=6)
+                with open(path, 'wb') as f:
+                    f.write(data)
+                size = len(data)
+        except Exception:
+            logger.exception(f"Failed to write artifact {path}")
+            with self._lock:
+                self.failed += 1
+            return
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.written += 1
+            self.bytes_written += size
+            self.write_seconds += elapsed
+            self.max_write_seconds = max(self.max_write_seconds, elapsed)
+
+    def flush(self):
+        """Block until everything queued so far is on disk."""
+        self._queue.join()
+
+    def close(self):
+        self.flush()
+        for _ in self._threads:
+            self._queue.put(None)
+        for t in self._threads:
+            t.join()
+
+    def metrics(self):
+        with self._lock:
+            avg = self.write_seconds / self.written if self.written else 0.0
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue_depth': self.max_depth,
+                'written': self.written,
+                'failed': self.failed,
+                'bytes_written': self.bytes_written,
+                'avg_write_ms': round(avg * 1000, 2),
+                'max_write_ms': round(self.max_write_seconds * 1000, 2),
+            }
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer():
+    """Process-wide ArtifactWriter, created on first use.
+
+    ARTIFACT_QUEUE_SIZE (default 64), ARTIFACT_WRITER_THREADS (default 2) and
+    ARTIFACT_COMPRESS=true (gzip text artifacts such as page sources) configure it.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ArtifactWriter(
+                max_queue=int(os.getenv('ARTIFACT_QUEUE_SIZE', '64')),
+                workers=int(os.getenv('ARTIFACT_WRITER_THREADS', '2')),
+                compress_text=os.getenv('ARTIFACT_COMPRESS', 'false').lower() == 'true',
+            )
+        return _writer
+
+
+def close_writer():
+    """Flush and stop the process-wide writer; returns its final metrics (None if never used)."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is None:
+        return None
+    writer.close()
+    return writer.metrics()
+
+
+class ScreenshotStore:
+    """Content-addressed screenshot store.
+
+    Each screenshot is stored once under blobs/<sha256[:2]>/<sha256>.png, however
+    many tests/steps produce the same image. index.json maps test/step/timestamp
+    to the blob. enforce_retention() drops index entries older than max_age_days,
+    then the oldest entries until the blobs fit in max_bytes, and deletes blobs no
+    entry references any more, so disk usage stays flat on long-lived agents.
+
+    Parallel workers share one root (SCREENSHOT_ROOT, see run_parallel): save()
+    merges this process' entries into index.json under a file lock, so dedup and
+    retention cover every worker and run. Unreferenced blobs are only deleted once
+    they are orphan_grace_s old, since another worker may not have saved its index yet.
+    """
+
+    def __init__(self, root, max_bytes=None, max_age_days=None, writer=None, orphan_grace_s=3600):
+        self.root = root
+        # optional visual_diff.VisualDiff: every stored screenshot is also compared to its baseline
+        # (keyed by the test VisualDiff.begin() was given, not by `test`)
+        self.visual = None
+        self.blob_dir = os.path.join(root, 'blobs')
+        self.index_path = os.path.join(root, 'index.json')
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.orphan_grace_s = orphan_grace_s
+        self.writer = writer
+        self.entries = self._load_index()
+        self._added = []  # entries of this process not yet merged into index.json
+        self._known = {e['blob'] for e in self.entries}
+        self._lock = threading.Lock()
+        self.stored = 0
+        self.deduplicated = 0
+        self.bytes_saved = 0
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def put(self, test, step, png):
+        """Store a screenshot for test/step and return the blob path."""
+        if self.visual is not None:
+            self.visual.submit(step, png)
+        digest = hashlib.sha256(png).hexdigest()
+        blob = os.path.join(digest[:2], f"{digest}.png")
+        path = os.path.join(self.blob_dir, blob)
+        with self._lock:
+            known = blob in self._known
+            new = not known and not os.path.exists(path)
+            self._known.add(blob)
+            entry = {
+                'test': test,
+                'step': step,
+                'worker': worker_id(),
+                'timestamp': time.time(),
+                'blob': blob,
+                'size': len(png),
+            }
+            self.entries.append(entry)
+            self._added.append(entry)
+            if new:
+                self.stored += 1
+            else:
+                self.deduplicated += 1
+                self.bytes_saved += len(png)
+        if not new and not known:
+            # written by another worker or run: mark it in use so its retention pass keeps it
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        if new:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.writer is not None:
+                self.writer.submit(path, png)
+            else:
+                with open(path, 'wb') as f:
+                    f.write(png)
+        return path
+
+    def enforce_retention(self):
+        """Apply the age/size policy; returns the number of blobs deleted."""
+        with self._lock:
+            entries = sorted(self.entries, key=lambda e: e['timestamp'])
+            if self.max_age_days is not None:
+                cutoff = time.time() - self.max_age_days * 86400
+                entries = [e for e in entries if e['timestamp'] >= cutoff]
+            if self.max_bytes is not None:
+                sizes = {e['blob']: e['size'] for e in entries}
+                total = sum(sizes.values())
+                while entries and total > self.max_bytes:
+                    dropped = entries.pop(0)
+                    if all(e['blob'] != dropped['blob'] for e in entries):
+                        total -= sizes.pop(dropped['blob'], 0)
+            self.entries = entries
+            self._known = {e['blob'] for e in entries}
+            referenced = set(self._known)
+
+        cutoff = time.time() - self.orphan_grace_s
+        removed = 0
+        for dirpath, _, files in os.walk(self.blob_dir):
+            for name in files:
+                blob = os.path.join(os.path.relpath(dirpath, self.blob_dir), name)
+                if blob not in referenced:
+                    try:
+                        if os.path.getmtime(os.path.join(dirpath, name)) < cutoff:
+                            os.remove(os.path.join(dirpath, name))
+                            removed += 1
+                    except OSError:
+                        logger.debug(f"Could not remove blob {blob}")
+        return removed
+
+    def save(self):
+        """Flush pending blob writes, merge into the index on disk, apply retention and persist it."""
+        if self.writer is not None:
+            self.writer.flush()
+        os.makedirs(self.root, exist_ok=True)
+        with file_lock(self.index_path):
+            with self._lock:
+                # other workers sharing the root may have saved since this store loaded the index
+                self.entries = self._load_index() + self._added
+                self._added = []
+            removed = self.enforce_retention()
+            tmp = f"{self.index_path}.{os.getpid()}.tmp"
+            with self._lock:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(self.entries, f, indent=1)
+            os.replace(tmp, self.index_path)
+        return removed
+
+    def stats(self):
+        return {
+            'entries': len(self.entries),
+            'stored': self.stored,
+            'deduplicated': self.deduplicated,
+            'bytes_saved': self.bytes_saved,
+        }
+
+
+class CaptureRing:
+    """The last `size` step captures (screenshot and DOM) of a test, kept in memory only.
+
+    Used as an Instrumentation listener it captures after every top-level page-object
+    step (not the steps nested in it, e.g. the per-row enter/click steps of a
+    data-driven run, which would capture hundreds of frames); page failure screenshots and explicit captures go into the same ring. flush()
+    writes the trail to disk (for failed tests), clear() drops it, so passing
+    tests cost no artifact I/O.
+    """
+
+    def __init__(self, driver, size=10, dom=True, visual=None):
+        self.driver = driver
+        self.frames = deque(maxlen=size)
+        self.dom = dom
+        self.captured = 0
+        # optional visual_diff.VisualDiff: the ring's own step shots are compared to baselines
+        self.visual = visual
+        self._depth = 0  # nesting level of the running page-object step
+
+    def capture(self, step, png=None, error=None):
+        try:
+            # failure shots (handed in, or taken for a failed step) have no baseline to compare with
+            compare = png is None and error is None and self.visual is not None
+            if png is None:
+                png = self.driver.get_screenshot_as_png()
+            html = self.driver.page_source if self.dom else None
+        except Exception as e:
+            logger.debug(f"[ARTIFACTS] ring capture of '{step}' failed: {e}")
+            return
+        self.captured += 1
+        if compare:
+            self.visual.submit(step, png)
+        self.frames.append({'step': step, 'timestamp': time.time(), 'png': png, 'html': html, 'error': error})
+
+    # --- Instrumentation listener ---
+    def on_step_start(self, name):
+        self._depth += 1
+
+    def on_step_end(self, record):
+        self._depth = max(self._depth - 1, 0)
+        if self._depth == 0:
+            self.capture(record.name, error=record.error)
+
+    def flush(self, base, writer):
+        """Write the buffered frames as <base>_stepNN_<step>.png plus a compressed .html snapshot;
+        returns the paths written."""
+        from snapshots import write_snapshot  # snapshots builds on this module
+        paths = []
+        for i, frame in enumerate(self.frames):
+            name = f"{base}_step{i:02d}_{frame['step']}"
+            paths.append(writer.submit(artifact_path('artifacts', f"{name}.png"), frame['png']))
+            if frame['html'] is not None:
+                paths.append(write_snapshot('artifacts', name, frame['html'], 'html', writer=writer))
+        self.clear()
+        return paths
+
+    def clear(self):
+        self.frames.clear()
+
+    def stats(self):
+        return {
+            'frames': len(self.frames),
+            'captured': self.captured,
+            'bytes': sum(len(f['png']) + len(f['html'] or '') for f in self.frames),
+        }
+
+
+# scripts that never call close_writer() still get their queued artifacts on disk
+atexit.register(close_writer)
@@ -0,0 +1,199 @@
+# python
+"""Async variant of SeleniumPlaygroundPage for driving many sessions from one event loop.
+
+Same locators, deep links and in-page scripts as pages.SeleniumPlaygroundPage; every
+method is a coroutine on an async_webdriver.AsyncRemoteDriver. Form filling and text
+checks always use the single-round-trip scripts (the blocking page's "batched" mode),
+since round trips are what an event loop full of remote sessions waits on.
+"""
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from async_webdriver import async_until
+from page_scripts import (JS_FILL_FORM, JS_MATCH_TEXT, JS_RUN_CASE, JS_TEXT, case_fields, case_result, log_case_summary,
+                          message_expected, sum_expected)
+from pages import DEFAULT_PLAYGROUND_URL, NAVIGATION_MODES, SeleniumPlaygroundPage
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSeleniumPlaygroundPage:
+    # locators and deep links are shared with the blocking page object
+    L = SeleniumPlaygroundPage
+
+    def __init__(self, driver, timeout=20, base_url=DEFAULT_PLAYGROUND_URL, navigation="direct"):
+        if navigation not in NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation '{navigation}', expected one of {NAVIGATION_MODES}")
+        self.driver = driver
+        self.timeout = timeout
+        self.base_url = base_url.rstrip("/")
+        self.navigation = navigation
+
+    # --- Internal helpers ---
+    async def _until(self, condition, timeout=None):
+        return await async_until(condition, self.timeout if timeout is None else timeout)
+
+    async def _visible(self, locator, timeout=None, enabled=False):
+        async def condition():
+            for el in await self.driver.find_elements(*locator):
+                if await el.is_displayed() and (not enabled or await el.is_enabled()):
+                    return el
+            return None
+        return await self._until(condition, timeout)
+
+    async def _clickable(self, locator, timeout=None):
+        return await self._visible(locator, timeout, enabled=True)
+
+    async def _wait_for_any_element_text(self, locators, expected_text, timeout=None, contains=False):
+        candidates = [[by, value] for by, value in locators]
+
+        async def condition():
+            return await self.driver.execute_script(JS_MATCH_TEXT, candidates, expected_text, contains)
+
+        index, text, _ = await self._until(condition, timeout)
+        return text
+
+    # --- Navigation ---
+    async def open_playground(self):
+        if self.navigation == "direct":
+            return
+        await self.driver.get(self.base_url)
+
+    async def _go_to(self, path, link, ready_locator):
+        if self.navigation == "direct":
+            await self.driver.get(f"{self.base_url}/{path}")
+        else:
+            await (await self._clickable(link)).click()
+        await self._clickable(ready_locator, timeout=30)
+        logger.info(f"[ASYNC] {self.driver.session_id}: {path} ready")
+
+    async def go_to_simple_form_demo(self):
+        await self._go_to(self.L.SIMPLE_FORM_DEMO_PATH, self.L.SIMPLE_FORM_DEMO_LINK, self.L.SINGLE_INPUT_FIELD)
+
+    async def go_to_input_form_submit(self):
+        await self._go_to(self.L.INPUT_FORM_SUBMIT_PATH, self.L.INPUT_FORM_SUBMIT_LINK, self.L.NAME_FIELD)
+
+    async def go_to_checkbox_demo(self):
+        await self._go_to(self.L.CHECKBOX_DEMO_PATH, self.L.CHECKBOX_DEMO_LINK, self.L.SINGLE_CHECKBOX)
+
+    # --- Interaction ---
+    async def _type(self, locator, text):
+        el = await self._visible(locator)
+        await el.clear()
+        await el.send_keys(text)
+
+    async def _click(self, locator):
+        await (await self._clickable(locator)).click()
+
+    async def enter_message(self, message):
+        await self._type(self.L.SINGLE_INPUT_FIELD, message)
+
+    async def click_get_checked_value(self):
+        await self._click(self.L.GET_CHECKED_VALUE_BUTTON)
+
+    async def enter_values_for_sum(self, a, b):
+        await self._type(self.L.FIRST_INPUT_FIELD, a)
+        await self._type(self.L.SECOND_INPUT_FIELD, b)
+
+    async def click_get_values_button(self):
+        await self._click(self.L.GET_VALUES_BUTTON)
+
+    async def click_submit_button(self):
+        await self._click(self.L.SUBMIT_BUTTON)
+
+    async def click_single_checkbox(self):
+        await self._click(self.L.SINGLE_CHECKBOX)
+
+    async def fill_form(self, data):
+        """Set every form field in one script execution; returns the per-field result map."""
+        await self._visible(self.L.NAME_FIELD)
+        fields = [[key, by, value, str(data[key])] for key, (by, value) in self.L.FORM_FIELDS
+                  if data.get(key) not in (None, "")]
+        results = await self.driver.execute_script(JS_FILL_FORM, fields)
+        failed = [key for key, res in results.items() if not res.get("ok")]
+        if failed:
+            logger.warning(f"[ASYNC] fill could not set field(s): {failed}")
+        return results
+
+    # --- Data-driven mode (many cases inside one loaded page) ---
+    async def run_sum_cases(self, cases, on_result=None, timeout=5):
+        """Run Two Input Fields cases ({'a', 'b', 'expected'}) on the open Simple Form Demo page.
+
+        Same contract as SeleniumPlaygroundPage.run_sum_cases: one round trip per row,
+        per-row result dicts, on_result(result) called as each row finishes.
+        """
+        return await self._run_cases(
+            cases, on_result, timeout,
+            inputs=lambda c: [(self.L.FIRST_INPUT_FIELD, c["a"]), (self.L.SECOND_INPUT_FIELD, c["b"])],
+            expected=sum_expected,
+            button=self.L.GET_VALUES_BUTTON,
+            result_locators=[self.L.SUM_DISPLAYED_LOCATOR, (By.ID, "displayvalue"), (By.CSS_SELECTOR, ".sum-result")],
+        )
+
+    async def run_message_cases(self, cases, on_result=None, timeout=5):
+        """Run Single Input Field cases ({'message', optional 'expected'}); see run_sum_cases."""
+        return await self._run_cases(
+            cases, on_result, timeout,
+            inputs=lambda c: [(self.L.SINGLE_INPUT_FIELD, c["message"])],
+            expected=message_expected,
+            button=self.L.GET_CHECKED_VALUE_BUTTON,
+            result_locators=[self.L.MESSAGE_DISPLAYED_LOCATOR, (By.ID, "display"), (By.ID, "message")],
+        )
+
+    async def _run_cases(self, cases, on_result, timeout, inputs, expected, button, result_locators):
+        results = []
+        for row, case in enumerate(cases):
+            want = expected(case)
+            start = time.perf_counter()
+            actual, error = None, None
+            try:
+                fields = case_fields(inputs(case))
+                outcome = await self.driver.execute_script(JS_RUN_CASE, fields, list(button),
+                                                           list(result_locators[0])) or {}
+                error, actual = outcome.get("error"), outcome.get("text")
+                if error is None and actual != want:
+                    # slow or asynchronous pages: fall back to polling for the expected text
+                    try:
+                        actual = await self._wait_for_any_element_text(result_locators, want, timeout=timeout)
+                    except TimeoutException:
+                        actual = await self.driver.execute_script(JS_TEXT, *result_locators[0])
+            except WebDriverException as e:
+                error = str(e).splitlines()[0]
+            result = case_result(row, case, want, actual, error, start, tag="[ASYNC] ")
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+        log_case_summary(results, tag=f"[ASYNC] {self.driver.session_id}: ")
+        return results
+
+    # --- Validation ---
+    async def get_html5_validation_message(self, locator):
+        el = await self.driver.find_element(*locator)
+        return await self.driver.execute_script("return arguments[0].validationMessage;", el)
+
+    async def _validate_text(self, locators, expected, timeout, what):
+        try:
+            text = await self._wait_for_any_element_text(locators, expected, timeout=timeout, contains=True)
+        except TimeoutException:
+            raise AssertionError(f"{what} not displayed: {expected}")
+        logger.info(f"[ASYNC] {what} validated: '{text}'")
+        return text
+
+    async def validate_message_displayed(self, expected_message):
+        return await self._validate_text([self.L.MESSAGE_DISPLAYED_LOCATOR, (By.ID, "display"), (By.ID, "message")],
+                                         expected_message, 20, "Expected message")
+
+    async def validate_sum_displayed(self, expected_sum):
+        return await self._validate_text([self.L.SUM_DISPLAYED_LOCATOR, (By.ID, "displayvalue")],
+                                         expected_sum, 15, "Sum")
+
+    async def validate_submission_success(self, expected_message):
+        return await self._validate_text([self.L.SUCCESS_MESSAGE, (By.CSS_SELECTOR, ".alert-success")],
+                                         expected_message, 20, "Success message")
+
+    async def validate_single_checkbox_success_message(self):
+        return await self._validate_text([self.L.SINGLE_CHECKBOX_SUCCESS_MESSAGE], "Success - Check box is checked",
+                                         12, "Checkbox success message")
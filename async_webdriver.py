@@ -0,0 +1,360 @@
+# python
+"""Minimal asyncio WebDriver client: many sessions, one event loop, pooled keep-alive HTTP.
+
+Only what the async page object needs is implemented (sessions, navigation, element
+lookup and interaction, scripts, screenshots). Errors are raised as the same selenium
+exception classes the blocking driver raises, via selenium's ErrorHandler.
+
+    pool = AsyncHTTPPool("http://127.0.0.1:4444/wd/hub")
+    async with async_session(pool, "my_test") as driver:
+        await driver.get("https://example.com")
+    await pool.close()
+"""
+import asyncio
+import base64
+import json
+import logging
+import os
+import socket
+import ssl
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import unquote, urlsplit
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+
+from waits import IGNORED_EXCEPTIONS
+
+logger = logging.getLogger(__name__)
+
+# W3C web element reference key
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_error_handler = ErrorHandler()
+
+# what the blocking waits poll through, plus script errors from a page mid-navigation
+POLL_IGNORED_EXCEPTIONS = IGNORED_EXCEPTIONS + (JavascriptException,)
+
+
+class AsyncHTTPPool:
+    """HTTP/1.1 keep-alive connection pool to one WebDriver endpoint (hub or chromedriver).
+
+    At most `max_connections` requests are in flight; finished connections go back to
+    the pool and are reused by the next request, so dozens of sessions share a handful
+    of sockets. A reused connection the server already closed is retried once on a
+    fresh one.
+    """
+
+    def __init__(self, url, max_connections=32, timeout=120):
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.prefix = parts.path.rstrip("/")
+        self.auth = None
+        if parts.username:
+            token = f"{unquote(parts.username)}:{unquote(parts.password or '')}".encode("utf-8")
+            self.auth = "Basic " + base64.b64encode(token).decode("ascii")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._semaphore = None
+        self._idle = []
+        self.opened = 0
+        self.requests = 0
+
+    async def _connection(self):
+        while self._idle:
+            reader, writer = self._idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        reader, writer = await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+        self.opened += 1
+        return reader, writer, False
+
+    async def request(self, method, path, payload=None):
+        """Send one command; returns (status, raw body text)."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        async with self._semaphore:
+            for attempt in range(2):
+                reader, writer, reused = await self._connection()
+                try:
+                    status, keep_alive, data = await asyncio.wait_for(
+                        self._roundtrip(reader, writer, method, self.prefix + path, body), self.timeout)
+                except asyncio.TimeoutError:
+                    writer.close()
+                    raise
+                except (ConnectionError, asyncio.IncompleteReadError, OSError):
+                    # a kept-alive connection the server has closed in the meantime
+                    writer.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                except BaseException:
+                    writer.close()
+                    raise
+                self.requests += 1
+                if keep_alive:
+                    self._idle.append((reader, writer))
+                else:
+                    writer.close()
+                return status, data.decode("utf-8")
+
+    async def _roundtrip(self, reader, writer, method, path, body):
+        headers = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {self.host}:{self.port}",
+            "Accept: application/json",
+            "Content-Type: application/json;charset=UTF-8",
+            f"Content-Length: {len(body)}",
+            "Connection: keep-alive",
+        ]
+        if self.auth:
+            headers.append(f"Authorization: {self.auth}")
+        writer.write(("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+        status_line = await reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        response_headers = {}
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        keep_alive = response_headers.get("connection", "").lower() != "close"
+        if "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        elif response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readuntil(b"\r\n")
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            data = b"".join(chunks)
+        else:
+            data = await reader.read()
+            keep_alive = False
+        return status, keep_alive, data
+
+    async def close(self):
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+
+    def stats(self):
+        return {"connections_opened": self.opened, "requests": self.requests, "idle": len(self._idle)}
+
+
+class AsyncWebElement:
+    def __init__(self, driver, element_id):
+        self.driver = driver
+        self.id = element_id
+
+    def _cmd(self, method, command, payload=None):
+        return self.driver.execute(method, f"/element/{self.id}{command}", payload)
+
+    async def click(self):
+        await self._cmd("POST", "/click", {})
+
+    async def clear(self):
+        await self._cmd("POST", "/clear", {})
+
+    async def send_keys(self, text):
+        text = str(text)
+        await self._cmd("POST", "/value", {"text": text, "value": list(text)})
+
+    async def text(self):
+        return await self._cmd("GET", "/text")
+
+    async def is_enabled(self):
+        return await self._cmd("GET", "/enabled")
+
+    async def is_displayed(self):
+        # W3C has no displayedness endpoint; approximate selenium's atom with layout boxes and style
+        return await self.driver.execute_script(
+            "var e = arguments[0], s = window.getComputedStyle(e);"
+            "return e.getClientRects().length > 0 && s.visibility !== 'hidden' && s.display !== 'none';", self)
+
+
+class AsyncRemoteDriver:
+    """One WebDriver session driven through an AsyncHTTPPool."""
+
+    def __init__(self, pool, session_id, capabilities=None):
+        self.pool = pool
+        self.session_id = session_id
+        self.capabilities = capabilities or {}
+        self.commands = 0
+
+    @classmethod
+    async def create(cls, pool, capabilities):
+        status, raw = await pool.request("POST", "/session", {"capabilities": {"alwaysMatch": capabilities}})
+        value = _check(status, raw)
+        return cls(pool, value["sessionId"], value.get("capabilities"))
+
+    async def execute(self, method, command, payload=None):
+        self.commands += 1
+        status, raw = await self.pool.request(method, f"/session/{self.session_id}{command}", payload)
+        return self._unwrap(_check(status, raw))
+
+    def _wrap(self, value):
+        if isinstance(value, AsyncWebElement):
+            return {ELEMENT_KEY: value.id}
+        if isinstance(value, (list, tuple)):
+            return [self._wrap(v) for v in value]
+        return value
+
+    def _unwrap(self, value):
+        if isinstance(value, dict) and ELEMENT_KEY in value:
+            return AsyncWebElement(self, value[ELEMENT_KEY])
+        if isinstance(value, list):
+            return [self._unwrap(v) for v in value]
+        return value
+
+    async def get(self, url):
+        await self.execute("POST", "/url", {"url": url})
+
+    async def current_url(self):
+        return await self.execute("GET", "/url")
+
+    async def title(self):
+        return await self.execute("GET", "/title")
+
+    async def find_element(self, by, value):
+        return await self.execute("POST", "/element", {"using": by, "value": value})
+
+    async def find_elements(self, by, value):
+        return await self.execute("POST", "/elements", {"using": by, "value": value}) or []
+
+    async def execute_script(self, script, *args):
+        return await self.execute("POST", "/execute/sync", {"script": script, "args": self._wrap(list(args))})
+
+    async def get_screenshot_as_png(self):
+        return base64.b64decode(await self.execute("GET", "/screenshot"))
+
+    async def set_timeouts(self, **timeouts):
+        await self.execute("POST", "/timeouts", timeouts)
+
+    async def quit(self):
+        status, raw = await self.pool.request("DELETE", f"/session/{self.session_id}")
+        _check(status, raw)
+
+
+def _check(status, raw):
+    """Return the response value or raise the matching selenium exception."""
+    try:
+        value = json.loads(raw).get("value") if raw else None
+    except ValueError:
+        value = None
+    if status >= 400 or (isinstance(value, dict) and "error" in value):
+        _error_handler.check_response({"status": status, "value": raw})
+    return value
+
+
+async def async_until(condition, timeout=20, poll=0.05, max_poll=0.5, backoff=1.5):
+    """Await `condition()` until it returns something truthy; polling backs off like waits.WaitEngine.
+
+    Missing or stale elements count as "not yet", as in WebDriverWait, and so does a
+    JavascriptException from a script running mid-navigation. Anything else (a dead
+    session, a closed window) is raised at once.
+    """
+    deadline = time.perf_counter() + timeout
+    delay = poll
+    while True:
+        try:
+            value = await condition()
+            if value:
+                return value
+        except POLL_IGNORED_EXCEPTIONS:
+            pass
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutException(f"Condition not met within {timeout}s")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * backoff, max_poll)
+
+
+def remote_capabilities(test_name):
+    """Capabilities matching drivers.create_driver's remote branch (LT_* environment)."""
+    return {
+        "browserName": os.getenv("LT_BROWSER", "chrome"),
+        "LT:Options": {
+            "username": os.getenv("LT_USERNAME"),
+            "accessKey": os.getenv("LT_ACCESS_KEY"),
+            "platformName": os.getenv("LT_PLATFORM", "Windows 10"),
+            "browserVersion": os.getenv("LT_BROWSER_VERSION", "latest"),
+            "build": os.getenv("LT_BUILD", "Selenium Assignment - LambdaTest Playground"),
+            "name": test_name,
+        },
+    }
+
+
+@asynccontextmanager
+async def async_session(pool, test_name, capabilities=None):
+    """Async counterpart of the `driver` fixture: a session that is always quit afterwards."""
+    driver = await AsyncRemoteDriver.create(pool, capabilities or remote_capabilities(test_name))
+    logger.info(f"[ASYNC] session {driver.session_id} started for {test_name}")
+    try:
+        yield driver
+    finally:
+        try:
+            await driver.quit()
+        except Exception:
+            logger.debug(f"[ASYNC] quitting session {driver.session_id} failed", exc_info=True)
+
+
+class AsyncChromeService:
+    """One local chromedriver process shared by every async session (it hosts many)."""
+
+    def __init__(self, path=None, port=0, timeout=20):
+        self.path = path
+        self.port = port
+        self.timeout = timeout
+        self.process = None
+        self.url = None
+
+    async def start(self):
+        """Spawn chromedriver and wait until /status answers; the process is killed if it never does."""
+        from driver_resolver import get_chromedriver_path
+        port = self.port or _free_port()
+        self.process = await asyncio.create_subprocess_exec(
+            self.path or get_chromedriver_path(), f"--port={port}",
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+        self.url = f"http://127.0.0.1:{port}"
+        pool = AsyncHTTPPool(self.url, max_connections=1)
+        try:
+            await async_until(lambda: _ready(pool), timeout=self.timeout, poll=0.05)
+        except BaseException:
+            logger.warning(f"[ASYNC] chromedriver on port {port} did not become ready; stopping it")
+            await self.stop()
+            raise
+        finally:
+            await pool.close()
+        return self.url
+
+    async def stop(self):
+        if self.process is not None and self.process.returncode is None:
+            self.process.terminate()
+            await self.process.wait()
+
+
+async def _ready(pool):
+    try:
+        status, raw = await pool.request("GET", "/status")
+    except OSError:
+        return False
+    return status == 200
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
@@ -0,0 +1,209 @@
+# python
+"""Threaded selenium sessions vs. one asyncio event loop, against the stand-in hub.
+
+Each session runs the same command mix as a short scenario: new session, navigate,
+--commands script executions, title, screenshot, quit. With --flow page each session
+runs the page-object flow instead (input form fill and submit, --commands sum rows,
+checkbox check) against the hub's PlaygroundPage model: SeleniumPlaygroundPage on
+threads vs. AsyncSeleniumPlaygroundPage, both deep-linking and filling in one script.
+The threaded mode runs one selenium webdriver.Remote per thread (one thread per
+concurrent session); the async mode runs every session on one event loop through
+async_webdriver's pooled keep-alive client. Reported per mode: wall time,
+sessions/s, commands/s, peak Python heap per session (tracemalloc) and threads used.
+
+Usage (from the repo root):
+    python -m benchmarks.async_sessions --sessions 50 --command-delay-ms 20 --session-delay-ms 200
+    python -m benchmarks.async_sessions --flow page --sessions 50 --commands 5
+    python -m benchmarks.async_sessions --hub http://127.0.0.1:4444/wd/hub   # an already running hub
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from async_pages import AsyncSeleniumPlaygroundPage
+from async_webdriver import AsyncHTTPPool, async_session
+from pages import SeleniumPlaygroundPage
+
+BASE_URL = "http://127.0.0.1/selenium-playground"
+PAGE_URL = f"{BASE_URL}/simple-form-demo"
+SCRIPT = "return document.readyState;"
+FORM = {"name": "Test User", "email": "test@example.com", "password": "password123", "company": "Test Company",
+        "website": "https://example.com", "country": "United States", "city": "Test City",
+        "address1": "123 Test St", "address2": "Suite 100", "state": "CA", "zipcode": "12345"}
+
+
+class CountingRemote(webdriver.Remote):
+    """webdriver.Remote counting its commands (new session and quit included)."""
+    commands = 0
+
+    def execute(self, driver_command, params=None):
+        self.commands += 1
+        return super().execute(driver_command, params)
+
+
+def start_stub_hub(session_delay_ms, command_delay_ms, playground=False):
+    """Run stub_hub.py in its own process so its threads and memory are not measured."""
+    import socket
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(root, "stub_hub.py"), "--port", str(port),
+         "--session-delay-ms", str(session_delay_ms), "--command-delay-ms", str(command_delay_ms)]
+        + (["--playground"] if playground else []),
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    proc.stdout.readline()  # "Stub hub at ..." once it is listening
+    return proc, f"http://127.0.0.1:{port}/wd/hub"
+
+
+def threaded_session(hub, commands):
+    driver = webdriver.Remote(command_executor=hub, options=ChromeOptions())
+    try:
+        driver.get(PAGE_URL)
+        for _ in range(commands):
+            driver.execute_script(SCRIPT)
+        driver.title
+        driver.get_screenshot_as_png()
+    finally:
+        driver.quit()
+    return commands + 4
+
+
+def sum_cases(rows):
+    return [{"a": i, "b": i + 1} for i in range(rows)]
+
+
+def threaded_page_session(hub, rows):
+    driver = CountingRemote(command_executor=hub, options=ChromeOptions())
+    try:
+        page = SeleniumPlaygroundPage(driver, fill_mode="batched", base_url=BASE_URL, navigation="direct")
+        page.go_to_input_form_submit()
+        page.fill_form(FORM)
+        page.click_submit_button()
+        page.go_to_simple_form_demo()
+        assert all(r["passed"] for r in page.run_sum_cases(sum_cases(rows)))
+        page.go_to_checkbox_demo()
+        page.click_single_checkbox()
+        page.validate_single_checkbox_success_message()
+    finally:
+        driver.quit()
+    return driver.commands - 2
+
+
+def run_threaded(hub, sessions, commands, session=threaded_session):
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        threads = threading.active_count()
+        futures = [pool.submit(session, hub, commands) for _ in range(sessions)]
+        threads = max(threads, threading.active_count())
+        total = sum(f.result() for f in futures)
+    return total, threads
+
+
+async def async_one(pool, commands):
+    async with async_session(pool, "bench_async", capabilities={"browserName": "chrome"}) as driver:
+        await driver.get(PAGE_URL)
+        for _ in range(commands):
+            await driver.execute_script(SCRIPT)
+        await driver.title()
+        await driver.get_screenshot_as_png()
+    return commands + 4
+
+
+async def async_page_one(pool, rows):
+    async with async_session(pool, "bench_async", capabilities={"browserName": "chrome"}) as driver:
+        page = AsyncSeleniumPlaygroundPage(driver, base_url=BASE_URL, navigation="direct")
+        await page.go_to_input_form_submit()
+        await page.fill_form(FORM)
+        await page.click_submit_button()
+        await page.go_to_simple_form_demo()
+        assert all(r["passed"] for r in await page.run_sum_cases(sum_cases(rows)))
+        await page.go_to_checkbox_demo()
+        await page.click_single_checkbox()
+        await page.validate_single_checkbox_success_message()
+    return driver.commands
+
+
+def run_async(hub, sessions, commands, one=async_one):
+    async def main():
+        pool = AsyncHTTPPool(hub, max_connections=sessions)
+        try:
+            return sum(await asyncio.gather(*(one(pool, commands) for _ in range(sessions)))), pool.stats()
+        finally:
+            await pool.close()
+    total, stats = asyncio.run(main())
+    return total, threading.active_count(), stats
+
+
+def measure(label, fn, sessions):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    commands, threads = result[0], result[1]
+    row = {
+        "mode": label,
+        "wall_s": round(wall, 2),
+        "sessions_per_s": round(sessions / wall, 1),
+        "commands_per_s": round(commands / wall, 1),
+        "heap_kib_per_session": round(peak / 1024 / sessions, 1),
+        "threads": threads,
+    }
+    if len(result) > 2:
+        row["pool"] = result[2]
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=30)
+    parser.add_argument("--commands", type=int, default=10,
+                        help="script executions per session (sum rows with --flow page)")
+    parser.add_argument("--flow", choices=("commands", "page"), default="commands",
+                        help="raw command mix, or the page-object flow")
+    parser.add_argument("--session-delay-ms", type=float, default=200)
+    parser.add_argument("--command-delay-ms", type=float, default=20)
+    parser.add_argument("--hub", help="use this hub instead of starting stub_hub.py")
+    args = parser.parse_args(argv)
+
+    proc = None
+    hub = args.hub
+    if hub is None:
+        proc, hub = start_stub_hub(args.session_delay_ms, args.command_delay_ms, playground=args.flow == "page")
+    threaded, one = (threaded_page_session, async_page_one) if args.flow == "page" else (threaded_session, async_one)
+    try:
+        rows = [
+            measure("threaded", lambda: run_threaded(hub, args.sessions, args.commands, threaded), args.sessions),
+            measure("asyncio", lambda: run_async(hub, args.sessions, args.commands, one), args.sessions),
+        ]
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    if args.flow == "page":
+        print(f"{args.sessions} sessions x page-object flow ({args.commands} sum rows) against {hub}")
+    else:
+        print(f"{args.sessions} sessions x {args.commands + 4} commands against {hub}")
+    print(f"{'mode':<10} {'wall s':>8} {'sess/s':>8} {'cmds/s':>9} {'KiB/sess':>9} {'threads':>8}")
+    for r in rows:
+        print(f"{r['mode']:<10} {r['wall_s']:>8.2f} {r['sessions_per_s']:>8.1f} {r['commands_per_s']:>9.1f} "
+              f"{r['heap_kib_per_session']:>9.1f} {r['threads']:>8}")
+    if "pool" in rows[-1]:
+        print(f"async connection pool: {rows[-1]['pool']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
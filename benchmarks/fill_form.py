@@ -0,0 +1,88 @@
+# python
+"""Compare fill_form modes: WebDriver command count and latency per fill.
+
+Usage (from the repo root):
+    python -m benchmarks.fill_form --runs 5
+Honours the same environment as the test suite (USE_LAMBDATEST, LT_*, ...), so it
+can be pointed at a remote hub where round trips matter most.
+"""
+import argparse
+import logging
+import os
+import statistics
+import time
+
+from drivers import create_driver
+from instrumentation import Instrumentation
+from pages import DEFAULT_PLAYGROUND_URL, FILL_MODES, SeleniumPlaygroundPage
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PLAYGROUND_URL = os.getenv("PLAYGROUND_URL", DEFAULT_PLAYGROUND_URL)
+
+FORM_DATA = {
+    "name": "John Doe",
+    "email": "john.doe@test.com",
+    "password": "Password123",
+    "company": "LambdaTest",
+    "website": "https://www.lambdatest.com",
+    "country": "United States",
+    "city": "San Francisco",
+    "address1": "123 Main St",
+    "address2": "Apt 4B",
+    "state": "California",
+    "zipcode": "94107",
+}
+
+
+def bench(runs, driver=None, base_url=PLAYGROUND_URL, navigation="click"):
+    """Median command count and latency per fill mode; `driver` defaults to a new create_driver session."""
+    own_driver = driver is None
+    if own_driver:
+        driver = create_driver("bench_fill_form")
+    try:
+        counter = Instrumentation("bench_fill_form")
+        counter.attach(driver)
+        page = SeleniumPlaygroundPage(driver, base_url=base_url, navigation=navigation)
+        page.open_playground()
+        page.go_to_input_form_submit()
+        form_url = driver.current_url
+
+        results = {}
+        for mode in FILL_MODES:
+            latencies, commands = [], []
+            for _ in range(runs):
+                # through the page object: a bare driver.get would leave it with stale cached elements
+                page.open(form_url)
+                before = counter.commands
+                start = time.perf_counter()
+                page.fill_form(FORM_DATA, mode=mode)
+                latencies.append(time.perf_counter() - start)
+                commands.append(counter.commands - before)
+            results[mode] = {
+                "commands": statistics.median(commands),
+                "commands_per_run": commands,
+                "median_ms": statistics.median(latencies) * 1000,
+                "max_ms": max(latencies) * 1000,
+            }
+        return results
+    finally:
+        counter.detach()
+        if own_driver:
+            driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = bench(args.runs)
+    print(f"{'mode':<10} {'commands':>9} {'median ms':>10} {'max ms':>9}")
+    for mode, r in results.items():
+        print(f"{mode:<10} {r['commands']:>9} {r['median_ms']:>10.1f} {r['max_ms']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
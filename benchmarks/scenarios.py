@@ -0,0 +1,198 @@
+# python
+"""Repeatable benchmark of the three playground scenarios, with regression gates.
+
+Each scenario runs --warmup times (discarded) and then --runs times on one reused
+driver. Per scenario and per page-object step it records p50/p95/max duration and
+WebDriver command counts.
+
+Usage (from the repo root):
+    python -m benchmarks.scenarios --runs 10 --offline --save benchmarks/baseline.json
+    python -m benchmarks.scenarios --runs 10 --offline --compare benchmarks/baseline.json --threshold 0.15
+
+With --compare the exit status is 1 when any scenario's p50/p95 duration grew by more
+than --threshold (relative) or its median command count grew at all.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+from drivers import create_driver, reset_driver
+from instrumentation import Instrumentation, instrument_page
+from pages import DEFAULT_PLAYGROUND_URL, SeleniumPlaygroundPage
+from playground_server import start_server
+from test_scenarios import scenario_1_simple_form_demo, scenario_2_two_input_fields, scenario_3_input_form_submit
+
+logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCENARIOS = {
+    "scenario_1_simple_form_demo": scenario_1_simple_form_demo,
+    "scenario_2_two_input_fields": scenario_2_two_input_fields,
+    "scenario_3_input_form_submit": scenario_3_input_form_submit,
+}
+
+
+def percentile(values, p):
+    """Nearest-rank percentile (p in 0..100)."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(p / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(values):
+    return {
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "max": round(max(values), 4),
+    }
+
+
+def run_once(driver, scenario, playground_url, fill_mode, navigation):
+    instr = Instrumentation(scenario.__name__)
+    instr.attach(driver)
+    try:
+        page = instrument_page(SeleniumPlaygroundPage(driver, fill_mode=fill_mode, base_url=playground_url,
+                                                      navigation=navigation), instr)
+        start = time.perf_counter()
+        page.open_playground()
+        scenario(page)
+        duration = time.perf_counter() - start
+    finally:
+        instr.detach()
+    return duration, instr
+
+
+def bench(scenarios, runs, warmup, playground_url, fill_mode="keystroke", navigation="click"):
+    driver = create_driver("bench_scenarios")
+    results = {}
+    try:
+        for name in scenarios:
+            scenario = SCENARIOS[name]
+            durations, commands, steps = [], [], {}
+            for i in range(warmup + runs):
+                duration, instr = run_once(driver, scenario, playground_url, fill_mode, navigation)
+                reset_driver(driver)
+                if i < warmup:
+                    continue
+                durations.append(duration)
+                commands.append(instr.commands)
+                for s in instr.steps:
+                    agg = steps.setdefault(s.name, {"durations": [], "commands": []})
+                    agg["durations"].append(s.wall)
+                    agg["commands"].append(s.commands)
+            results[name] = {
+                "runs": runs,
+                "duration_s": summarize(durations),
+                "commands": summarize(commands),
+                "steps": {step: {"duration_s": summarize(v["durations"]), "commands": summarize(v["commands"])}
+                          for step, v in steps.items()},
+            }
+    finally:
+        driver.quit()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return a list of human-readable regressions of `results` against `baseline`."""
+    regressions = []
+    for name, current in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for stat in ("p50", "p95"):
+            limit = base["duration_s"][stat] * (1 + threshold)
+            if current["duration_s"][stat] > limit:
+                regressions.append(f"{name}: {stat} {current['duration_s'][stat]:.3f}s > "
+                                   f"{limit:.3f}s (baseline {base['duration_s'][stat]:.3f}s + {threshold:.0%})")
+        if current["commands"]["p50"] > base["commands"]["p50"]:
+            regressions.append(f"{name}: commands {current['commands']['p50']} > baseline {base['commands']['p50']}")
+    return regressions
+
+
+def print_table(results):
+    print(f"{'scenario / step':<52} {'p50 s':>8} {'p95 s':>8} {'max s':>8} {'cmds':>6}")
+    for name, r in results.items():
+        print(f"{name:<52} {r['duration_s']['p50']:>8.3f} {r['duration_s']['p95']:>8.3f} "
+              f"{r['duration_s']['max']:>8.3f} {r['commands']['p50']:>6}")
+        for step, s in r["steps"].items():
+            print(f"  {step:<50} {s['duration_s']['p50']:>8.3f} {s['duration_s']['p95']:>8.3f} "
+                  f"{s['duration_s']['max']:>8.3f} {s['commands']['p50']:>6}")
+
+
+def print_navigation_savings(by_mode):
+    print(f"{'scenario':<40} {'click p50 s':>12} {'direct p50 s':>13} {'saved s':>8}")
+    for name, click in by_mode["click"].items():
+        direct = by_mode["direct"][name]
+        saved = click["duration_s"]["p50"] - direct["duration_s"]["p50"]
+        print(f"{name:<40} {click['duration_s']['p50']:>12.3f} {direct['duration_s']['p50']:>13.3f} {saved:>8.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="repeatable; default all")
+    parser.add_argument("--offline", action="store_true", help="run against the bundled playground_server stand-in")
+    parser.add_argument("--latency-ms", type=float, default=0, help="stand-in latency (with --offline)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="stand-in jitter (with --offline)")
+    parser.add_argument("--fill-mode", default=os.getenv("FORM_FILL_MODE", "keystroke"))
+    parser.add_argument("--navigation", choices=("click", "direct", "both"), default=os.getenv("NAVIGATION_MODE", "click"),
+                        help="'both' runs click and direct navigation and reports the time saved per scenario")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail on regression against this baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed relative slowdown (default 0.15)")
+    args = parser.parse_args(argv)
+
+    server = None
+    playground_url = os.getenv("PLAYGROUND_URL", DEFAULT_PLAYGROUND_URL)
+    if args.offline:
+        server, playground_url = start_server(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms)
+    modes = ("click", "direct") if args.navigation == "both" else (args.navigation,)
+    by_mode = {}
+    try:
+        for mode in modes:
+            by_mode[mode] = bench(args.scenario or list(SCENARIOS), args.runs, args.warmup, playground_url,
+                                  args.fill_mode, mode)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    for mode, results in by_mode.items():
+        print(f"\n[navigation={mode}]")
+        print_table(results)
+    if args.navigation == "both":
+        print()
+        print_navigation_savings(by_mode)
+
+    # the baseline / gate uses the last mode run (direct when comparing both)
+    results = by_mode[modes[-1]]
+    document = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "playground_url": playground_url,
+        "fill_mode": args.fill_mode,
+        "navigation": modes[-1],
+        "scenarios": results,
+    }
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"Baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for r in regressions:
+            print(f"REGRESSION {r}")
+        if regressions:
+            return 1
+        print(f"No regressions against {args.compare} (threshold {args.threshold:.0%}).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
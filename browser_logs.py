@@ -0,0 +1,142 @@
+# python
+import gzip
+import json
+import logging
+from collections import deque
+
+from selenium.webdriver.remote.command import Command
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserLogCollector:
+    """Streams console and network events out of the browser for the whole test.
+
+    Registered as an Instrumentation listener, it drains the driver's 'browser'
+    and 'performance' logs at top-level step boundaries (nested steps would cost
+    two more get_log round trips each), so each event is tagged with the outer
+    page-object step that was running when it happened. Events go into a
+    ring buffer of `capacity` entries (constant memory; the oldest are dropped),
+    and network requests are folded into per-step timing summaries. Raw
+    performance entries are handed to the ResourceBlocker, which would otherwise
+    drain the same log itself.
+
+    Log types the driver does not support (remote grids, non-Chrome) are
+    disabled after the first failed read.
+    """
+
+    LOG_TYPES = ('browser', 'performance')
+
+    def __init__(self, driver, capacity=5000, blocker=None):
+        self.driver = driver
+        self.events = deque(maxlen=capacity)
+        self.capacity = capacity
+        self.blocker = blocker
+        self.blocker_stats = {'blocked_requests': 0, 'loaded_requests': 0,
+                              'known_bytes_saved': 0, 'blocked_with_known_size': 0}
+        self.log_types = list(self.LOG_TYPES)
+        self.seen = 0
+        self._steps = []
+        self._pending = {}
+        self._summaries = {}
+
+    @property
+    def step(self):
+        return self._steps[0] if self._steps else None
+
+    # --- Instrumentation listener ---
+    def on_step_start(self, name):
+        if not self._steps:
+            self.drain()
+        self._steps.append(name)
+
+    def on_step_end(self, record):
+        if len(self._steps) == 1:
+            self.drain()
+        if self._steps:
+            self._steps.pop()
+
+    # --- collection ---
+    def drain(self):
+        for log_type in list(self.log_types):
+            try:
+                # class-level execute: log reads are not counted as the step's WebDriver commands
+                entries = type(self.driver).execute(self.driver, Command.GET_LOG, {'type': log_type})['value']
+            except Exception as e:
+                logger.debug(f"[BROWSER LOGS] '{log_type}' log not available: {e}")
+                self.log_types.remove(log_type)
+                continue
+            if log_type == 'browser':
+                for entry in entries:
+                    self._add({'kind': 'console', 'level': entry.get('level'), 'message': entry.get('message'),
+                               'timestamp': entry.get('timestamp')})
+            else:
+                self._consume_performance(entries)
+
+    def _add(self, event):
+        event.setdefault('step', self.step)
+        self.seen += 1
+        self.events.append(event)
+
+    def _consume_performance(self, entries):
+        if self.blocker is not None and entries:
+            for key, value in self.blocker.consume(entries).items():
+                self.blocker_stats[key] += value
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, TypeError, ValueError):
+                continue
+            method, params = message.get('method'), message.get('params', {})
+            request_id = params.get('requestId')
+            if method == 'Network.requestWillBeSent':
+                if len(self._pending) >= self.capacity:
+                    # never-finished requests must not grow memory without bound
+                    self._pending.pop(next(iter(self._pending)))
+                self._pending[request_id] = {'url': params.get('request', {}).get('url'),
+                                             'start': params.get('timestamp'), 'step': self.step}
+            elif method == 'Network.responseReceived' and request_id in self._pending:
+                self._pending[request_id]['status'] = params.get('response', {}).get('status')
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed') and request_id in self._pending:
+                self._finish(self._pending.pop(request_id), params, failed=method == 'Network.loadingFailed')
+
+    def _finish(self, request, params, failed):
+        start, end = request['start'], params.get('timestamp')
+        ms = round((end - start) * 1000, 1) if start is not None and end is not None else None
+        # the request belongs to the step that sent it
+        event = {'kind': 'request', 'step': request['step'], 'url': request['url'], 'status': request.get('status'),
+                 'ms': ms, 'bytes': params.get('encodedDataLength', 0)}
+        if failed:
+            event['error'] = params.get('blockedReason') or params.get('errorText')
+        self._add(event)
+
+        summary = self._summaries.setdefault(request['step'], {
+            'requests': 0, 'failed': 0, 'bytes': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'slowest_url': None})
+        summary['requests'] += 1
+        summary['failed'] += failed
+        summary['bytes'] += event['bytes'] or 0
+        if ms is not None:
+            summary['total_ms'] = round(summary['total_ms'] + ms, 1)
+            if ms > summary['max_ms']:
+                summary['max_ms'], summary['slowest_url'] = ms, request['url']
+
+    # --- reporting ---
+    def step_summaries(self):
+        """Per-step request timing: count, failures, bytes, total/max duration and the slowest URL."""
+        return {str(step): dict(summary) for step, summary in self._summaries.items()}
+
+    def console_errors(self):
+        return [e for e in self.events if e['kind'] == 'console' and e.get('level') == 'SEVERE']
+
+    def dump(self):
+        """The buffered events as gzip-compressed JSONL bytes."""
+        lines = ''.join(json.dumps(e) + '\n' for e in self.events)
+        return gzip.compress(lines.encode('utf-8'))
+
+    def stats(self):
+        return {
+            'events': len(self.events),
+            'seen': self.seen,
+            'dropped': self.seen - len(self.events),
+            'log_types': list(self.log_types),
+        }
@@ -0,0 +1,61 @@
+# python
+import csv
+import json
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = os.getenv('DATA_DIR', 'data')
+
+
+def load_cases(path):
+    """Load a table of test cases from CSV (header row) or JSON (list of objects).
+
+    Every value is returned as a string, the way it would be typed into the page.
+    """
+    if path.lower().endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            rows = json.load(f)
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+    cases = [{k: '' if v is None else str(v) for k, v in row.items()} for row in rows]
+    logger.info(f"[DATA] {len(cases)} case(s) loaded from {path}")
+    return cases
+
+
+class CaseReport:
+    """Streams per-row results to a JSONL file as they arrive, so a crash mid-table keeps what ran."""
+
+    def __init__(self, path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._file = open(path, 'w', encoding='utf-8')
+        self._start = time.perf_counter()
+        self.passed = 0
+        self.failed = []
+
+    def __call__(self, result):
+        self._file.write(json.dumps(result) + '\n')
+        self._file.flush()
+        if result['passed']:
+            self.passed += 1
+        else:
+            self.failed.append(result)
+
+    def close(self):
+        self._file.close()
+
+    def summary(self):
+        elapsed = time.perf_counter() - self._start
+        total = self.passed + len(self.failed)
+        return {
+            'cases': total,
+            'passed': self.passed,
+            'failed': len(self.failed),
+            'elapsed_s': round(elapsed, 2),
+            'cases_per_min': round(total / elapsed * 60, 1) if elapsed else None,
+            'report': self.path,
+        }
@@ -0,0 +1,130 @@
+# python
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = os.getenv('CHROMEDRIVER_INDEX', os.path.join('.driver_cache', 'chromedriver_index.json'))
+
+CHROME_BINARIES = [
+    'google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome',
+    '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+]
+
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+
+_resolved_path = None
+_resolve_lock = threading.Lock()
+
+
+def _run_version(binary):
+    try:
+        out = subprocess.run([binary, '--version'], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION_RE.search(out or '')
+    return match.group(1) if match else None
+
+
+def detect_chrome_version():
+    """Return the installed Chrome version without touching the network (None if unknown)."""
+    candidates = [os.getenv('CHROME_BINARY')] + CHROME_BINARIES
+    for binary in candidates:
+        if not binary:
+            continue
+        if not os.path.isabs(binary) and shutil.which(binary) is None:
+            continue
+        version = _run_version(binary)
+        if version:
+            return version
+    return None
+
+
+def load_index(path=INDEX_PATH):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(index, path=INDEX_PATH):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _usable(entry):
+    return bool(entry) and os.path.isfile(entry.get('driver_path', '')) and os.access(entry['driver_path'], os.X_OK)
+
+
+def _install():
+    # imported lazily so offline runs with a warm index never load webdriver-manager
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(index_path=INDEX_PATH, installer=_install):
+    """Return a chromedriver path, using the local index whenever possible.
+
+    The index maps the installed Chrome version to the chromedriver binary and its
+    version. A lookup hits the network (webdriver-manager) only when the installed
+    Chrome version is not in the index yet. If Chrome cannot be detected or the
+    install fails (e.g. air-gapped runner), the most recent usable entry is used.
+    """
+    start = time.perf_counter()
+    index = load_index(index_path)
+    chrome_version = detect_chrome_version()
+    source = 'index'
+
+    entry = index.get(chrome_version) if chrome_version else None
+    if not _usable(entry):
+        entry = None
+        if chrome_version or not index:
+            try:
+                driver_path = installer()
+                entry = {
+                    'driver_path': driver_path,
+                    'driver_version': _run_version(driver_path),
+                    'chrome_version': chrome_version,
+                    'resolved_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                }
+                index[chrome_version or 'unknown'] = entry
+                save_index(index, index_path)
+                source = 'webdriver-manager'
+            except Exception as e:
+                logger.warning(f"[DRIVER] chromedriver install failed ({e}); falling back to cached index.")
+
+    if entry is None:
+        usable = [e for e in index.values() if _usable(e)]
+        if not usable:
+            raise RuntimeError(f"No chromedriver available: install failed and {index_path} has no usable entry")
+        entry = max(usable, key=lambda e: e.get('resolved_at', ''))
+        source = 'index (fallback)'
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"[DRIVER] chromedriver {entry.get('driver_version')} for Chrome {chrome_version} "
+                f"from {source} in {elapsed * 1000:.0f} ms: {entry['driver_path']}")
+    return entry['driver_path']
+
+
+def get_chromedriver_path():
+    """Resolve once per process and reuse the result for every later driver.
+
+    Prespawner threads start drivers concurrently; the lock keeps them from each
+    running the lookup (and possibly webdriver-manager) at the same time.
+    """
+    global _resolved_path
+    if _resolved_path is None:
+        with _resolve_lock:
+            if _resolved_path is None:
+                _resolved_path = resolve_chromedriver()
+    return _resolved_path
@@ -0,0 +1,171 @@
+# python
+import functools
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StepRecord:
+    """Timing and command counters for one page-method call (or other named step)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.wall = 0.0
+        self.wait = 0.0
+        self.commands = 0
+        self.fallbacks = 0
+        self.error = None
+
+    def to_dict(self):
+        return {
+            'step': self.name,
+            'wall_s': round(self.wall, 4),
+            'wait_s': round(self.wait, 4),
+            'commands': self.commands,
+            'fallbacks': self.fallbacks,
+            'error': self.error,
+        }
+
+
+class Instrumentation:
+    """Per-test instrumentation of the page object and its driver.
+
+    Every WebDriver command is counted by wrapping driver.execute (all commands go
+    through it). Page-method calls become steps via instrument_page(); the page
+    reports time spent in explicit waits and fallback attempts through wait()
+    and fallback(). Listeners with on_step_start(name) / on_step_end(record)
+    methods are notified around each step.
+    """
+
+    def __init__(self, test_name):
+        self.test_name = test_name
+        self.steps = []
+        self.commands = 0
+        self.started = time.perf_counter()
+        self.listeners = []
+        # extra sections merged into report(), e.g. per-step network summaries
+        self.extras = {}
+        self._stack = []
+        self._driver = None
+
+    # --- driver ---
+    def attach(self, driver):
+        original = driver.execute
+
+        @functools.wraps(original)
+        def execute(driver_command, params=None):
+            self.commands += 1
+            for record in self._stack:
+                record.commands += 1
+            return original(driver_command, params)
+
+        driver.execute = execute
+        self._driver = driver
+        return driver
+
+    def detach(self):
+        # pooled drivers outlive the test; drop the instance-level wrapper
+        if self._driver is not None:
+            self._driver.__dict__.pop('execute', None)
+            self._driver = None
+
+    # --- steps ---
+    @property
+    def current_step(self):
+        return self._stack[-1].name if self._stack else None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def _notify(self, event, arg):
+        for listener in self.listeners:
+            try:
+                getattr(listener, event)(arg)
+            except Exception:
+                logger.debug(f"Instrumentation listener {listener!r} failed on {event}", exc_info=True)
+
+    @contextmanager
+    def step(self, name):
+        record = StepRecord(name)
+        self._stack.append(record)
+        self._notify('on_step_start', name)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record.error = f"{type(e).__name__}: {e}".splitlines()[0]
+            raise
+        finally:
+            record.wall = time.perf_counter() - start
+            self._stack.pop()
+            self.steps.append(record)
+            self._notify('on_step_end', record)
+
+    @contextmanager
+    def wait(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            for record in self._stack:
+                record.wait += elapsed
+
+    def fallback(self, count=1):
+        for record in self._stack:
+            record.fallbacks += count
+
+    # --- reporting ---
+    def report(self):
+        return {
+            'test': self.test_name,
+            'total_s': round(time.perf_counter() - self.started, 4),
+            'commands': self.commands,
+            'steps': [s.to_dict() for s in self.steps],
+            **self.extras,
+        }
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        return path
+
+
+def instrument_page(page, instrumentation):
+    """Wrap every public method of `page` so each call is recorded as a step."""
+    page.instrumentation = instrumentation
+    for name in dir(type(page)):
+        if name.startswith('_'):
+            continue
+        method = getattr(page, name)
+        if not callable(method):
+            continue
+
+        def make_wrapper(method, name):
+            @functools.wraps(method)
+            def wrapper(*args, **kwargs):
+                with instrumentation.step(name):
+                    return method(*args, **kwargs)
+            return wrapper
+
+        setattr(page, name, make_wrapper(method, name))
+    return page
+
+
+def slowest_steps(reports, limit=10):
+    """Aggregate step records of many test reports and return the slowest by max wall time."""
+    by_name = {}
+    for report in reports:
+        for s in report['steps']:
+            agg = by_name.setdefault(s['step'], {'step': s['step'], 'calls': 0, 'total_s': 0.0, 'max_s': 0.0,
+                                                 'wait_s': 0.0, 'commands': 0, 'fallbacks': 0})
+            agg['calls'] += 1
+            agg['total_s'] += s['wall_s']
+            agg['max_s'] = max(agg['max_s'], s['wall_s'])
+            agg['wait_s'] += s['wait_s']
+            agg['commands'] += s['commands']
+            agg['fallbacks'] += s['fallbacks']
+    return sorted(by_name.values(), key=lambda a: a['max_s'], reverse=True)[:limit]
@@ -0,0 +1,166 @@
+# python
+import json
+import logging
+import os
+import threading
+import time
+
+from artifacts import file_lock
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PATH = os.getenv('LOCATOR_MEMORY_PATH', '.locator_memory.json')
+
+
+def _key(locator):
+    key = getattr(locator, 'key', None)
+    if key is not None:
+        return key
+    by, value = locator
+    return f"{by}={value}"
+
+
+class KeyedLocator(tuple):
+    """A (by, value) locator remembered under a fixed `key` instead of its value.
+
+    For locators built from test data (e.g. a contains(text(), '<expected>') fallback):
+    one memory entry for the pattern instead of a new, soon stale, entry per data value.
+    """
+
+    def __new__(cls, by, value, key):
+        locator = super().__new__(cls, (by, value))
+        locator.key = key
+        return locator
+
+
+def _new_entry(run):
+    return {'hits': 0, 'total_ms': 0.0, 'last_run': None, 'first_run': run}
+
+
+class LocatorMemory:
+    """Persistent record of which fallback locator actually matched, per page/element.
+
+    Entries are keyed by "<page>/<element>" and then by locator. Each locator keeps
+    its hit count, total match time and the run it last matched in, so fallback
+    chains can be reordered to try the historically fastest working candidate first
+    and candidates that stopped matching can be flagged.
+
+    Parallel workers share the file: begin_run() counts a run once per RUN_ID and
+    save() merges this process' hits into the file's current contents under a lock,
+    so no worker's results overwrite another's.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, stale_after=5):
+        self.path = path
+        self.stale_after = stale_after
+        self.runs = 0
+        self.elements = {}
+        # what this process added since loading: merged into the file by save()
+        self._delta = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=DEFAULT_PATH, stale_after=5):
+        memory = cls(path, stale_after)
+        data = memory._read()
+        memory.runs = data.get('runs', 0)
+        memory.elements = data.get('elements', {})
+        return memory
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            logger.debug(f"No locator memory at {self.path}; starting fresh.")
+            return {}
+
+    def _write(self, data):
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def save(self):
+        """Merge this process' hits into the file as it is now (other workers may have saved meanwhile)."""
+        with file_lock(self.path), self._lock:
+            data = self._read()
+            elements = data.get('elements', {})
+            for name, entries in self._delta.items():
+                merged = elements.setdefault(name, {})
+                for loc, d in entries.items():
+                    e = merged.setdefault(loc, _new_entry(d['first_run']))
+                    e['hits'] += d['hits']
+                    e['total_ms'] += d['total_ms']
+                    if d['last_run'] is not None:
+                        e['last_run'] = max(e['last_run'] or 0, d['last_run'])
+            data['runs'] = max(data.get('runs', 0), self.runs)
+            data['elements'] = elements
+            self._write(data)
+            self.elements = elements
+            self._delta = {}
+
+    def begin_run(self, run_id=None):
+        """Count a new run. Workers of one parallel run pass the same run_id (RUN_ID), which is counted once."""
+        with file_lock(self.path), self._lock:
+            data = self._read()
+            self.elements = data.get('elements', self.elements)
+            if run_id is not None and data.get('run_id') == run_id:
+                self.runs = data.get('runs', 0)
+                return
+            self.runs = max(data.get('runs', 0), self.runs) + 1
+            self._write({**data, 'runs': self.runs, 'run_id': run_id, 'elements': self.elements})
+
+    def _entries(self, page, element):
+        return self.elements.setdefault(f"{page}/{element}", {})
+
+    def order(self, page, element, candidates):
+        """Return candidates with the fastest historically working locator first.
+
+        Locators that matched recently come first (by average match time), then
+        ones never seen before in their given order, then stale ones.
+        """
+        with self._lock:
+            entries = self._entries(page, element)
+            for loc in candidates:
+                if _key(loc) not in entries:
+                    entries[_key(loc)] = _new_entry(self.runs)
+                    self._delta.setdefault(f"{page}/{element}", {})[_key(loc)] = _new_entry(self.runs)
+
+            def rank(item):
+                position, loc = item
+                e = entries[_key(loc)]
+                if self._is_stale(e):
+                    return (2, 0.0, position)
+                if e['hits']:
+                    return (0, e['total_ms'] / e['hits'], position)
+                return (1, 0.0, position)
+
+            return [loc for _, loc in sorted(enumerate(candidates), key=rank)]
+
+    def record(self, page, element, locator, elapsed):
+        with self._lock:
+            key = _key(locator)
+            delta = self._delta.setdefault(f"{page}/{element}", {}).setdefault(key, _new_entry(self.runs))
+            for e in (self._entries(page, element).setdefault(key, _new_entry(self.runs)), delta):
+                e['hits'] += 1
+                e['total_ms'] += elapsed * 1000
+                e['last_run'] = self.runs
+
+    def confirm(self, page, element, locator):
+        """Mark a locator as working this run without a timed hit (it matched, but another candidate won)."""
+        with self._lock:
+            key = _key(locator)
+            delta = self._delta.setdefault(f"{page}/{element}", {}).setdefault(key, _new_entry(self.runs))
+            for e in (self._entries(page, element).setdefault(key, _new_entry(self.runs)), delta):
+                e['last_run'] = self.runs
+
+    def _is_stale(self, entry):
+        since = entry['last_run'] if entry['last_run'] is not None else entry.get('first_run', self.runs)
+        return self.runs - since >= self.stale_after
+
+    def stale_locators(self):
+        """List "<page>/<element>: <locator>" entries that have not matched in the last stale_after runs."""
+        with self._lock:
+            return [f"{name}: {loc}" for name, entries in self.elements.items()
+                    for loc, e in entries.items() if self._is_stale(e)]
@@ -0,0 +1,133 @@
+# python
+"""In-page scripts and data-driven case bookkeeping shared by pages and async_pages.
+
+Every script resolves its locators in the page (JS_FIND), so one execute_script
+replaces a find + interact round trip per element. stub_hub's playground page
+recognises the scripts by their text.
+"""
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# In-page locator resolution shared by the single-round-trip helpers.
+# Mirrors the By strategies used by the page objects' locators.
+JS_FIND = """
+function __find(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'xpath': return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'link text': return Array.from(document.links).find(function (a) { return a.innerText.trim() === value; }) || null;
+        case 'partial link text': return Array.from(document.links).find(function (a) { return a.innerText.indexOf(value) !== -1; }) || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+    }
+    return null;
+}
+"""
+
+JS_FILL_FORM = JS_FIND + """
+var fields = arguments[0], results = {};
+fields.forEach(function (f) {
+    var key = f[0], el = __find(f[1], f[2]), text = f[3];
+    if (!el) { results[key] = {found: false, ok: false, value: null}; return; }
+    if (el.tagName === 'SELECT') {
+        var opt = Array.from(el.options).find(function (o) { return o.text.trim() === text; });
+        if (!opt) { results[key] = {found: true, ok: false, value: el.value}; return; }
+        el.value = opt.value;
+    } else {
+        // use the native setter so framework-controlled inputs notice the change
+        var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+        setter.call(el, text);
+    }
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+    results[key] = {found: true, ok: true, value: el.value};
+});
+return results;
+"""
+
+JS_MATCH_TEXT = JS_FIND + """
+var locators = arguments[0], expected = arguments[1], contains = arguments[2];
+var first = null, matched = [];
+for (var i = 0; i < locators.length; i++) {
+    var el = null;
+    try { el = __find(locators[i][0], locators[i][1]); } catch (e) {}
+    if (!el) continue;
+    var text = (el.innerText || el.textContent || '').trim();
+    if (contains ? text.indexOf(expected) !== -1 : text === expected) {
+        if (!first) first = [i, text];
+        matched.push(i);
+    }
+}
+// [winner index, its text, indices of every candidate that matched]
+return first ? [first[0], first[1], matched] : null;
+"""
+
+JS_RUN_CASE = JS_FIND + """
+var inputs = arguments[0], button = arguments[1], result = arguments[2];
+var out = __find(result[0], result[1]);
+if (out) out.textContent = '';
+for (var i = 0; i < inputs.length; i++) {
+    var el = __find(inputs[i][0], inputs[i][1]);
+    if (!el) return {error: 'input not found: ' + inputs[i][1]};
+    var setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+    setter.call(el, inputs[i][2]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+var btn = __find(button[0], button[1]);
+if (!btn) return {error: 'button not found'};
+btn.click();
+out = __find(result[0], result[1]);
+return {text: out ? (out.innerText || out.textContent || '').trim() : null};
+"""
+
+JS_TEXT = JS_FIND + """
+var el = __find(arguments[0], arguments[1]);
+return el ? (el.innerText || el.textContent || '').trim() : null;
+"""
+
+JS_CLEAR = JS_FIND + """
+arguments[0].forEach(function (loc) {
+    var el = __find(loc[0], loc[1]);
+    if (!el) return;
+    if ('value' in el && el.tagName !== 'BUTTON') el.value = ''; else el.textContent = '';
+});
+"""
+
+
+def sum_expected(case):
+    return case.get("expected") or str(int(case["a"]) + int(case["b"]))
+
+
+def message_expected(case):
+    return case.get("expected") or case["message"]
+
+
+def case_fields(pairs):
+    """JS_RUN_CASE inputs from ((by, value), text) pairs."""
+    return [[by, value, str(text)] for (by, value), text in pairs]
+
+
+def case_result(row, case, expected, actual, error, start, tag=""):
+    """Per-row result of run_*_cases; failures are logged as they happen."""
+    result = {
+        "row": row,
+        "case": case,
+        "expected": expected,
+        "actual": actual,
+        "passed": error is None and actual == expected,
+        "elapsed_s": round(time.perf_counter() - start, 4),
+    }
+    if error is not None:
+        result["error"] = error
+    if not result["passed"]:
+        logger.warning(f"{tag}Case {row} failed: expected '{expected}', found '{actual}'{f' ({error})' if error else ''}")
+    return result
+
+
+def log_case_summary(results, tag=""):
+    logger.info(f"{tag}Ran {len(results)} case(s): {sum(r['passed'] for r in results)} passed")
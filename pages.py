@@ -1,13 +1,38 @@
 # python
 import logging
+import time
+from collections import namedtuple
 from datetime import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import (TimeoutException, NoSuchElementException, StaleElementReferenceException,
+                                        WebDriverException)
+
+from artifacts import artifact_path, get_writer
+from locator_memory import KeyedLocator
+from page_scripts import (JS_CLEAR, JS_FILL_FORM, JS_MATCH_TEXT, JS_RUN_CASE, JS_TEXT, case_fields, case_result,
+                          log_case_summary, message_expected, sum_expected)
+from snapshots import save_snapshot
+from waits import BudgetExceeded, WaitEngine
 
 logger = logging.getLogger(__name__)
 
+FILL_MODES = ("keystroke", "batched")
+NAVIGATION_MODES = ("click", "direct")
+
+DEFAULT_PLAYGROUND_URL = "https://www.lambdatest.com/selenium-playground"
+
+# Result of a text wait: matched text, the locator that matched and seconds waited.
+TextMatch = namedtuple("TextMatch", ["text", "locator", "elapsed"])
+
+
+def text_fallback(text):
+    """Last-resort locator: any element containing `text`. It carries test data, so the
+    locator memory keeps it under one placeholder key instead of an entry per value."""
+    return KeyedLocator(By.XPATH, f"//*[contains(text(), '{text}')]", key="xpath=//*[contains(text(), '{expected}')]")
+
+
 class SeleniumPlaygroundPage:
     # --- Locators ---
     # Top-level links
@@ -43,59 +68,279 @@ class SeleniumPlaygroundPage:
     SINGLE_CHECKBOX = (By.ID, "isAgeSelected")
     SINGLE_CHECKBOX_SUCCESS_MESSAGE = (By.ID, "txtAge")
 
+    # data keys accepted by fill_form, in page order
+    FORM_FIELDS = [
+        ("name", NAME_FIELD),
+        ("email", EMAIL_FIELD),
+        ("password", PASSWORD_FIELD),
+        ("company", COMPANY_FIELD),
+        ("website", WEBSITE_FIELD),
+        ("country", COUNTRY_DROPDOWN),
+        ("city", CITY_FIELD),
+        ("address1", ADDRESS_1_FIELD),
+        ("address2", ADDRESS_2_FIELD),
+        ("state", STATE_FIELD),
+        ("zipcode", ZIPCODE_FIELD),
+    ]
+
     # Buttons
     SUBMIT_BUTTON = (By.XPATH, '//*[@id="seleniumform"]/div[6]/button')
 
     # Messages
     SUCCESS_MESSAGE = (By.CSS_SELECTOR, ".success-msg p")
 
-    def __init__(self, driver, timeout=20):
+    # Deep links (relative to base_url) used by navigation="direct"
+    SIMPLE_FORM_DEMO_PATH = "simple-form-demo"
+    CHECKBOX_DEMO_PATH = "checkbox-demo"
+    INPUT_FORM_SUBMIT_PATH = "input-form-demo"
+
+    def __init__(self, driver, timeout=20, fill_mode="keystroke", locator_memory=None,
+                 base_url=DEFAULT_PLAYGROUND_URL, navigation="click"):
+        if fill_mode not in FILL_MODES:
+            raise ValueError(f"Unknown fill_mode '{fill_mode}', expected one of {FILL_MODES}")
+        if navigation not in NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation '{navigation}', expected one of {NAVIGATION_MODES}")
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        # all waiting goes through the wait engine (polling with backoff, DOM-mutation wake-ups)
+        self.waits = WaitEngine.from_env(driver, timeout)
+        self.fill_mode = fill_mode
+        self.base_url = base_url.rstrip("/")
+        # "click" goes through the landing page links; "direct" deep-links to each demo page
+        self.navigation = navigation
+        # optional LocatorMemory used to reorder fallback chains by past success
+        self.locator_memory = locator_memory
+        # optional Instrumentation (see instrumentation.instrument_page)
+        self.instrumentation = None
+        # optional artifacts.CaptureRing: failure screenshots stay in memory unless the test fails
+        self.capture_ring = None
+        # optional callable run once the first page is loaded (e.g. the test's start screenshot):
+        # the landing page in click mode, the first deep link in direct mode, where nothing loads before it
+        self.on_first_page = None
+        # resolved WebElements by locator for the current page visit (see _element)
+        self._elements = {}
+        # commands_saved: findElement calls skipped by hits, minus the re-checks and actions that found stale handles
+        self.element_cache = {"hits": 0, "misses": 0, "stale": 0, "invalidations": 0, "commands_saved": 0}
 
     # --- Internal helpers ---
+    def _until(self, condition, timeout=None):
+        """Single entry point for waits (see waits.WaitEngine), so wait time can be measured."""
+        if self.instrumentation is None:
+            return self.waits.until(condition, timeout)
+        with self.instrumentation.wait():
+            return self.waits.until(condition, timeout, name=self.instrumentation.current_step)
+
+    def _get(self, url):
+        """Page loads go through the wait engine too, so they count against the test budget."""
+        name = self.instrumentation.current_step if self.instrumentation is not None else None
+        self.waits.navigate(url, name=name)
+
+    def _note_fallback(self):
+        if self.instrumentation is not None:
+            self.instrumentation.fallback()
+
     def _js_click(self, element):
+        self._note_fallback()
         try:
             self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
             self.driver.execute_script("arguments[0].click();", element)
         except WebDriverException:
             element.click()
 
-    def _wait_for_element_text(self, locator, expected_text, timeout=None, contains=False):
-        wait = self.wait if timeout is None else WebDriverWait(self.driver, timeout)
-        def _predicate(driver):
+    # --- Element handle cache ---
+    def _invalidate_elements(self):
+        """Forget cached elements; called whenever the page object navigates."""
+        if self._elements:
+            self._elements.clear()
+            self.element_cache["invalidations"] += 1
+
+    def _stale(self):
+        """A cached element went stale: the document was replaced (a reload or a navigation the
+        page object did not do, even to the same URL), so every other cached element is stale too.
+        Dropping them all at once costs one lookup each instead of a failed check first."""
+        self.element_cache["stale"] += 1
+        logger.debug(f"Stale cached element; dropping {len(self._elements)} cached element(s)")
+        self._invalidate_elements()
+
+    def _element(self, locator, condition=EC.visibility_of_element_located, timeout=None):
+        """Resolve `locator` once per page visit.
+
+        A cached element is re-checked against the condition (displayed, and enabled for
+        element_to_be_clickable; no check for presence_of_element_located) instead of
+        being looked up again: the same checks the wait would run, minus its findElement
+        call, so a hit saves exactly one command. Stale or no longer ready elements fall
+        back to a normal wait on the locator, and the failed checks count against
+        commands_saved. Navigation the page object does not know about shows up as
+        staleness and clears the whole cache (see _stale).
+        """
+        el = self._elements.get(locator)
+        if el is not None:
+            checks = 0
+            try:
+                ready = True
+                if condition is not EC.presence_of_element_located:
+                    checks += 1
+                    ready = el.is_displayed()
+                    if ready and condition is EC.element_to_be_clickable:
+                        checks += 1
+                        ready = el.is_enabled()
+                if ready:
+                    self.element_cache["hits"] += 1
+                    self.element_cache["commands_saved"] += 1
+                    return el
+                del self._elements[locator]
+            except StaleElementReferenceException:
+                self._stale()
+            self.element_cache["commands_saved"] -= checks
+        self.element_cache["misses"] += 1
+        el = self._until(condition(locator), timeout)
+        self._elements[locator] = el
+        return el
+
+    def _act(self, locator, action, condition=EC.visibility_of_element_located):
+        """Run action(element) on the cached element, re-resolving once if it went stale."""
+        try:
+            return action(self._element(locator, condition))
+        except StaleElementReferenceException:
+            # the action itself was the wasted command
+            self.element_cache["commands_saved"] -= 1
+            self._stale()
+            return action(self._element(locator, condition))
+
+    def _click(self, element):
+        try:
+            element.click()
+        except StaleElementReferenceException:
+            raise
+        except Exception:
+            self._js_click(element)
+
+    def _ordered(self, memory_key, locators):
+        if self.locator_memory is None or memory_key is None:
+            return list(locators)
+        return self.locator_memory.order(*memory_key, locators)
+
+    def _remember(self, memory_key, locator, elapsed):
+        if self.locator_memory is not None and memory_key is not None:
+            self.locator_memory.record(*memory_key, locator, elapsed)
+
+    def _wait_for_first_clickable(self, memory_key, locators):
+        """Try each candidate in turn (historically best first) and return the first clickable element."""
+        candidates = self._ordered(memory_key, locators)
+        for i, loc in enumerate(candidates):
+            start = time.perf_counter()
             try:
-                el = driver.find_element(*locator)
-                text = el.get_attribute("innerText") or el.text or ""
-                text = text.strip()
-                if contains:
-                    return text if expected_text in text else False
-                return text if text == expected_text else False
+                el = self._until(EC.element_to_be_clickable(loc))
+            except BudgetExceeded:
+                raise
             except Exception:
+                if i == len(candidates) - 1:
+                    raise
+                logger.info(f"Locator {loc} not clickable, trying next candidate.")
+                self._note_fallback()
+                continue
+            self._remember(memory_key, loc, time.perf_counter() - start)
+            return el
+
+    def _wait_for_any_element_text(self, locators, expected_text, timeout=None, contains=False, memory_key=None):
+        """Wait until any of `locators` shows the expected text.
+
+        All candidates are checked together in one in-page script per poll, so a
+        broken primary locator no longer costs its own timeout before the
+        alternates are tried. Earlier locators win ties. Returns a TextMatch with
+        the matched text, the winning locator and the time the wait took.
+        With a memory_key and a LocatorMemory, candidates are reordered by past
+        success and the winner is recorded; the other candidates that matched in
+        the same poll are confirmed as working, so losing a tie never makes a
+        locator look stale.
+        """
+        locators = self._ordered(memory_key, locators)
+        candidates = [[by, value] for by, value in locators]
+
+        def _predicate(driver):
+            try:
+                return driver.execute_script(JS_MATCH_TEXT, candidates, expected_text, contains) or False
+            except WebDriverException:
                 return False
-        return wait.until(_predicate)
+
+        start = time.perf_counter()
+        index, text, matched = self._until(_predicate, timeout)
+        match = TextMatch(text, tuple(locators[index]), time.perf_counter() - start)
+        if index > 0:
+            self._note_fallback()
+        logger.info(f"Text '{expected_text}' matched via {match.locator} after {match.elapsed:.2f}s")
+        # the original candidate: a KeyedLocator is remembered under its placeholder key
+        self._remember(memory_key, locators[index], match.elapsed)
+        if self.locator_memory is not None and memory_key is not None:
+            for i in matched:
+                if i != index:
+                    self.locator_memory.confirm(*memory_key, locators[i])
+        return match
+
+    def _wait_for_element_text(self, locator, expected_text, timeout=None, contains=False):
+        return self._wait_for_any_element_text([locator], expected_text, timeout=timeout, contains=contains).text
 
     def _safe_save_screenshot(self, name):
         try:
-            self.driver.save_screenshot(name)
+            png = self.driver.get_screenshot_as_png()
+            if self.capture_ring is not None:
+                self.capture_ring.capture(name.rsplit(".", 1)[0], png=png)
+                return
+            get_writer().submit(artifact_path("screenshots", name), png)
         except Exception:
             logger.exception("Failed to save screenshot %s", name)
 
     # --- Navigation Methods ---
+    def open(self, url):
+        """Load `url` (e.g. reload the current demo page to start over); cached elements are dropped."""
+        self._invalidate_elements()
+        self._get(url)
+
+    def open_playground(self):
+        """Load the playground landing page (skipped with navigation="direct", where each
+        go_to_* method opens its target page itself)."""
+        if self.navigation == "direct":
+            logger.info("Direct navigation: skipping the landing page.")
+            return
+        self._invalidate_elements()
+        self._get(self.base_url)
+        self._first_page_ready()
+
+    def _first_page_ready(self):
+        hook, self.on_first_page = self.on_first_page, None
+        if hook is not None:
+            hook()
+
+    def _deep_link(self, path, ready_locator, failure_name):
+        url = f"{self.base_url}/{path}"
+        logger.info(f"Opening {url} directly")
+        start = time.perf_counter()
+        try:
+            self._invalidate_elements()
+            self._get(url)
+            # with an eager/none page load strategy this is what actually gates readiness
+            self._until(EC.element_to_be_clickable(ready_locator), timeout=30)
+        except TimeoutException:
+            logger.exception(f"Failed to open {url}")
+            self._safe_save_screenshot(failure_name)
+            raise
+        logger.info(f"Navigation validated: {self.driver.current_url} interactive after {time.perf_counter() - start:.2f}s")
+        self._first_page_ready()
+
     def go_to_input_form_submit(self):
+        if self.navigation == "direct":
+            return self._deep_link(self.INPUT_FORM_SUBMIT_PATH, self.NAME_FIELD, "go_to_input_form_submit_failure.png")
         logger.info("Clicking on 'Input Form Submit'")
         try:
-            try:
-                el = self.wait.until(EC.element_to_be_clickable(self.INPUT_FORM_SUBMIT_LINK))
-            except Exception:
-                el = self.wait.until(EC.element_to_be_clickable(
-                    (By.XPATH, "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'input form submit')]")
-                ))
+            el = self._wait_for_first_clickable(("input_form_submit", "link"), [
+                self.INPUT_FORM_SUBMIT_LINK,
+                (By.XPATH, "//a[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'input form submit')]"),
+            ])
 
             try:
                 el.click()
             except Exception:
                 self._js_click(el)
+            self._invalidate_elements()
 
             # Switch to new window/tab if opened
             if len(self.driver.window_handles) > 1:
@@ -106,167 +351,245 @@ class SeleniumPlaygroundPage:
                         break
 
             # Wait until either the URL contains the expected path OR the NAME_FIELD is visible
-            WebDriverWait(self.driver, 30).until(
+            self._until(
                 lambda d: ("/input-form-submit" in d.current_url)
-                or (len(d.find_elements(*self.NAME_FIELD)) > 0 and d.find_element(*self.NAME_FIELD).is_displayed())
+                or any(e.is_displayed() for e in d.find_elements(*self.NAME_FIELD)),
+                timeout=30,
             )
 
             logger.info(f"Navigation validated: {self.driver.current_url}")
         except TimeoutException:
             logger.exception("Failed to navigate to Input Form Submit")
+            if self.capture_ring is not None:
+                self.capture_ring.capture("go_to_input_form_submit_failure")
+                raise
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
             try:
-                self.driver.save_screenshot(f"screenshots/go_to_input_form_submit_failure_{ts}.png")
+                png = self.driver.get_screenshot_as_png()
+                get_writer().submit(artifact_path("screenshots", f"go_to_input_form_submit_failure_{ts}.png"), png)
             except Exception:
                 logger.debug("Screenshot save failed.")
             try:
-                with open(f"screenshots/go_to_input_form_submit_failure_{ts}.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
+                save_snapshot(self.driver, "screenshots", f"go_to_input_form_submit_failure_{ts}")
             except Exception:
-                logger.debug("Saving page source failed.")
+                logger.debug("Saving page snapshot failed.")
             raise
 
     def go_to_simple_form_demo(self):
+        if self.navigation == "direct":
+            return self._deep_link(self.SIMPLE_FORM_DEMO_PATH, self.SINGLE_INPUT_FIELD, "go_to_simple_form_demo_failure.png")
         logger.info("Clicking on Simple Form Demo")
         try:
-            el = self.wait.until(EC.element_to_be_clickable(self.SIMPLE_FORM_DEMO_LINK))
+            el = self._until(EC.element_to_be_clickable(self.SIMPLE_FORM_DEMO_LINK))
             try:
                 el.click()
             except Exception:
                 self._js_click(el)
+            self._invalidate_elements()
 
-            WebDriverWait(self.driver, 30).until(EC.url_contains("/simple-form-demo"))
+            self._until(EC.url_contains("/simple-form-demo"), timeout=30)
             logger.info(f"URL validated: {self.driver.current_url}")
         except TimeoutException:
             logger.exception("Failed to navigate to Simple Form Demo")
-            self._safe_save_screenshot("screenshots/go_to_simple_form_demo_failure.png")
+            self._safe_save_screenshot("go_to_simple_form_demo_failure.png")
             raise
 
     def go_to_checkbox_demo(self):
+        if self.navigation == "direct":
+            return self._deep_link(self.CHECKBOX_DEMO_PATH, self.SINGLE_CHECKBOX, "go_to_checkbox_demo_failure.png")
         logger.info("Clicking on Checkbox Demo")
         try:
-            el = self.wait.until(EC.element_to_be_clickable(self.CHECKBOX_DEMO_LINK))
+            el = self._until(EC.element_to_be_clickable(self.CHECKBOX_DEMO_LINK))
             try:
                 el.click()
             except Exception:
                 self._js_click(el)
+            self._invalidate_elements()
 
-            self.wait.until(EC.url_contains("/checkbox-demo"))
-            self.wait.until(EC.visibility_of_element_located(self.SINGLE_CHECKBOX))
+            self._until(EC.url_contains("/checkbox-demo"))
+            self._element(self.SINGLE_CHECKBOX)
             logger.info(f"URL and Checkbox Demo page validated: {self.driver.current_url}")
         except TimeoutException:
             logger.exception("Failed to navigate to Checkbox Demo")
-            self._safe_save_screenshot("screenshots/go_to_checkbox_demo_failure.png")
+            self._safe_save_screenshot("go_to_checkbox_demo_failure.png")
             raise
 
     # --- Interaction Methods (Form Submit) ---
-    def fill_form(self, data):
+    def fill_form(self, data, mode=None):
+        """Fill the input form from `data` (keys as in FORM_FIELDS).
+
+        mode="keystroke" (default) types into each field like a user, one WebDriver
+        command per lookup/keystroke batch. mode="batched" resolves and sets every
+        field in a single script execution, firing input/change events, and returns
+        a {field: {"found", "ok", "value"}} map.
+        """
+        mode = mode or self.fill_mode
+        if mode == "batched":
+            return self._fill_form_batched(data)
+        self._fill_form_keystroke(data)
+
+    def _fill_form_batched(self, data):
+        logger.info("Filling the input form with provided data (batched).")
+        self._element(self.NAME_FIELD)
+        fields = [[key, by, value, str(data[key])] for key, (by, value) in self.FORM_FIELDS
+                  if data.get(key) not in (None, "")]
+        results = self.driver.execute_script(JS_FILL_FORM, fields)
+        failed = [key for key, res in results.items() if not res.get("ok")]
+        if failed:
+            logger.warning(f"Batched fill could not set field(s): {failed}")
+        return results
+
+    def _fill_form_keystroke(self, data):
         logger.info("Filling the input form with provided data.")
-        self.wait.until(EC.visibility_of_element_located(self.NAME_FIELD)).send_keys(data.get("name", ""))
-        self.driver.find_element(*self.EMAIL_FIELD).send_keys(data.get("email", ""))
-        self.driver.find_element(*self.PASSWORD_FIELD).send_keys(data.get("password", ""))
-        self.driver.find_element(*self.COMPANY_FIELD).send_keys(data.get("company", ""))
-        self.driver.find_element(*self.WEBSITE_FIELD).send_keys(data.get("website", ""))
+        self._act(self.NAME_FIELD, lambda el: el.send_keys(data.get("name", "")))
+        self._type(self.EMAIL_FIELD, data.get("email", ""))
+        self._type(self.PASSWORD_FIELD, data.get("password", ""))
+        self._type(self.COMPANY_FIELD, data.get("company", ""))
+        self._type(self.WEBSITE_FIELD, data.get("website", ""))
 
         try:
-            country_dropdown = Select(self.driver.find_element(*self.COUNTRY_DROPDOWN))
             if data.get("country"):
-                country_dropdown.select_by_visible_text(data.get("country"))
+                self._act(self.COUNTRY_DROPDOWN, lambda el: Select(el).select_by_visible_text(data.get("country")),
+                          EC.presence_of_element_located)
         except Exception:
             logger.debug("Country selection failed or not present; continuing.")
 
-        self.driver.find_element(*self.CITY_FIELD).send_keys(data.get("city", ""))
-        self.driver.find_element(*self.ADDRESS_1_FIELD).send_keys(data.get("address1", ""))
-        self.driver.find_element(*self.ADDRESS_2_FIELD).send_keys(data.get("address2", ""))
-        self.driver.find_element(*self.STATE_FIELD).send_keys(data.get("state", ""))
-        self.driver.find_element(*self.ZIPCODE_FIELD).send_keys(data.get("zipcode", ""))
+        self._type(self.CITY_FIELD, data.get("city", ""))
+        self._type(self.ADDRESS_1_FIELD, data.get("address1", ""))
+        self._type(self.ADDRESS_2_FIELD, data.get("address2", ""))
+        self._type(self.STATE_FIELD, data.get("state", ""))
+        self._type(self.ZIPCODE_FIELD, data.get("zipcode", ""))
+
+    def _type(self, locator, text):
+        # the form is already known to be rendered: presence is enough, as with find_element before
+        self._act(locator, lambda el: el.send_keys(text), EC.presence_of_element_located)
 
     def click_submit_button(self):
         logger.info("Clicking the 'Submit' button.")
         try:
-            btn = self.wait.until(EC.element_to_be_clickable(self.SUBMIT_BUTTON))
-            try:
-                btn.click()
-            except Exception:
-                self._js_click(btn)
+            self._act(self.SUBMIT_BUTTON, self._click, EC.element_to_be_clickable)
         except TimeoutException:
             logger.exception("Submit button not clickable")
-            self._safe_save_screenshot("screenshots/click_submit_button_failure.png")
+            self._safe_save_screenshot("click_submit_button_failure.png")
             raise
 
     # --- Interaction Methods (Simple Form Demo) ---
     def enter_message(self, message):
         logger.info(f"Entering message: '{message}' into Single Input Field.")
         try:
-            el = self.wait.until(EC.visibility_of_element_located(self.SINGLE_INPUT_FIELD))
-            el.clear()
-            el.send_keys(message)
+            self._act(self.SINGLE_INPUT_FIELD, lambda el: (el.clear(), el.send_keys(message)))
         except TimeoutException:
             logger.exception("Single input field not visible")
-            self._safe_save_screenshot("screenshots/enter_message_failure.png")
+            self._safe_save_screenshot("enter_message_failure.png")
             raise
 
     def click_get_checked_value(self):
         logger.info("Clicking 'Get Checked Value' button.")
         try:
-            btn = self.wait.until(EC.element_to_be_clickable(self.GET_CHECKED_VALUE_BUTTON))
-            try:
-                btn.click()
-            except Exception:
-                self._js_click(btn)
+            self._act(self.GET_CHECKED_VALUE_BUTTON, self._click, EC.element_to_be_clickable)
         except TimeoutException:
             logger.exception("Get Checked Value button not clickable")
-            self._safe_save_screenshot("screenshots/click_get_checked_value_failure.png")
+            self._safe_save_screenshot("click_get_checked_value_failure.png")
             raise
 
     # --- Two Input Fields (enter & click) ---
     def enter_values_for_sum(self, a, b):
         logger.info("Entering values for sum: %s, %s", a, b)
         try:
-            f1 = self.wait.until(EC.visibility_of_element_located(self.FIRST_INPUT_FIELD))
-            f2 = self.wait.until(EC.visibility_of_element_located(self.SECOND_INPUT_FIELD))
-            f1.clear()
-            f1.send_keys(str(a))
-            f2.clear()
-            f2.send_keys(str(b))
+            self._act(self.FIRST_INPUT_FIELD, lambda el: (el.clear(), el.send_keys(str(a))))
+            self._act(self.SECOND_INPUT_FIELD, lambda el: (el.clear(), el.send_keys(str(b))))
         except TimeoutException:
             logger.exception("Sum input fields not visible")
-            self._safe_save_screenshot("screenshots/enter_values_for_sum_failure.png")
+            self._safe_save_screenshot("enter_values_for_sum_failure.png")
             raise
 
     def click_get_values_button(self):
         logger.info("Clicking Get Values (sum) button.")
         try:
-            btn = self.wait.until(EC.element_to_be_clickable(self.GET_VALUES_BUTTON))
-            try:
-                btn.click()
-            except Exception:
-                self._js_click(btn)
+            self._act(self.GET_VALUES_BUTTON, self._click, EC.element_to_be_clickable)
         except TimeoutException:
             logger.exception("Get values button not clickable")
-            self._safe_save_screenshot("screenshots/click_get_values_button_failure.png")
+            self._safe_save_screenshot("click_get_values_button_failure.png")
             raise
 
+    # --- Data-driven mode (many cases inside one loaded page) ---
+    def run_sum_cases(self, cases, on_result=None, timeout=5):
+        """Run Two Input Fields cases ({'a', 'b', 'expected'}) on the already open Simple Form Demo page.
+
+        Fields and the result are cleared before every row and the result must match
+        exactly, so a stale value from the previous row can never pass. Returns the list
+        of per-row results; on_result(result) is called as each row finishes.
+        """
+        return self._run_cases(
+            cases, on_result, timeout,
+            inputs=lambda c: [(self.FIRST_INPUT_FIELD, c["a"]), (self.SECOND_INPUT_FIELD, c["b"])],
+            expected=sum_expected,
+            button=self.GET_VALUES_BUTTON,
+            result_locators=[self.SUM_DISPLAYED_LOCATOR, (By.ID, "displayvalue"), (By.CSS_SELECTOR, ".sum-result")],
+            memory_key=("simple_form_demo", "sum"),
+            keystroke=lambda c: (self.enter_values_for_sum(c["a"], c["b"]), self.click_get_values_button()),
+        )
+
+    def run_message_cases(self, cases, on_result=None, timeout=5):
+        """Run Single Input Field cases ({'message', optional 'expected'}); see run_sum_cases."""
+        return self._run_cases(
+            cases, on_result, timeout,
+            inputs=lambda c: [(self.SINGLE_INPUT_FIELD, c["message"])],
+            expected=message_expected,
+            button=self.GET_CHECKED_VALUE_BUTTON,
+            result_locators=[self.MESSAGE_DISPLAYED_LOCATOR, (By.ID, "display"), (By.ID, "message")],
+            memory_key=("simple_form_demo", "message"),
+            keystroke=lambda c: (self.enter_message(c["message"]), self.click_get_checked_value()),
+        )
+
+    def _run_cases(self, cases, on_result, timeout, inputs, expected, button, result_locators, memory_key, keystroke):
+        # no text-based XPath fallback here: it would match the previous row's output or unrelated page text
+        result_locators = self._ordered(memory_key, result_locators)
+        results = []
+        for row, case in enumerate(cases):
+            want = expected(case)
+            start = time.perf_counter()
+            actual, error = None, None
+            try:
+                if self.fill_mode == "batched":
+                    # one round trip: clear the result, set the inputs, click and read the result back
+                    fields = case_fields(inputs(case))
+                    outcome = self.driver.execute_script(JS_RUN_CASE, fields, list(button), list(result_locators[0])) or {}
+                    error, actual = outcome.get("error"), outcome.get("text")
+                else:
+                    self.driver.execute_script(JS_CLEAR, [list(loc) for loc in result_locators])
+                    keystroke(case)
+                if error is None and actual != want:
+                    # slow or asynchronous pages: fall back to polling for the expected text
+                    try:
+                        actual = self._wait_for_any_element_text(result_locators, want, timeout=timeout).text
+                    except TimeoutException:
+                        actual = self.driver.execute_script(JS_TEXT, *result_locators[0])
+            except WebDriverException as e:
+                error = str(e).splitlines()[0]
+            result = case_result(row, case, want, actual, error, start)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+        log_case_summary(results)
+        return results
+
     # --- Interaction Methods (Checkbox Demo) ---
     def click_single_checkbox(self):
         logger.info("Clicking single checkbox.")
         try:
-            cb = self.wait.until(EC.element_to_be_clickable(self.SINGLE_CHECKBOX))
-            try:
-                cb.click()
-            except Exception:
-                self._js_click(cb)
+            self._act(self.SINGLE_CHECKBOX, self._click, EC.element_to_be_clickable)
         except TimeoutException:
             logger.exception("Single checkbox not clickable")
-            self._safe_save_screenshot("screenshots/click_single_checkbox_failure.png")
+            self._safe_save_screenshot("click_single_checkbox_failure.png")
             raise
 
     # --- Validation Methods ---
     def get_html5_validation_message(self, locator):
         """Retrieves the HTML5 validation message from an input element via JavaScript."""
         try:
-            element = self.driver.find_element(*locator)
-            return self.driver.execute_script("return arguments[0].validationMessage;", element)
+            return self._act(locator, lambda el: self.driver.execute_script("return arguments[0].validationMessage;", el),
+                             EC.presence_of_element_located)
         except Exception:
             logger.exception("Failed to get HTML5 validation message")
             return ""
@@ -274,97 +597,82 @@ class SeleniumPlaygroundPage:
     def validate_message_displayed(self, expected_message):
         logger.info(f"Validating message displayed: '{expected_message}'")
         try:
+            locators = [
+                self.MESSAGE_DISPLAYED_LOCATOR,
+                (By.ID, "display"),
+                (By.ID, "message"),
+                (By.CSS_SELECTOR, ".message"),
+                text_fallback(expected_message),
+            ]
             try:
-                displayed_text = self._wait_for_element_text(self.MESSAGE_DISPLAYED_LOCATOR, expected_message, timeout=20, contains=True)
+                displayed_text = self._wait_for_any_element_text(
+                    locators, expected_message, timeout=20, contains=True, memory_key=("simple_form_demo", "message")).text
             except TimeoutException:
-                alt_locators = [
-                    (By.ID, "display"),
-                    (By.ID, "message"),
-                    (By.CSS_SELECTOR, ".message"),
-                    (By.XPATH, f"//*[contains(text(), '{expected_message}')]")
-                ]
                 displayed_text = None
-                for loc in alt_locators:
-                    try:
-                        displayed_text = self._wait_for_element_text(loc, expected_message, timeout=8, contains=True)
-                        if displayed_text:
-                            break
-                    except TimeoutException:
-                        continue
 
             if not displayed_text:
                 logger.error("Expected message not found on page")
-                self._safe_save_screenshot("screenshots/validate_message_displayed_failure.png")
+                self._safe_save_screenshot("validate_message_displayed_failure.png")
                 raise AssertionError(f"Expected message not displayed: {expected_message}")
 
             assert expected_message in displayed_text, f"Message validation failed. Expected to contain: '{expected_message}', Found: '{displayed_text}'"
             logger.info(f"Message validated successfully: '{displayed_text}'")
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"Validation failed for message '{expected_message}'. Error: {e}")
-            self._safe_save_screenshot("screenshots/validate_message_displayed_exception.png")
+            self._safe_save_screenshot("validate_message_displayed_exception.png")
             raise
 
     def validate_submission_success(self, expected_message):
         logger.info(f"Validating success message: '{expected_message}'")
         try:
+            locators = [
+                self.SUCCESS_MESSAGE,
+                (By.CSS_SELECTOR, ".alert-success"),
+                text_fallback(expected_message),
+            ]
             try:
-                displayed_text = self._wait_for_element_text(self.SUCCESS_MESSAGE, expected_message, timeout=20, contains=True)
+                displayed_text = self._wait_for_any_element_text(
+                    locators, expected_message, timeout=20, contains=True, memory_key=("input_form_submit", "success_message")).text
             except TimeoutException:
-                alt_locators = [
-                    (By.CSS_SELECTOR, ".alert-success"),
-                    (By.XPATH, f"//*[contains(text(), '{expected_message}')]")
-                ]
                 displayed_text = None
-                for loc in alt_locators:
-                    try:
-                        displayed_text = self._wait_for_element_text(loc, expected_message, timeout=8, contains=True)
-                        if displayed_text:
-                            break
-                    except TimeoutException:
-                        continue
 
             if not displayed_text:
                 logger.error("Expected success message not found on page")
-                self._safe_save_screenshot("screenshots/validate_submission_success_failure.png")
+                self._safe_save_screenshot("validate_submission_success_failure.png")
                 raise AssertionError(f"Success message not displayed: {expected_message}")
 
             assert expected_message in displayed_text, f"Success message validation failed. Expected: '{expected_message}', Found: '{displayed_text}'"
             logger.info(f"Success message validated successfully: '{displayed_text}'")
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"Validation failed for success message. Error: {e}")
-            self._safe_save_screenshot("screenshots/validate_submission_success_exception.png")
+            self._safe_save_screenshot("validate_submission_success_exception.png")
             raise
 
     def validate_sum_displayed(self, expected_sum):
         logger.info(f"Validating sum displayed: '{expected_sum}'")
         try:
+            locators = [
+                self.SUM_DISPLAYED_LOCATOR,
+                (By.ID, "displayvalue"),
+                (By.CSS_SELECTOR, ".sum-result"),
+                text_fallback(expected_sum),
+            ]
             try:
-                displayed_text = self._wait_for_element_text(self.SUM_DISPLAYED_LOCATOR, expected_sum, timeout=15, contains=True)
+                displayed_text = self._wait_for_any_element_text(
+                    locators, expected_sum, timeout=15, contains=True, memory_key=("simple_form_demo", "sum")).text
             except TimeoutException:
-                alt_locators = [
-                    (By.ID, "displayvalue"),
-                    (By.CSS_SELECTOR, ".sum-result"),
-                    (By.XPATH, f"//*[contains(text(), '{expected_sum}')]")
-                ]
                 displayed_text = None
-                for loc in alt_locators:
-                    try:
-                        displayed_text = self._wait_for_element_text(loc, expected_sum, timeout=6, contains=True)
-                        if displayed_text:
-                            break
-                    except TimeoutException:
-                        continue
 
             if not displayed_text:
                 logger.error("Expected sum not found on page")
-                self._safe_save_screenshot("screenshots/validate_sum_displayed_failure.png")
+                self._safe_save_screenshot("validate_sum_displayed_failure.png")
                 raise AssertionError(f"Sum not displayed: {expected_sum}")
 
             assert expected_sum in displayed_text, f"Sum validation failed. Expected: '{expected_sum}', Found: '{displayed_text}'"
             logger.info(f"Sum validated successfully: '{displayed_text}'")
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"Validation failed for sum '{expected_sum}'. Error: {e}")
-            self._safe_save_screenshot("screenshots/validate_sum_displayed_exception.png")
+            self._safe_save_screenshot("validate_sum_displayed_exception.png")
             raise
 
     def validate_single_checkbox_success_message(self):
@@ -374,11 +682,11 @@ class SeleniumPlaygroundPage:
             displayed_text = self._wait_for_element_text(self.SINGLE_CHECKBOX_SUCCESS_MESSAGE, expected_message, timeout=12, contains=True)
             if not displayed_text:
                 logger.error("Expected checkbox message not found on page")
-                self._safe_save_screenshot("screenshots/validate_single_checkbox_failure.png")
+                self._safe_save_screenshot("validate_single_checkbox_failure.png")
                 raise AssertionError(f"Checkbox success message not displayed: {expected_message}")
             assert expected_message in displayed_text, f"Checkbox success message validation failed. Expected: '{expected_message}', Found: '{displayed_text}'"
             logger.info(f"Single checkbox success message validated successfully: '{displayed_text}'")
         except (TimeoutException, NoSuchElementException) as e:
             logger.error(f"Validation failed for checkbox success message. Error: {e}")
-            self._safe_save_screenshot("screenshots/validate_single_checkbox_exception.png")
+            self._safe_save_screenshot("validate_single_checkbox_exception.png")
             raise
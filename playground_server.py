@@ -0,0 +1,206 @@
+# python
+"""Offline stand-in for the LambdaTest Selenium Playground pages used by the scenarios.
+
+Serves the landing page, Simple Form Demo, Checkbox Demo and Input Form Submit with
+the same IDs, link texts and messages that pages.py targets, so scenarios can run
+(and be benchmarked) without network access. Every response can be delayed by a
+fixed latency plus random jitter to model a remote site reproducibly.
+
+Usage:
+    python playground_server.py --port 8000 --latency-ms 80 --jitter-ms 20
+    PLAYGROUND_URL=http://127.0.0.1:8000/selenium-playground pytest test_scenarios.py
+"""
+import argparse
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+BASE_PATH = "/selenium-playground"
+
+_LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title} | Selenium Playground</title>
+<style>
+  body {{ font-family: sans-serif; margin: 2rem; }}
+  .hidden {{ display: none; }}
+  #seleniumform div {{ margin-bottom: .5rem; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+LANDING = """
+<ul>
+  <li><a href="{base}/simple-form-demo">Simple Form Demo</a></li>
+  <li><a href="{base}/checkbox-demo">Checkbox Demo</a></li>
+  <li><a href="{base}/input-form-demo">Input Form Submit</a></li>
+</ul>
+"""
+
+SIMPLE_FORM = """
+<section>
+  <h2>Single Input Field</h2>
+  <input type="text" id="user-message" placeholder="Please enter your Message">
+  <button type="button" id="showInput">Get Checked Value</button>
+  <div id="user-message-div"><label>Your Message:</label> <p id="message-one"></p></div>
+</section>
+<section>
+  <h2>Two Input Fields</h2>
+  <input type="text" id="sum1" placeholder="Please enter first value">
+  <input type="text" id="sum2" placeholder="Please enter second value">
+  <button type="button" onclick="return total()">Get Sum</button>
+  <div><label>Result:</label> <p id="addmessage" data-error="Entered value is not a number"></p></div>
+</section>
+<script>
+  document.getElementById('showInput').addEventListener('click', function () {
+    document.getElementById('message-one').innerText = document.getElementById('user-message').value;
+  });
+  function total() {
+    var a = parseFloat(document.getElementById('sum1').value);
+    var b = parseFloat(document.getElementById('sum2').value);
+    var out = document.getElementById('addmessage');
+    out.innerText = (isNaN(a) || isNaN(b)) ? out.dataset.error : String(a + b);
+    return false;
+  }
+</script>
+"""
+
+CHECKBOX = """
+<label><input type="checkbox" id="isAgeSelected"> Click on check box</label>
+<p id="txtAge" data-message="Success - Check box is checked"></p>
+<script>
+  document.getElementById('isAgeSelected').addEventListener('change', function (e) {
+    var out = document.getElementById('txtAge');
+    out.innerText = e.target.checked ? out.dataset.message : '';
+  });
+</script>
+"""
+
+# div[6]/button matters: SUBMIT_BUTTON is //*[@id="seleniumform"]/div[6]/button
+INPUT_FORM = """
+<form id="seleniumform" action="#" method="post">
+  <div>
+    <input type="text" id="name" name="name" placeholder="Name" required>
+    <input type="email" id="inputEmail4" name="email" placeholder="Email" required>
+  </div>
+  <div>
+    <input type="password" id="inputPassword4" name="password" placeholder="Password" required>
+    <input type="text" id="company" name="company" placeholder="Company" required>
+  </div>
+  <div>
+    <input type="text" id="websitename" name="website" placeholder="Website" required>
+    <select name="country" required>
+      <option value="">Country</option>
+      <option value="IN">India</option>
+      <option value="GB">United Kingdom</option>
+      <option value="US">United States</option>
+    </select>
+  </div>
+  <div>
+    <input type="text" id="inputCity" name="city" placeholder="City" required>
+    <input type="text" id="inputAddress1" name="address_line1" placeholder="Address 1" required>
+  </div>
+  <div>
+    <input type="text" id="inputAddress2" name="address_line2" placeholder="Address 2" required>
+    <input type="text" id="inputState" name="state" placeholder="State" required>
+    <input type="text" id="inputZip" name="zip" placeholder="Zip code" required>
+  </div>
+  <div>
+    <button type="submit">Submit</button>
+  </div>
+</form>
+<div class="success-msg hidden" data-message="Thanks for contacting us, we will get back to you shortly."><p></p></div>
+<script>
+  document.getElementById('seleniumform').addEventListener('submit', function (e) {
+    e.preventDefault();
+    var ok = document.querySelector('.success-msg');
+    ok.querySelector('p').innerText = ok.dataset.message;
+    ok.classList.remove('hidden');
+    this.classList.add('hidden');
+  });
+</script>
+"""
+
+PAGES = {
+    BASE_PATH: ("Selenium Playground", LANDING),
+    f"{BASE_PATH}/simple-form-demo": ("Simple Form Demo", SIMPLE_FORM),
+    f"{BASE_PATH}/checkbox-demo": ("Checkbox Demo", CHECKBOX),
+    f"{BASE_PATH}/input-form-demo": ("Input Form Submit", INPUT_FORM),
+}
+
+
+class PlaygroundHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    jitter = 0.0
+
+    def _delay(self):
+        delay = self.latency + random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def do_GET(self):
+        self._delay()
+        path = self.path.split('?', 1)[0].split('#', 1)[0].rstrip('/') or '/'
+        if path == '/':
+            path = BASE_PATH
+        if path not in PAGES:
+            self.send_error(404)
+            return
+        title, body = PAGES[path]
+        content = _LAYOUT.format(title=title, body=body.replace('{base}', BASE_PATH)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        logger.debug("playground: " + format, *args)
+
+
+def start_server(host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0):
+    """Start the stand-in on a background thread; returns (server, playground_url).
+
+    port=0 picks a free port. Call server.shutdown() to stop it.
+    """
+    handler = type('ConfiguredPlaygroundHandler', (PlaygroundHandler,), {
+        'latency': latency_ms / 1000.0,
+        'jitter': jitter_ms / 1000.0,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='playground-server', daemon=True).start()
+    url = f"http://{host}:{server.server_address[1]}{BASE_PATH}"
+    logger.info(f"[PLAYGROUND] Offline stand-in serving {url} (latency {latency_ms} ms ± {jitter_ms} ms)")
+    return server, url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server, url = start_server(args.host, args.port, args.latency_ms, args.jitter_ms)
+    print(f"Serving {url} — Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
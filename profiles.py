@@ -0,0 +1,131 @@
+# python
+import functools
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+# Chrome's per-process lock files; a copy must not inherit them
+_LOCK_FILES = ('SingletonLock', 'SingletonCookie', 'SingletonSocket', 'lockfile')
+
+
+class WarmProfile:
+    """A Chrome profile warmed once per session and cloned for every new driver.
+
+    build() launches Chrome on an empty template directory, visits the warm-up
+    URLs (filling the HTTP cache and any consent cookies the site sets), adds
+    extra cookies if given, and quits so Chrome flushes everything to disk.
+    clone() gives each driver its own copy, so concurrent workers never share a
+    live profile; remove_on_quit() deletes the copy when its driver quits. On Linux the copy uses `cp --reflink=auto` (copy-on-write where
+    the filesystem supports it, a plain copy otherwise). Hardlinks are not used:
+    Chrome rewrites cache and cookie files in place, which would corrupt the
+    template through the shared inodes.
+    """
+
+    def __init__(self, warm_urls, cookies=(), root=None):
+        self.warm_urls = list(warm_urls)
+        self.cookies = list(cookies)
+        self.root = root or tempfile.mkdtemp(prefix='warm-profile-')
+        self.template = os.path.join(self.root, 'template')
+        self.cold_first_page_s = None
+        self.warm_first_page_s = []
+        self.clone_seconds = []
+        self._clones = 0
+        self.removed = 0
+
+    def build(self, launch):
+        """Warm the template using launch(user_data_dir) -> WebDriver."""
+        os.makedirs(self.template, exist_ok=True)
+        start = time.perf_counter()
+        driver = launch(self.template)
+        try:
+            for i, url in enumerate(self.warm_urls):
+                t = time.perf_counter()
+                driver.get(url)
+                if i == 0:
+                    self.cold_first_page_s = time.perf_counter() - t
+                for cookie in self.cookies:
+                    try:
+                        driver.add_cookie(cookie)
+                    except Exception:
+                        # cookies only apply to the domain of the current page
+                        pass
+        finally:
+            driver.quit()
+        logger.info(f"[PROFILE] Warm profile template built in {time.perf_counter() - start:.2f}s "
+                    f"(cold first page {self.cold_first_page_s or 0:.2f}s): {self.template}")
+
+    def clone(self):
+        """Return a fresh user-data-dir copied from the template."""
+        self._clones += 1
+        dest = os.path.join(self.root, f"clone-{os.getpid()}-{self._clones}")
+        start = time.perf_counter()
+        if sys.platform.startswith('linux') and shutil.which('cp'):
+            subprocess.run(['cp', '-a', '--reflink=auto', self.template, dest], check=True)
+        else:
+            shutil.copytree(self.template, dest)
+        for name in _LOCK_FILES:
+            try:
+                os.remove(os.path.join(dest, name))
+            except OSError:
+                pass
+        self.clone_seconds.append(time.perf_counter() - start)
+        return dest
+
+    def remove_on_quit(self, driver, clone):
+        """Delete `clone` once `driver` quits, wherever it is quit (test teardown, pool, pre-spawner)."""
+        quit = driver.quit
+
+        @functools.wraps(quit)
+        def quit_and_remove():
+            try:
+                quit()
+            finally:
+                self.remove(clone)
+
+        driver.quit = quit_and_remove
+        return driver
+
+    def remove(self, clone):
+        shutil.rmtree(clone, ignore_errors=True)
+        self.removed += 1
+
+    def time_first_page(self, driver, url):
+        start = time.perf_counter()
+        driver.get(url)
+        elapsed = time.perf_counter() - start
+        self.warm_first_page_s.append(elapsed)
+        return elapsed
+
+    def summary(self):
+        warm = self.warm_first_page_s
+        avg_warm = sum(warm) / len(warm) if warm else None
+        avg_clone = sum(self.clone_seconds) / len(self.clone_seconds) if self.clone_seconds else None
+        return {
+            'cold_first_page_s': round(self.cold_first_page_s, 3) if self.cold_first_page_s is not None else None,
+            'warm_first_page_avg_s': round(avg_warm, 3) if avg_warm is not None else None,
+            'clones': self._clones,
+            'clones_removed': self.removed,
+            'clone_avg_s': round(avg_clone, 3) if avg_clone is not None else None,
+        }
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def cookies_from_env():
+    """WARM_PROFILE_COOKIES: JSON list of cookie dicts (name, value, optional domain/path)."""
+    raw = os.getenv('WARM_PROFILE_COOKIES')
+    if not raw:
+        return []
+    try:
+        return json.loads(raw)
+    except ValueError:
+        logger.warning("WARM_PROFILE_COOKIES is not valid JSON; ignoring.")
+        return []
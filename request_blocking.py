@@ -0,0 +1,148 @@
+# python
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# URL patterns for Network.setBlockedURLs ('*' is a wildcard)
+PRESETS = {
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*hotjar.com*',
+        '*clarity.ms*', '*segment.io*', '*segment.com*', '*connect.facebook.net*', '*px.ads.linkedin.com*',
+        '*bat.bing.com*', '*mixpanel.com*', '*amplitude.com*',
+    ],
+    'chat': [
+        '*intercom.io*', '*intercomcdn.com*', '*widget.intercom.io*', '*zopim.com*', '*zdassets.com*',
+        '*drift.com*', '*driftt.com*', '*crisp.chat*', '*tawk.to*', '*livechatinc.com*',
+    ],
+    'fonts': ['*fonts.googleapis.com*', '*fonts.gstatic.com*', '*.woff', '*.woff2', '*.ttf', '*.otf'],
+    'images': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico'],
+    'media': ['*.mp4', '*.webm', '*.mp3', '*.m4a'],
+}
+
+SIZE_CACHE_PATH = os.getenv('RESOURCE_SIZE_CACHE', os.path.join('.driver_cache', 'resource_sizes.json'))
+
+
+class ResourceBlocker:
+    """Blocks third-party resources in local Chrome through the DevTools protocol.
+
+    - blocklist: URL patterns (or PRESETS names) passed to Network.setBlockedURLs.
+    - allow_hosts: when set, every other host fails DNS resolution via Chrome's
+      --host-resolver-rules, i.e. an allowlist.
+
+    Blocked requests are counted from Chrome's performance log. known_bytes_saved
+    only adds up blocked URLs whose size is in the size cache (RESOURCE_SIZE_CACHE),
+    which is filled from loads that were not blocked: seed it with one run in
+    learn mode (BLOCK_LEARN_SIZES=true), which records sizes but blocks nothing.
+    blocked_with_known_size says how many blocked requests the figure covers.
+    Request ids are kept across consume() calls (up to pending_capacity open
+    requests), since a request can start in one log drain and fail in the next.
+    """
+
+    def __init__(self, blocklist=(), allow_hosts=(), size_cache_path=SIZE_CACHE_PATH, learn=False,
+                 pending_capacity=5000):
+        self.patterns = []
+        for item in blocklist:
+            self.patterns.extend(PRESETS.get(item, [item]))
+        self.allow_hosts = list(allow_hosts)
+        self.size_cache_path = size_cache_path
+        self.learn = learn
+        self._sizes = self._load_sizes()
+        self._urls = {}
+        self.pending_capacity = pending_capacity
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """BLOCK_RESOURCES: comma list of preset names and/or URL patterns.
+        ALLOW_HOSTS: comma list of hosts allowed to resolve (everything else is blocked).
+        BLOCK_LEARN_SIZES=true: block nothing, only record response sizes for the size cache."""
+        blocklist = [s.strip() for s in os.getenv('BLOCK_RESOURCES', '').split(',') if s.strip()]
+        allow_hosts = [s.strip() for s in os.getenv('ALLOW_HOSTS', '').split(',') if s.strip()]
+        if not blocklist and not allow_hosts:
+            return None
+        return cls(blocklist, allow_hosts, learn=os.getenv('BLOCK_LEARN_SIZES', 'false').lower() == 'true')
+
+    # --- driver setup ---
+    def configure_options(self, options):
+        # the performance log is where blocked/failed requests show up
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL', 'browser': 'ALL'})
+        if self.allow_hosts and not self.learn:
+            excludes = ', '.join(f"EXCLUDE {h}" for h in self.allow_hosts + ['localhost', '127.0.0.1'])
+            options.add_argument(f"--host-resolver-rules=MAP * ~NOTFOUND, {excludes}")
+
+    def apply(self, driver):
+        driver.execute_cdp_cmd('Network.enable', {})
+        if self.learn:
+            logger.info("[BLOCKING] Learning resource sizes; nothing is blocked")
+            return
+        if self.patterns:
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.patterns})
+        logger.info(f"[BLOCKING] {len(self.patterns)} URL pattern(s) blocked, allowlist: {self.allow_hosts or 'off'}")
+
+    # --- accounting ---
+    def _load_sizes(self):
+        try:
+            with open(self.size_cache_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_sizes(self):
+        os.makedirs(os.path.dirname(self.size_cache_path) or '.', exist_ok=True)
+        with self._lock:
+            data = dict(self._sizes)
+        with open(self.size_cache_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def consume(self, entries):
+        """Summarise performance-log entries: blocked request count and bytes saved by those of known size."""
+        blocked, loaded = [], 0
+        with self._lock:
+            for entry in entries:
+                try:
+                    message = json.loads(entry['message'])['message']
+                except (KeyError, TypeError, ValueError):
+                    continue
+                method, params = message.get('method'), message.get('params', {})
+                if method == 'Network.requestWillBeSent':
+                    if len(self._urls) >= self.pending_capacity:
+                        # never-finished requests must not grow memory without bound
+                        self._urls.pop(next(iter(self._urls)))
+                    self._urls[params.get('requestId')] = params.get('request', {}).get('url')
+                elif method == 'Network.loadingFinished':
+                    url = self._urls.pop(params.get('requestId'), None)
+                    if url:
+                        loaded += 1
+                        self._sizes[url] = params.get('encodedDataLength', 0)
+                elif method == 'Network.loadingFailed':
+                    url = self._urls.pop(params.get('requestId'), None)
+                    if url and (params.get('blockedReason') == 'inspector' or (
+                            self.allow_hosts and 'ERR_NAME_NOT_RESOLVED' in params.get('errorText', ''))):
+                        blocked.append(url)
+            known = [self._sizes[u] for u in blocked if u in self._sizes]
+        return {
+            'blocked_requests': len(blocked),
+            'loaded_requests': loaded,
+            'known_bytes_saved': sum(known),
+            'blocked_with_known_size': len(known),
+        }
+
+    def collect(self, driver):
+        """Drain the driver's performance log and summarise it (see consume)."""
+        return self.consume(driver.get_log('performance'))
+
+
+_blocker = None
+_blocker_loaded = False
+
+
+def get_blocker():
+    """Process-wide ResourceBlocker configured from the environment (None when disabled)."""
+    global _blocker, _blocker_loaded
+    if not _blocker_loaded:
+        _blocker = ResourceBlocker.from_env()
+        _blocker_loaded = True
+    return _blocker
@@ -0,0 +1,256 @@
+# python
+"""Run the test suite sharded across parallel worker processes.
+
+Each worker is a separate pytest process with its own WebDriver session
+(REUSE_DRIVER=true) and its own artifact directory (ARTIFACT_ROOT/<worker>/).
+Start/end screenshots all go to one content-addressed store shared by every
+worker and run (SCREENSHOT_ROOT, default ./screenshots), so dedup and retention
+are not split per run directory.
+When all workers finish, their JUnit results and artifact indexes are merged
+into ARTIFACT_ROOT/results.json and ARTIFACT_ROOT/artifact_index.json.
+
+Tests are assigned longest-first (LPT) from the durations recorded by earlier runs
+(scheduler.DurationHistory), so the slowest tests do not end up together on one worker.
+With --matrix, every test runs once per LT_BROWSER:LT_PLATFORM combination; the
+combined jobs are pulled longest-first by at most -n concurrent pytest processes (the
+grid's concurrency limit), each running one test on one combination. Time spent
+waiting for grid capacity (queue_wait_s) is reported apart from test time.
+
+Usage:
+    python run_parallel.py -n 3
+    python run_parallel.py -n 2 -- -k Scenario_1   # extra args are passed to pytest
+    USE_LAMBDATEST=true python run_parallel.py -n 5 --matrix "chrome:Windows 10" --matrix "firefox:macOS Sonoma"
+"""
+import argparse
+import json
+import logging
+import os
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+from scheduler import DurationHistory, longest_first, plan_lpt, test_key
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SCREENSHOT_ROOT = os.path.abspath(os.getenv('SCREENSHOT_ROOT', 'screenshots'))
+
+
+def default_workers():
+    """Local runs scale with cores; remote runs with the LambdaTest concurrency allowance."""
+    if os.getenv('USE_LAMBDATEST', 'false').lower() == 'true':
+        return int(os.getenv('LT_CONCURRENCY', '2'))
+    return os.cpu_count() or 1
+
+
+def collect_node_ids(pytest_args):
+    out = subprocess.run(
+        [sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider', *pytest_args],
+        capture_output=True, text=True,
+    ).stdout
+    return [line.strip() for line in out.splitlines() if '::' in line]
+
+
+def shard(node_ids, workers, history=None):
+    """Split node ids over workers: LPT on recorded durations, round-robin without history."""
+    if history is not None and history.durations:
+        shards, makespan = plan_lpt(node_ids, lambda n: history.estimate(test_key(n)), workers)
+        logger.info(f"[PARALLEL] LPT plan over {len(shards)} worker(s), predicted wall {makespan:.1f}s")
+        return shards
+    shards = [[] for _ in range(workers)]
+    for i, node_id in enumerate(node_ids):
+        shards[i % workers].append(node_id)
+    return [s for s in shards if s]
+
+
+def parse_matrix(entries):
+    """'chrome:Windows 10' -> {'LT_BROWSER': 'chrome', 'LT_PLATFORM': 'Windows 10'}."""
+    combos = []
+    for entry in entries:
+        browser, _, platform = entry.partition(':')
+        combo = {'LT_BROWSER': browser.strip()}
+        if platform.strip():
+            combo['LT_PLATFORM'] = platform.strip()
+        combos.append(combo)
+    return combos
+
+
+def combo_name(combo):
+    return ':'.join(v for v in (combo.get('LT_BROWSER'), combo.get('LT_PLATFORM')) if v)
+
+
+def _slug(text):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', text)
+
+
+def _parse_junit(path, worker):
+    results = []
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError) as e:
+        logger.error(f"Could not read results of {worker}: {e}")
+        return results
+    for case in root.iter('testcase'):
+        outcome = 'passed'
+        for tag in ('failure', 'error', 'skipped'):
+            if case.find(tag) is not None:
+                outcome = 'failed' if tag != 'skipped' else 'skipped'
+                break
+        props = {p.get('name'): p.get('value') for p in case.iter('property')}
+        duration = float(case.get('time') or 0)
+        queue_wait = float(props.get('queue_wait_s') or 0)
+        results.append({
+            'test': f"{case.get('classname')}::{case.get('name')}",
+            'outcome': outcome,
+            'duration_s': round(duration - queue_wait, 3),
+            'queue_wait_s': queue_wait,
+            'worker': worker,
+        })
+    return results
+
+
+def _read_index(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def run(shards, run_dir, pytest_args):
+    procs = []
+    for i, node_ids in enumerate(shards):
+        worker = f"w{i}"
+        env = dict(os.environ, WORKER_ID=worker, ARTIFACT_ROOT=run_dir, RUN_ID=os.path.basename(run_dir),
+                   SCREENSHOT_ROOT=SCREENSHOT_ROOT)
+        env.setdefault('REUSE_DRIVER', 'true')
+        junit = os.path.join(run_dir, worker, 'results.xml')
+        os.makedirs(os.path.dirname(junit), exist_ok=True)
+        log = open(os.path.join(run_dir, worker, 'pytest.log'), 'w', encoding='utf-8')
+        cmd = [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', f'--junitxml={junit}', *pytest_args, *node_ids]
+        logger.info(f"[PARALLEL] {worker}: {len(node_ids)} test(s)")
+        procs.append((worker, junit, log, subprocess.Popen(cmd, env=env, stdout=log, stderr=subprocess.STDOUT)))
+
+    results, index, exit_code = [], [], 0
+    for worker, junit, log, proc in procs:
+        exit_code = max(exit_code, proc.wait())
+        log.close()
+        results.extend(_parse_junit(junit, worker))
+        index.extend(_read_index(os.path.join(run_dir, worker, 'artifact_index.json')))
+    return results, index, exit_code
+
+
+def run_matrix(jobs, workers, run_dir, pytest_args, estimate):
+    """Run (combo, node_id) jobs, longest first, on at most `workers` concurrent pytest processes."""
+    pending = queue.Queue()
+    for job in longest_first(jobs, estimate):
+        pending.put(job)
+    results, index, codes, lock = [], [], [], threading.Lock()
+    counter = iter(range(len(jobs)))
+
+    def slot():
+        while True:
+            try:
+                combo, node_id = pending.get_nowait()
+            except queue.Empty:
+                return
+            with lock:
+                worker = f"{_slug(combo_name(combo))}-j{next(counter)}"
+            env = dict(os.environ, WORKER_ID=worker, ARTIFACT_ROOT=run_dir, RUN_ID=os.path.basename(run_dir),
+                       SCREENSHOT_ROOT=SCREENSHOT_ROOT, **combo)
+            junit = os.path.join(run_dir, worker, 'results.xml')
+            os.makedirs(os.path.dirname(junit), exist_ok=True)
+            cmd = [sys.executable, '-m', 'pytest', '-p', 'no:cacheprovider', f'--junitxml={junit}', *pytest_args, node_id]
+            logger.info(f"[PARALLEL] {worker}: {node_id} on {combo_name(combo)}")
+            with open(os.path.join(run_dir, worker, 'pytest.log'), 'w', encoding='utf-8') as log:
+                code = subprocess.run(cmd, env=env, stdout=log, stderr=subprocess.STDOUT).returncode
+            parsed = _parse_junit(junit, worker)
+            for r in parsed:
+                r['combo'] = combo_name(combo)
+            with lock:
+                codes.append(code)
+                results.extend(parsed)
+                index.extend(_read_index(os.path.join(run_dir, worker, 'artifact_index.json')))
+
+    threads = [threading.Thread(target=slot, name=f'slot-{i}') for i in range(min(workers, len(jobs)))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, index, max(codes, default=0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--workers', type=int, default=default_workers())
+    parser.add_argument('--run-dir', default=os.path.join('runs', datetime.now().strftime('%Y%m%d_%H%M%S')))
+    parser.add_argument('--matrix', action='append', metavar='BROWSER:PLATFORM',
+                        help='repeatable; run every test on each LT_BROWSER:LT_PLATFORM combination')
+    parser.add_argument('pytest_args', nargs='*')
+    args = parser.parse_args(argv)
+
+    node_ids = collect_node_ids(args.pytest_args)
+    if not node_ids:
+        logger.error("No tests collected.")
+        return 5
+    history = DurationHistory()
+
+    start = time.perf_counter()
+    if args.matrix:
+        combos = parse_matrix(args.matrix)
+        jobs = [(combo, node_id) for combo in combos for node_id in node_ids]
+
+        def estimate(job):
+            combo, node_id = job
+            key = test_key(node_id)
+            return history.estimate(f"{combo_name(combo)}|{key}", history.estimate(key))
+
+        workers = max(1, min(args.workers, len(jobs)))
+        results, index, exit_code = run_matrix(jobs, workers, args.run_dir, args.pytest_args, estimate)
+    else:
+        shards = shard(node_ids, max(1, min(args.workers, len(node_ids))), history)
+        workers = len(shards)
+        results, index, exit_code = run(shards, args.run_dir, args.pytest_args)
+    wall = time.perf_counter() - start
+
+    for r in results:
+        if r['outcome'] == 'passed':
+            key = test_key(r['test'])
+            history.update(f"{r['combo']}|{key}" if 'combo' in r else key, r['duration_s'])
+    try:
+        history.save()
+    except OSError as e:
+        logger.warning(f"Could not save test durations: {e}")
+
+    serial = sum(r['duration_s'] for r in results)
+    summary = {
+        'workers': workers,
+        'wall_s': round(wall, 2),
+        'serial_s': round(serial, 2),
+        'queue_wait_s': round(sum(r['queue_wait_s'] for r in results), 2),
+        'speedup': round(serial / wall, 2) if wall else None,
+        'passed': sum(r['outcome'] == 'passed' for r in results),
+        'failed': sum(r['outcome'] == 'failed' for r in results),
+        'skipped': sum(r['outcome'] == 'skipped' for r in results),
+        'results': results,
+    }
+    with open(os.path.join(args.run_dir, 'results.json'), 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+    with open(os.path.join(args.run_dir, 'artifact_index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+
+    logger.info(f"[PARALLEL] {summary['passed']} passed, {summary['failed']} failed, {summary['skipped']} skipped "
+                f"on {summary['workers']} worker(s) in {summary['wall_s']}s "
+                f"(serial {summary['serial_s']}s, speedup x{summary['speedup']}, "
+                f"grid queue wait {summary['queue_wait_s']}s). Results in {args.run_dir}")
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# python
+import heapq
+import json
+import logging
+import os
+import random
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+HISTORY_PATH = os.getenv('TEST_DURATIONS_PATH', '.test_durations.json')
+
+# Messages grids use when the account's parallel session allowance is exhausted
+_CAPACITY_ERROR = re.compile(r'concurren|queue|capacity|parallel|limit reached|no available|too many', re.IGNORECASE)
+
+
+def test_key(node_id):
+    """History key for a pytest node id or JUnit classname::name: the test name with parameters."""
+    return node_id.rsplit('::', 1)[-1]
+
+
+class DurationHistory:
+    """Exponentially weighted per-test durations, persisted between runs."""
+
+    def __init__(self, path=HISTORY_PATH, alpha=0.5):
+        self.path = path
+        self.alpha = alpha
+        try:
+            with open(path, encoding='utf-8') as f:
+                self.durations = json.load(f)
+        except (OSError, ValueError):
+            self.durations = {}
+
+    def estimate(self, key, default=None):
+        if key in self.durations:
+            return self.durations[key]
+        if default is not None:
+            return default
+        # unknown tests are assumed to be as long as the average known one
+        return sum(self.durations.values()) / len(self.durations) if self.durations else 1.0
+
+    def update(self, key, seconds):
+        old = self.durations.get(key)
+        self.durations[key] = round(seconds if old is None else self.alpha * seconds + (1 - self.alpha) * old, 3)
+
+    def save(self):
+        tmp = f"{self.path}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def longest_first(jobs, estimate):
+    """Order jobs by estimated duration, longest first (the LPT rule)."""
+    return sorted(jobs, key=estimate, reverse=True)
+
+
+def plan_lpt(jobs, estimate, workers):
+    """Partition jobs over workers with the LPT heuristic; returns (shards, predicted makespan)."""
+    heap = [(0.0, i) for i in range(workers)]
+    shards = [[] for _ in range(workers)]
+    for job in longest_first(jobs, estimate):
+        load, i = heapq.heappop(heap)
+        shards[i].append(job)
+        heapq.heappush(heap, (load + estimate(job), i))
+    return [s for s in shards if s], max(load for load, _ in heap)
+
+
+def is_capacity_error(exc):
+    return bool(_CAPACITY_ERROR.search(str(exc)))
+
+
+def create_with_backoff(create, retries=None, base_delay=None, max_delay=None):
+    """Call create() and retry with exponential backoff (plus jitter) on grid capacity errors.
+
+    Returns (result, queue_wait_seconds), where the wait covers only the time spent
+    backing off, not the successful session creation itself. Defaults come from
+    SESSION_RETRIES (8), SESSION_BACKOFF_S (2) and SESSION_BACKOFF_MAX_S (60).
+    """
+    retries = int(os.getenv('SESSION_RETRIES', '8')) if retries is None else retries
+    base_delay = float(os.getenv('SESSION_BACKOFF_S', '2')) if base_delay is None else base_delay
+    max_delay = float(os.getenv('SESSION_BACKOFF_MAX_S', '60')) if max_delay is None else max_delay
+
+    waited = 0.0
+    for attempt in range(retries + 1):
+        try:
+            return create(), waited
+        except Exception as e:
+            if attempt == retries or not is_capacity_error(e):
+                raise
+            delay = min(max_delay, base_delay * 2 ** attempt) * random.uniform(0.8, 1.2)
+            logger.warning(f"[SCHEDULER] Grid at capacity ({str(e).splitlines()[0][:120]}); "
+                           f"retry {attempt + 1}/{retries} in {delay:.1f}s")
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,108 @@
+# python
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+
+from artifacts import artifact_dir, artifact_path, current_test, get_writer
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# characters encoded and compressed per write, so the document is never held twice in full
+_CHUNK = 1 << 20
+
+_EXTENSIONS = {'mhtml': '.mhtml', 'html': '.html'}
+_index_lock = threading.Lock()
+
+
+def default_codec():
+    """SNAPSHOT_CODEC: 'gzip', 'zstd' or 'auto' (default: zstd when zstandard is installed, else gzip)."""
+    codec = os.getenv('SNAPSHOT_CODEC', 'auto').lower()
+    if codec == 'auto':
+        return 'zstd' if zstandard is not None else 'gzip'
+    if codec == 'zstd' and zstandard is None:
+        logger.warning("SNAPSHOT_CODEC=zstd but zstandard is not installed; using gzip.")
+        return 'gzip'
+    return codec
+
+
+def capture_snapshot(driver):
+    """Return (document, format): a self-contained MHTML archive through DevTools when the
+    driver supports it (local Chrome), otherwise the page source as 'html'."""
+    if hasattr(driver, 'execute_cdp_cmd'):
+        try:
+            return driver.execute_cdp_cmd('Page.captureSnapshot', {'format': 'mhtml'})['data'], 'mhtml'
+        except Exception as e:
+            logger.debug(f"[SNAPSHOT] MHTML capture failed, falling back to page_source: {e}")
+    return driver.page_source, 'html'
+
+
+def _open(path, codec):
+    if codec == 'zstd':
+        return zstandard.ZstdCompressor(level=3).stream_writer(open(path, 'wb'), closefd=True)
+    return gzip.open(path, 'wb', compresslevel=6)
+
+
+def write_snapshot(kind, name, document, fmt='html', capture_s=0.0, codec=None, writer=None):
+    """Queue `document` for <kind>/<name>.<fmt>.<gz|zst>; returns the path at once.
+
+    Encoding, chunked compression, the write and the index entry all run on the
+    background ArtifactWriter, so a multi-MB archive never blocks the test thread.
+    """
+    codec = codec or default_codec()
+    path = artifact_path(kind, f"{name}{_EXTENSIONS.get(fmt, '.' + fmt)}{'.zst' if codec == 'zstd' else '.gz'}")
+    test = current_test()
+
+    def job(path):
+        start = time.perf_counter()
+        raw = 0
+        with _open(path, codec) as out:
+            for i in range(0, len(document), _CHUNK):
+                chunk = document[i:i + _CHUNK].encode('utf-8')
+                raw += len(chunk)
+                out.write(chunk)
+        write_s = time.perf_counter() - start
+        compressed = os.path.getsize(path)
+        _record(kind, {
+            'path': path,
+            'test': test,
+            'format': fmt,
+            'codec': codec,
+            'raw_bytes': raw,
+            'compressed_bytes': compressed,
+            'capture_ms': round(capture_s * 1000, 1),
+            'write_ms': round(write_s * 1000, 1),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+        return compressed
+
+    return (writer or get_writer()).submit(path, job)
+
+
+def save_snapshot(driver, kind, name, codec=None):
+    """Capture the current page and write it compressed; returns the path (None on failure)."""
+    start = time.perf_counter()
+    try:
+        document, fmt = capture_snapshot(driver)
+    except Exception as e:
+        logger.debug(f"[SNAPSHOT] capture failed: {e}")
+        return None
+    capture_s = time.perf_counter() - start
+    path = write_snapshot(kind, name, document, fmt, capture_s, codec)
+    logger.info(f"[SNAPSHOT] {fmt} snapshot ({len(document)} chars, captured in {capture_s:.2f}s) queued -> {path}")
+    return path
+
+
+def _record(kind, entry):
+    # one JSON object per line next to the artifacts, appended as snapshots are taken
+    index = os.path.join(artifact_dir(kind), 'snapshot_index.jsonl')
+    with _index_lock:
+        with open(index, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
@@ -0,0 +1,345 @@
+# python
+"""Minimal Selenium-compatible (W3C WebDriver) stand-in hub for offline tests and benchmarks.
+
+It does not drive a browser: sessions are bookkeeping only, navigation just stores
+the URL and screenshots are a 1x1 PNG. What it does model is what matters for
+session management work: slow session allocation (--session-delay-ms), per-command
+latency (--command-delay-ms) and a concurrency cap (--max-sessions) that rejects new
+sessions the way a busy grid does.
+
+Element lookups and scripts are answered by a page model: the default StubPage has
+no elements and every script returns null; PlaygroundPage (--playground) lets the
+page objects run their flows (every locator matches, text checks pass, data-driven
+rows compute their result). Navigation makes earlier element references stale.
+
+Usage:
+    python stub_hub.py --port 4444 --session-delay-ms 2000 --max-sessions 2
+    USE_LAMBDATEST=true REMOTE_HUB_URL=http://127.0.0.1:4444/wd/hub pytest ...
+"""
+import argparse
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from page_scripts import JS_FILL_FORM, JS_MATCH_TEXT, JS_RUN_CASE, JS_TEXT
+
+logger = logging.getLogger(__name__)
+
+# 1x1 transparent PNG
+_PNG_B64 = "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+
+_SESSION_PATH = re.compile(r"^/session/([^/]+)(/.*)?$")
+_ELEMENT_PATH = re.compile(r"^/element/([^/]+)(/.*)?$")
+
+# W3C web element reference key
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+def _stale(session, element_id):
+    """Whether an element reference is from before the session's last navigation."""
+    return element_id is not None and not element_id.startswith(f"{session['generation']}.")
+
+
+class StubPage:
+    """What every session of the hub "sees": an empty page where scripts return null."""
+
+    def find(self, using, value):
+        """Number of elements matching the locator."""
+        return 0
+
+    def script(self, session, script, args):
+        """Return value of a script run in `session`; session['page'] holds page state until the next navigation."""
+        return None
+
+
+class PlaygroundPage(StubPage):
+    """Enough of the Selenium Playground for the page objects' flows.
+
+    Every locator matches one displayed, enabled element; fill scripts set every
+    field; a data-driven row shows the sum of its inputs when they are all numbers,
+    else its first input. Text checks find the expected text until a row has written
+    a result; from then on only the written results are on the page.
+    """
+
+    def __init__(self):
+        self._scripts = {JS_FILL_FORM: self._fill_form, JS_MATCH_TEXT: self._match_text,
+                         JS_RUN_CASE: self._run_case, JS_TEXT: self._text}
+
+    def find(self, using, value):
+        return 1
+
+    def script(self, session, script, args):
+        handler = self._scripts.get(script)
+        if handler is not None:
+            return handler(session.setdefault('page', {}), *args)
+        # selenium's isDisplayed atom and async_webdriver's visibility check
+        if 'isDisplayed' in script or 'getClientRects' in script:
+            return True
+        return None
+
+    @staticmethod
+    def _fill_form(shown, fields):
+        return {key: {'found': True, 'ok': True, 'value': text} for key, _, _, text in fields}
+
+    @staticmethod
+    def _match_text(shown, locators, expected, contains):
+        matched = [(i, text) for i, text in enumerate(shown.get(tuple(loc)) if shown else expected for loc in locators)
+                   if text is not None and ((expected in text) if contains else text == expected)]
+        return [matched[0][0], matched[0][1], [i for i, _ in matched]] if matched else None
+
+    @staticmethod
+    def _text(shown, by, value):
+        return shown.get((by, value), '')
+
+    @staticmethod
+    def _run_case(shown, inputs, button, result):
+        values = [text for _, _, text in inputs]
+        try:
+            text = str(sum(int(v) for v in values)) if len(values) > 1 else values[0]
+        except ValueError:
+            text = values[0]
+        shown[tuple(result)] = text
+        return {'text': text}
+
+
+class StubHub:
+    """Session bookkeeping shared by all request handler threads."""
+
+    def __init__(self, session_delay=0.0, command_delay=0.0, max_sessions=None, page=None):
+        self.session_delay = session_delay
+        self.command_delay = command_delay
+        self.max_sessions = max_sessions
+        self.page = page or StubPage()
+        # commands received, keyed like "POST /session/element" (session and element ids left out)
+        self.commands = Counter()
+        self._locators = {}  # (using, value) -> number used in element ids
+        self.sessions = {}
+        self.created = 0
+        self.rejected = 0
+        self.deleted = 0
+        self.lock = threading.Lock()
+
+    def new_session(self):
+        with self.lock:
+            if self.max_sessions is not None and len(self.sessions) >= self.max_sessions:
+                self.rejected += 1
+                return None
+            session_id = uuid.uuid4().hex
+            # reserve the slot while the "machine" is being allocated
+            self.sessions[session_id] = {'url': 'about:blank', 'ready': False, 'generation': 0,
+                                         'timeouts': {'implicit': 0, 'pageLoad': 300000, 'script': 30000}}
+        time.sleep(self.session_delay)
+        with self.lock:
+            self.sessions[session_id]['ready'] = True
+            self.created += 1
+        return session_id
+
+    def delete_session(self, session_id):
+        with self.lock:
+            if self.sessions.pop(session_id, None) is not None:
+                self.deleted += 1
+                return True
+        return False
+
+    def count(self, method, command):
+        key = _ELEMENT_PATH.sub(r'/element/:id\2', command) if command else ''
+        with self.lock:
+            self.commands[f"{method} /session{key}"] += 1
+
+    def find(self, session, using, value):
+        """References to the elements matching the locator on the session's current page."""
+        with self.lock:
+            locator = self._locators.setdefault((using, value), len(self._locators))
+        return [{ELEMENT_KEY: f"{session['generation']}.{locator}.{i}"} for i in range(self.page.find(using, value))]
+
+    @property
+    def active(self):
+        with self.lock:
+            return len(self.sessions)
+
+
+class StubHubHandler(BaseHTTPRequestHandler):
+    hub = None
+    protocol_version = 'HTTP/1.1'  # keep-alive, like a real hub
+    # headers and body go out in separate writes; without this Nagle + delayed ACK add ~40 ms per response
+    disable_nagle_algorithm = True
+
+    def _send(self, status, value):
+        body = json.dumps({'value': value}).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, error, message):
+        self._send(status, {'error': error, 'message': message, 'stacktrace': ''})
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return {}
+
+    def _route(self, method):
+        body = self._body()
+        path = self.path.split('?', 1)[0]
+        if path.startswith('/wd/hub'):
+            path = path[len('/wd/hub'):]
+        hub = self.hub
+
+        if path == '/status' and method == 'GET':
+            return self._send(200, {'ready': True, 'message': 'stub hub'})
+
+        if path == '/session' and method == 'POST':
+            session_id = hub.new_session()
+            if session_id is None:
+                return self._error(500, 'session not created',
+                                   f'Maximum concurrency of {hub.max_sessions} sessions reached; queue is full')
+            caps = body.get('capabilities', {}).get('alwaysMatch', {})
+            return self._send(200, {'sessionId': session_id, 'capabilities': {
+                'browserName': caps.get('browserName', 'chrome'), 'browserVersion': 'stub', 'platformName': 'any',
+            }})
+
+        match = _SESSION_PATH.match(path)
+        if not match:
+            return self._error(404, 'unknown command', f'{method} {path}')
+        session_id, command = match.group(1), match.group(2) or ''
+        if session_id not in hub.sessions:
+            return self._error(404, 'invalid session id', f'No active session {session_id}')
+
+        time.sleep(hub.command_delay)
+        hub.count(method, command)
+        session = hub.sessions[session_id]
+        if command == '' and method == 'DELETE':
+            hub.delete_session(session_id)
+            return self._send(200, None)
+        if command == '/url':
+            if method == 'POST':
+                session['url'] = body.get('url', 'about:blank')
+                # a new page: element references from the previous one go stale
+                session['generation'] += 1
+                session.pop('page', None)
+                return self._send(200, None)
+            return self._send(200, session['url'])
+        if command == '/timeouts':
+            if method == 'POST':
+                session['timeouts'].update({k: v for k, v in body.items() if k in session['timeouts']})
+                return self._send(200, None)
+            return self._send(200, session['timeouts'])
+        if command == '/title':
+            return self._send(200, 'Stub Hub')
+        if command in ('/element', '/elements'):
+            return self._find(session, command, body)
+        element = _ELEMENT_PATH.match(command)
+        if element:
+            return self._element(session, method, element.group(1), element.group(2) or '', body)
+        if command in ('/execute/sync', '/execute/async'):
+            args = body.get('args', [])
+            stale = [arg[ELEMENT_KEY] for arg in args if isinstance(arg, dict) and _stale(session, arg.get(ELEMENT_KEY))]
+            if stale:
+                return self._error(404, 'stale element reference', f'{stale[0]} is not attached to the page document')
+            return self._send(200, hub.page.script(session, body.get('script', ''), args))
+        if command == '/screenshot':
+            return self._send(200, _PNG_B64)
+        if command == '/source':
+            return self._send(200, '<html><head></head><body></body></html>')
+        if command == '/window/handles':
+            return self._send(200, ['main'])
+        if command == '/window':
+            return self._send(200, 'main')
+        if command in ('/window/rect', '/window/maximize'):
+            return self._send(200, {'x': 0, 'y': 0, 'width': 1920, 'height': 1080})
+        # everything else (timeouts, cookies, ...) succeeds with a null value
+        return self._send(200, None)
+
+    def _find(self, session, command, body):
+        found = self.hub.find(session, body.get('using'), body.get('value'))
+        if command.endswith('/elements'):
+            return self._send(200, found)
+        if not found:
+            return self._error(404, 'no such element', f"Unable to locate element: {body.get('value')}")
+        return self._send(200, found[0])
+
+    def _element(self, session, method, element_id, command, body):
+        if _stale(session, element_id):
+            return self._error(404, 'stale element reference', f'{element_id} is not attached to the page document')
+        if command in ('/element', '/elements'):
+            return self._find(session, command, body)
+        if command in ('/displayed', '/enabled'):
+            return self._send(200, True)
+        if command == '/selected':
+            return self._send(200, False)
+        if command == '/name':
+            return self._send(200, 'input')
+        if command == '/rect':
+            return self._send(200, {'x': 0, 'y': 0, 'width': 100, 'height': 20})
+        # click, clear, value, text, attribute, property, css
+        return self._send(200, '' if command == '/text' else None)
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_POST(self):
+        self._route('POST')
+
+    def do_DELETE(self):
+        self._route('DELETE')
+
+    def log_message(self, format, *args):
+        logger.debug("stub hub: " + format, *args)
+
+
+class _StubHubServer(ThreadingHTTPServer):
+    # the default backlog of 5 drops simultaneous connects (SYN retried after 1 s) when dozens
+    # of sessions start at once
+    request_queue_size = 128
+
+
+def start_hub(host='127.0.0.1', port=0, session_delay_ms=0, command_delay_ms=0, max_sessions=None, page=None):
+    """Start the stand-in hub on a background thread; returns (server, hub, url).
+
+    url is the command executor URL to pass to webdriver.Remote. Stop with server.shutdown().
+    page is the StubPage sessions see (default: empty).
+    """
+    hub = StubHub(session_delay_ms / 1000.0, command_delay_ms / 1000.0, max_sessions, page)
+    handler = type('ConfiguredStubHubHandler', (StubHubHandler,), {'hub': hub})
+    server = _StubHubServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='stub-hub', daemon=True).start()
+    url = f"http://{host}:{server.server_address[1]}/wd/hub"
+    logger.info(f"[STUB HUB] Serving {url} (session delay {session_delay_ms} ms, max sessions {max_sessions})")
+    return server, hub, url
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4444)
+    parser.add_argument('--session-delay-ms', type=float, default=0)
+    parser.add_argument('--command-delay-ms', type=float, default=0)
+    parser.add_argument('--max-sessions', type=int, default=None)
+    parser.add_argument('--playground', action='store_true', help='answer element lookups and scripts like the '
+                                                                   'Selenium Playground (see PlaygroundPage)')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    server, _, url = start_hub(args.host, args.port, args.session_delay_ms, args.command_delay_ms, args.max_sessions,
+                               PlaygroundPage() if args.playground else None)
+    print(f"Stub hub at {url} — Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# python
+import json
+import os
+import time
+
+import pytest
+
+from artifacts import CaptureRing, ScreenshotStore
+from instrumentation import Instrumentation
+
+
+class FakeDriver:
+    def __init__(self):
+        self.screenshots = 0
+        self.sources = 0
+
+    def get_screenshot_as_png(self):
+        self.screenshots += 1
+        return b"\x89PNG"
+
+    @property
+    def page_source(self):
+        self.sources += 1
+        return "<html></html>"
+
+
+def test_capture_ring_captures_top_level_steps_only():
+    driver = FakeDriver()
+    ring = CaptureRing(driver, size=50)
+    instr = Instrumentation("test_x")
+    instr.add_listener(ring)
+    with instr.step("run_sum_cases"):
+        for _ in range(20):
+            with instr.step("enter_values_for_sum"):
+                pass
+            with instr.step("click_get_values_button"):
+                pass
+    with pytest.raises(ValueError), instr.step("validate_sum_displayed"):
+        with instr.step("nested"):
+            raise ValueError("sum not shown")
+
+    assert [f["step"] for f in ring.frames] == ["run_sum_cases", "validate_sum_displayed"]
+    assert ring.frames[-1]["error"] == "ValueError: sum not shown"
+    assert driver.screenshots == 2 and driver.sources == 2
+
+
+def test_workers_sharing_a_store_dedup_and_retain_across_each_other(tmp_path):
+    root = str(tmp_path / "screenshots")
+    w0, w1 = ScreenshotStore(root, max_bytes=25), ScreenshotStore(root, max_bytes=25)
+    w0.put("test_a", "start", b"A" * 10)
+    w1.put("test_b", "start", b"A" * 10)
+    w1.put("test_b", "end", b"B" * 10)
+    assert w1.stats()["deduplicated"] == 1
+    w0.save()
+    w1.save()
+    with open(os.path.join(root, "index.json"), encoding="utf-8") as f:
+        assert sorted(e["test"] for e in json.load(f)) == ["test_a", "test_b", "test_b"]
+
+    # a later run's retention sees every worker's entries and deletes what falls out of the budget
+    later = ScreenshotStore(root, max_bytes=25, orphan_grace_s=0)
+    later.put("test_c", "start", b"C" * 10)
+    time.sleep(0.01)
+    later.save()
+    blobs = {e["blob"] for e in later.entries}
+    on_disk = [name for _, _, files in os.walk(os.path.join(root, "blobs")) for name in files]
+    assert len(blobs) == 2 and len(on_disk) == 2
+
+
+def test_unsaved_blobs_of_another_worker_are_kept(tmp_path):
+    root = str(tmp_path / "screenshots")
+    running = ScreenshotStore(root)
+    path = running.put("test_a", "start", b"A" * 10)
+    ScreenshotStore(root, max_bytes=1).save()
+    assert os.path.exists(path)
@@ -0,0 +1,98 @@
+# python
+import asyncio
+
+import pytest
+
+from async_pages import AsyncSeleniumPlaygroundPage
+from async_webdriver import AsyncHTTPPool, async_session
+from stub_hub import PlaygroundPage, start_hub
+
+BASE_URL = "http://127.0.0.1/selenium-playground"
+CAPS = {"browserName": "chrome"}
+FORM = {"name": "Test User", "email": "test@example.com", "country": "United States", "zipcode": "12345"}
+
+
+def run_page(url, flow, navigation="direct"):
+    """Run flow(page) on a fresh async session against the hub at `url`; returns its result."""
+    async def main():
+        pool = AsyncHTTPPool(url)
+        try:
+            async with async_session(pool, "t", capabilities=CAPS) as driver:
+                return await flow(AsyncSeleniumPlaygroundPage(driver, timeout=2, base_url=BASE_URL,
+                                                              navigation=navigation))
+        finally:
+            await pool.close()
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def playground():
+    server, hub, url = start_hub(page=PlaygroundPage())
+    yield hub, url
+    server.shutdown()
+
+
+def test_direct_navigation_deep_links(playground):
+    stub, url = playground
+
+    async def flow(page):
+        await page.open_playground()
+        await page.go_to_simple_form_demo()
+        first = await page.driver.current_url()
+        await page.go_to_checkbox_demo()
+        return first, await page.driver.current_url()
+
+    assert run_page(url, flow) == (f"{BASE_URL}/simple-form-demo", f"{BASE_URL}/checkbox-demo")
+    # no landing page and no link clicks in direct mode
+    assert stub.commands["POST /session/url"] == 2
+    assert stub.commands["POST /session/element/:id/click"] == 0
+
+
+def test_click_navigation_goes_through_the_landing_page(playground):
+    stub, url = playground
+
+    async def flow(page):
+        await page.open_playground()
+        await page.go_to_input_form_submit()
+        return await page.driver.current_url()
+
+    assert run_page(url, flow, navigation="click") == BASE_URL
+    assert stub.commands["POST /session/element/:id/click"] == 1
+
+
+def test_fill_form_and_data_driven_rows(playground):
+    _, url = playground
+
+    async def flow(page):
+        await page.go_to_input_form_submit()
+        filled = await page.fill_form(FORM)
+        await page.click_submit_button()
+        await page.go_to_simple_form_demo()
+        seen = []
+        sums = await page.run_sum_cases([{"a": 2, "b": 3}, {"a": 10, "b": -4}, {"a": 1, "b": 1, "expected": "3"}],
+                                        on_result=seen.append, timeout=0.2)
+        messages = await page.run_message_cases([{"message": "Hello"}])
+        await page.go_to_checkbox_demo()
+        await page.click_single_checkbox()
+        checkbox = await page.validate_single_checkbox_success_message()
+        return filled, sums, seen, messages, checkbox
+
+    filled, sums, seen, messages, checkbox = run_page(url, flow)
+    assert sorted(filled) == sorted(FORM) and all(r["ok"] for r in filled.values())
+    assert [r["passed"] for r in sums] == [True, True, False] and seen == sums
+    assert [r["actual"] for r in sums] == ["5", "6", "2"]
+    assert messages[0]["passed"] and messages[0]["actual"] == "Hello"
+    assert checkbox == "Success - Check box is checked"
+
+
+def test_text_check_timeout_raises_assertion_error():
+    # the default stub page shows nothing: the text never appears
+    server, _, url = start_hub()
+    try:
+        async def flow(page):
+            await page._validate_text([page.L.MESSAGE_DISPLAYED_LOCATOR], "Hello", 0.2, "Expected message")
+
+        with pytest.raises(AssertionError, match="Expected message not displayed: Hello"):
+            run_page(url, flow)
+    finally:
+        server.shutdown()
@@ -0,0 +1,140 @@
+# python
+import asyncio
+import os
+import sys
+
+import pytest
+from selenium.common.exceptions import (InvalidSessionIdException, JavascriptException, SessionNotCreatedException,
+                                        TimeoutException)
+
+from async_webdriver import AsyncChromeService, AsyncHTTPPool, AsyncRemoteDriver, async_session, async_until
+from stub_hub import start_hub
+
+CAPS = {"browserName": "chrome"}
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def fake_chromedriver(tmp_path, body):
+    """Executable standing in for chromedriver: runs `body` with the --port=N argument in `port`."""
+    path = tmp_path / "chromedriver"
+    path.write_text(f"#!{sys.executable}\n"
+                    f"import sys\n"
+                    f"sys.path.insert(0, {ROOT!r})\n"
+                    f"port = next(a.split('=', 1)[1] for a in sys.argv if a.startswith('--port='))\n"
+                    f"{body}\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+@pytest.fixture
+def hub():
+    server, hub, url = start_hub(command_delay_ms=5, max_sessions=25)
+    yield hub, url
+    server.shutdown()
+
+
+def test_concurrent_sessions_share_pooled_connections(hub):
+    stub, url = hub
+
+    async def one(pool):
+        async with async_session(pool, "t", capabilities=CAPS) as driver:
+            await driver.get("http://127.0.0.1/page")
+            for _ in range(5):
+                await driver.execute_script("return 1;")
+            assert await driver.current_url() == "http://127.0.0.1/page"
+            assert (await driver.get_screenshot_as_png()).startswith(b"\x89PNG")
+            return driver.commands
+
+    async def main():
+        pool = AsyncHTTPPool(url, max_connections=8)
+        try:
+            return await asyncio.gather(*(one(pool) for _ in range(20))), pool.stats()
+        finally:
+            await pool.close()
+
+    commands, stats = asyncio.run(main())
+    assert commands == [8] * 20
+    assert stub.active == 0 and stub.deleted == 20
+    assert stats["connections_opened"] <= 8 < stats["requests"]
+
+
+def test_hub_errors_raise_selenium_exceptions(hub):
+    stub, url = hub
+
+    async def main():
+        pool = AsyncHTTPPool(url)
+        try:
+            drivers = [await AsyncRemoteDriver.create(pool, CAPS) for _ in range(25)]
+            with pytest.raises(SessionNotCreatedException):
+                await AsyncRemoteDriver.create(pool, CAPS)
+            for driver in drivers:
+                await driver.quit()
+            with pytest.raises(InvalidSessionIdException):
+                await drivers[0].title()
+        finally:
+            await pool.close()
+
+    asyncio.run(main())
+    assert stub.rejected == 1 and stub.active == 0
+
+
+def test_async_until_times_out():
+    calls = []
+
+    async def never():
+        calls.append(1)
+        return None
+
+    with pytest.raises(TimeoutException):
+        asyncio.run(async_until(never, timeout=0.2, poll=0.02))
+    assert len(calls) > 2
+
+
+def test_async_until_polls_through_script_errors():
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise JavascriptException("document unloaded while waiting for result")
+        return "ok"
+
+    assert asyncio.run(async_until(flaky, timeout=2, poll=0.01)) == "ok"
+
+
+def test_async_until_raises_dead_session_errors_at_once():
+    calls = []
+
+    async def gone():
+        calls.append(1)
+        raise InvalidSessionIdException("invalid session id")
+
+    with pytest.raises(InvalidSessionIdException):
+        asyncio.run(async_until(gone, timeout=2, poll=0.01))
+    assert len(calls) == 1
+
+
+def test_chrome_service_starts_serves_and_stops(tmp_path):
+    # the stub hub answers /status and sessions at the root path too, like chromedriver
+    service = AsyncChromeService(fake_chromedriver(tmp_path, "import stub_hub; stub_hub.main(['--port', port])"))
+
+    async def main():
+        url = await service.start()
+        pool = AsyncHTTPPool(url)
+        try:
+            async with async_session(pool, "t", capabilities=CAPS) as driver:
+                await driver.get("http://127.0.0.1/page")
+                return await driver.current_url()
+        finally:
+            await pool.close()
+            await service.stop()
+
+    assert asyncio.run(main()) == "http://127.0.0.1/page"
+    assert service.process.returncode is not None
+
+
+def test_chrome_service_that_never_gets_ready_is_stopped(tmp_path):
+    service = AsyncChromeService(fake_chromedriver(tmp_path, "import time; time.sleep(60)"), timeout=0.5)
+    with pytest.raises(TimeoutException):
+        asyncio.run(service.start())
+    assert service.process.returncode is not None
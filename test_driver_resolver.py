@@ -0,0 +1,99 @@
+# python
+import sys
+import threading
+import time
+
+import pytest
+
+import driver_resolver
+from driver_resolver import load_index, resolve_chromedriver, save_index
+
+CHROME = "120.0.6099.109"
+
+
+def fake_driver(tmp_path, name, version):
+    """Executable standing in for chromedriver: prints its version like the real one."""
+    path = tmp_path / name
+    path.write_text(f"#!{sys.executable}\nprint('ChromeDriver {version} (abc)')\n")
+    path.chmod(0o755)
+    return str(path)
+
+
+def no_install():
+    raise AssertionError("webdriver-manager must not be called")
+
+
+@pytest.fixture
+def chrome(monkeypatch):
+    version = {"value": CHROME}
+    monkeypatch.setattr(driver_resolver, "detect_chrome_version", lambda: version["value"])
+    return version
+
+
+def test_installed_chrome_version_is_served_from_the_index(tmp_path, chrome):
+    index = str(tmp_path / "index.json")
+    driver = fake_driver(tmp_path, "chromedriver-120", CHROME)
+    save_index({CHROME: {"driver_path": driver, "driver_version": CHROME, "resolved_at": "2026-01-01T00:00:00"}},
+               index)
+    assert resolve_chromedriver(index, installer=no_install) == driver
+
+
+def test_new_chrome_version_is_installed_once_and_indexed(tmp_path, chrome):
+    index = str(tmp_path / "index.json")
+    installs = []
+
+    def install():
+        installs.append(1)
+        return fake_driver(tmp_path, "chromedriver-121", "121.0.6167.85")
+
+    chrome["value"] = "121.0.6167.85"
+    driver = resolve_chromedriver(index, installer=install)
+    assert load_index(index)["121.0.6167.85"]["driver_version"] == "121.0.6167.85"
+    assert resolve_chromedriver(index, installer=install) == driver
+    assert len(installs) == 1
+
+
+def test_failed_install_falls_back_to_the_newest_usable_entry(tmp_path, chrome):
+    index = str(tmp_path / "index.json")
+    old = fake_driver(tmp_path, "chromedriver-118", "118.0.5993.70")
+    newer = fake_driver(tmp_path, "chromedriver-119", "119.0.6045.105")
+    save_index({
+        "118.0.5993.70": {"driver_path": old, "resolved_at": "2026-01-01T00:00:00"},
+        "119.0.6045.105": {"driver_path": newer, "resolved_at": "2026-02-01T00:00:00"},
+        "119.0.6045.200": {"driver_path": str(tmp_path / "deleted"), "resolved_at": "2026-03-01T00:00:00"},
+    }, index)
+
+    def offline():
+        raise OSError("could not reach googlechromelabs.github.io")
+
+    assert resolve_chromedriver(index, installer=offline) == newer
+    # Chrome not detected: the index is used without trying to install
+    chrome["value"] = None
+    assert resolve_chromedriver(index, installer=no_install) == newer
+
+
+def test_no_usable_driver_is_an_error(tmp_path, chrome):
+    chrome["value"] = None
+    with pytest.raises(RuntimeError, match="No chromedriver available"):
+        resolve_chromedriver(str(tmp_path / "index.json"), installer=no_install)
+
+
+def test_concurrent_callers_resolve_once(monkeypatch):
+    calls = []
+
+    def slow_resolve():
+        calls.append(1)
+        time.sleep(0.1)
+        return "/usr/bin/chromedriver"
+
+    monkeypatch.setattr(driver_resolver, "_resolved_path", None)
+    monkeypatch.setattr(driver_resolver, "resolve_chromedriver", slow_resolve)
+    paths = []
+    threads = [threading.Thread(target=lambda: paths.append(driver_resolver.get_chromedriver_path()))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert paths == ["/usr/bin/chromedriver"] * 8
+    assert len(calls) == 1
@@ -0,0 +1,63 @@
+# python
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from benchmarks.fill_form import bench
+from pages import SeleniumPlaygroundPage
+from stub_hub import PlaygroundPage, start_hub
+
+BASE_URL = "http://127.0.0.1/selenium-playground"
+FIND = "POST /session/element"
+
+
+@pytest.fixture
+def page():
+    server, hub, url = start_hub(page=PlaygroundPage())
+    driver = webdriver.Remote(command_executor=url, options=ChromeOptions())
+    page = SeleniumPlaygroundPage(driver, timeout=2, base_url=BASE_URL, navigation="direct")
+    page.waits.observe = False
+    yield page, hub
+    driver.quit()
+    server.shutdown()
+
+
+def test_hits_skip_the_lookup_and_navigation_clears_the_cache(page):
+    page, hub = page
+    page.go_to_simple_form_demo()
+    finds = hub.commands[FIND]
+    page.enter_message("one")
+    page.click_get_checked_value()
+    page.enter_message("two")
+    page.click_get_checked_value()
+    assert page.element_cache == {"hits": 2, "misses": 2, "stale": 0, "invalidations": 0, "commands_saved": 2}
+    assert hub.commands[FIND] - finds == 2
+
+    page.go_to_checkbox_demo()
+    page.enter_message("three")
+    assert page.element_cache["invalidations"] == 1 and page.element_cache["misses"] == 3
+
+
+def test_first_stale_element_drops_the_whole_cache(page):
+    page, hub = page
+    page.go_to_simple_form_demo()
+    page.enter_message("one")
+    page.click_get_checked_value()
+    # a reload the page object does not know about (same URL, new document)
+    page.driver.get(page.driver.current_url)
+
+    page.enter_message("two")
+    cache = page.element_cache
+    assert cache["stale"] == 1 and cache["invalidations"] == 1
+    # the button was dropped with the first stale handle: looked up again, not tried and found stale
+    page.click_get_checked_value()
+    assert page.element_cache["stale"] == 1 and page.element_cache["misses"] == 4
+    # only the stale re-check was wasted
+    assert page.element_cache["commands_saved"] == -1
+
+
+def test_repeated_fill_benchmark_runs_cost_the_same(page):
+    page, _ = page
+    results = bench(4, driver=page.driver, base_url=BASE_URL, navigation="direct")
+    for mode, result in results.items():
+        assert len(set(result["commands_per_run"])) == 1, (mode, result["commands_per_run"])
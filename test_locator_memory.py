@@ -0,0 +1,61 @@
+# python
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.common.by import By
+
+from locator_memory import LocatorMemory
+from pages import SeleniumPlaygroundPage, text_fallback
+from stub_hub import PlaygroundPage, start_hub
+
+PRIMARY = (By.ID, "message")
+
+
+def test_parallel_workers_merge_and_count_one_run(tmp_path):
+    path = str(tmp_path / "memory.json")
+    workers = [LocatorMemory.load(path) for _ in range(3)]
+    for memory in workers:
+        memory.begin_run("run-1")
+    for i, memory in enumerate(workers):
+        for _ in range(i + 1):
+            memory.record("page", "message", PRIMARY, 0.01)
+        memory.save()
+
+    merged = LocatorMemory.load(path)
+    assert merged.runs == 1
+    assert merged.elements["page/message"][f"{By.ID}=message"]["hits"] == 6
+
+    merged.begin_run("run-2")
+    assert merged.runs == 2
+
+
+def test_text_fallbacks_share_one_entry(tmp_path):
+    memory = LocatorMemory.load(str(tmp_path / "memory.json"))
+    memory.begin_run()
+    for value in ("42", "Hello", "Lorem ipsum"):
+        fallback = text_fallback(value)
+        memory.order("page", "message", [PRIMARY, fallback])
+        memory.record("page", "message", fallback, 0.01)
+    memory.save()
+
+    entries = LocatorMemory.load(memory.path).elements["page/message"]
+    assert len(entries) == 2
+    assert [e["hits"] for e in entries.values()] == [0, 3]
+
+
+def test_candidates_matching_with_the_winner_never_go_stale(tmp_path):
+    # on the stub playground page every candidate shows the text: one wins each poll, the rest tie
+    server, _, url = start_hub(page=PlaygroundPage())
+    driver = webdriver.Remote(command_executor=url, options=ChromeOptions())
+    try:
+        memory = LocatorMemory.load(str(tmp_path / "memory.json"), stale_after=2)
+        page = SeleniumPlaygroundPage(driver, timeout=2, locator_memory=memory, navigation="direct")
+        for _ in range(4):
+            memory.begin_run()
+            page.validate_message_displayed("Hello")
+            memory.save()
+        assert memory.stale_locators() == []
+        hits = [e["hits"] for e in memory.elements["simple_form_demo/message"].values()]
+        assert sorted(hits) == [0, 0, 0, 0, 4]
+    finally:
+        driver.quit()
+        server.shutdown()
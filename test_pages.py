@@ -0,0 +1,42 @@
+# python
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from pages import SeleniumPlaygroundPage
+from stub_hub import PlaygroundPage, start_hub
+
+BASE_URL = "http://127.0.0.1/selenium-playground"
+
+
+@pytest.fixture
+def driver():
+    server, _, url = start_hub(page=PlaygroundPage())
+    driver = webdriver.Remote(command_executor=url, options=ChromeOptions())
+    yield driver
+    driver.quit()
+    server.shutdown()
+
+
+def page_for(driver, navigation):
+    page = SeleniumPlaygroundPage(driver, timeout=2, base_url=BASE_URL, navigation=navigation)
+    page.waits.observe = False
+    seen = []
+    page.on_first_page = lambda: seen.append(driver.current_url)
+    return page, seen
+
+
+def test_first_page_hook_runs_on_the_landing_page(driver):
+    page, seen = page_for(driver, "click")
+    page.open_playground()
+    assert seen == [BASE_URL]
+
+
+def test_first_page_hook_waits_for_the_first_deep_link(driver):
+    page, seen = page_for(driver, "direct")
+    # direct mode loads nothing in open_playground: a screenshot there would show about:blank
+    page.open_playground()
+    assert seen == []
+    page.go_to_simple_form_demo()
+    page.go_to_checkbox_demo()
+    assert seen == [f"{BASE_URL}/simple-form-demo"]
@@ -0,0 +1,61 @@
+# python
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages import SeleniumPlaygroundPage
+from playground_server import start_server
+
+
+@pytest.fixture(scope='module')
+def server_url():
+    server, url = start_server()
+    yield url
+    server.shutdown()
+
+
+def _get(url):
+    with urllib.request.urlopen(url, timeout=5) as resp:
+        return resp.read().decode('utf-8')
+
+
+def test_landing_page_links_match_page_object(server_url):
+    html = _get(server_url)
+    for _, text in (SeleniumPlaygroundPage.SIMPLE_FORM_DEMO_LINK, SeleniumPlaygroundPage.CHECKBOX_DEMO_LINK,
+                    SeleniumPlaygroundPage.INPUT_FORM_SUBMIT_LINK):
+        assert f">{text}</a>" in html
+
+
+@pytest.mark.parametrize("path, locators", [
+    ("/simple-form-demo", ["SINGLE_INPUT_FIELD", "GET_CHECKED_VALUE_BUTTON", "MESSAGE_DISPLAYED_LOCATOR",
+                           "FIRST_INPUT_FIELD", "SECOND_INPUT_FIELD", "SUM_DISPLAYED_LOCATOR"]),
+    ("/checkbox-demo", ["SINGLE_CHECKBOX", "SINGLE_CHECKBOX_SUCCESS_MESSAGE"]),
+    ("/input-form-demo", ["NAME_FIELD", "EMAIL_FIELD", "PASSWORD_FIELD", "COMPANY_FIELD", "WEBSITE_FIELD",
+                          "COUNTRY_DROPDOWN", "CITY_FIELD", "ADDRESS_1_FIELD", "ADDRESS_2_FIELD", "STATE_FIELD",
+                          "ZIPCODE_FIELD"]),
+])
+def test_pages_expose_page_object_locators(server_url, path, locators):
+    html = _get(server_url + path)
+    for name in locators:
+        by, value = getattr(SeleniumPlaygroundPage, name)
+        attr = {By.ID: 'id', By.NAME: 'name'}[by]
+        assert f'{attr}="{value}"' in html, f"{name} missing from {path}"
+
+
+def test_unknown_path_is_404(server_url):
+    with pytest.raises(urllib.error.HTTPError) as exc:
+        _get(server_url + "/does-not-exist")
+    assert exc.value.code == 404
+
+
+def test_latency_injection():
+    server, url = start_server(latency_ms=100, jitter_ms=0)
+    try:
+        start = time.perf_counter()
+        _get(url)
+        assert time.perf_counter() - start >= 0.1
+    finally:
+        server.shutdown()
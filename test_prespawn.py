@@ -0,0 +1,60 @@
+# python
+import time
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from drivers import SessionPrespawner
+from stub_hub import start_hub
+
+SESSION_DELAY_MS = 300
+
+
+@pytest.fixture
+def hub():
+    server, hub, url = start_hub(session_delay_ms=SESSION_DELAY_MS, max_sessions=3)
+    hub.url = url
+    yield hub
+    server.shutdown()
+
+
+def _factory(hub):
+    return lambda name: webdriver.Remote(command_executor=hub.url, options=ChromeOptions())
+
+
+def test_prespawned_session_is_ready_without_startup_wait(hub):
+    prespawner = SessionPrespawner(_factory(hub), standby=1, max_sessions=2)
+    prespawner.fill()
+    time.sleep(SESSION_DELAY_MS / 1000 * 2)
+    try:
+        start = time.perf_counter()
+        driver = prespawner.take("test_a")
+        assert time.perf_counter() - start < SESSION_DELAY_MS / 1000 / 2
+        driver.get("http://127.0.0.1/")
+        prespawner.release(driver)
+    finally:
+        prespawner.shutdown()
+    assert hub.active == 0
+
+
+def test_concurrency_cap_is_respected(hub):
+    prespawner = SessionPrespawner(_factory(hub), standby=3, max_sessions=2)
+    prespawner.fill()
+    try:
+        first = prespawner.take("test_a")
+        second = prespawner.take("test_b")
+        assert hub.active == 2
+        prespawner.release(first)
+        prespawner.release(second)
+    finally:
+        prespawner.shutdown()
+    assert hub.rejected == 0
+
+
+def test_unused_sessions_are_shut_down(hub):
+    prespawner = SessionPrespawner(_factory(hub), standby=2, max_sessions=2)
+    prespawner.fill()
+    prespawner.shutdown()
+    assert hub.active == 0
+    assert prespawner.stats()["discarded"] == 2
@@ -0,0 +1,29 @@
+# python
+import os
+
+from profiles import WarmProfile
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quits = 0
+
+    def quit(self):
+        self.quits += 1
+
+
+def test_clone_is_deleted_when_its_driver_quits(tmp_path):
+    profile = WarmProfile([], root=str(tmp_path))
+    os.makedirs(os.path.join(profile.template, "Default"))
+    open(os.path.join(profile.template, "SingletonLock"), "w").close()
+
+    clones = [profile.clone() for _ in range(2)]
+    assert all(os.path.isdir(os.path.join(c, "Default")) for c in clones)
+    assert not os.path.exists(os.path.join(clones[0], "SingletonLock"))
+
+    drivers = [profile.remove_on_quit(FakeDriver(), c) for c in clones]
+    drivers[0].quit()
+    assert not os.path.exists(clones[0]) and os.path.isdir(clones[1])
+    assert drivers[0].quits == 1
+    assert profile.summary()["clones"] == 2 and profile.summary()["clones_removed"] == 1
+    assert os.path.isdir(profile.template)
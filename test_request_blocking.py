@@ -0,0 +1,45 @@
+# python
+import json
+
+from request_blocking import ResourceBlocker
+
+URL = "https://www.googletagmanager.com/gtm.js"
+
+
+def entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": {"requestId": "1", **params}}})}
+
+
+def test_learn_run_seeds_the_sizes_blocked_runs_report(tmp_path):
+    cache = str(tmp_path / "sizes.json")
+    learner = ResourceBlocker(["analytics"], size_cache_path=cache, learn=True)
+    stats = learner.consume([entry("Network.requestWillBeSent", request={"url": URL}),
+                             entry("Network.loadingFinished", encodedDataLength=92000)])
+    assert stats["blocked_requests"] == 0 and stats["loaded_requests"] == 1
+    learner.save_sizes()
+
+    blocked = [entry("Network.requestWillBeSent", request={"url": URL}),
+               entry("Network.loadingFailed", blockedReason="inspector")]
+    unseeded = ResourceBlocker(["analytics"], size_cache_path=str(tmp_path / "empty.json")).consume(blocked)
+    assert unseeded["blocked_requests"] == 1 and unseeded["known_bytes_saved"] == 0
+    assert unseeded["blocked_with_known_size"] == 0
+
+    seeded = ResourceBlocker(["analytics"], size_cache_path=cache).consume(blocked)
+    assert seeded["known_bytes_saved"] == 92000 and seeded["blocked_with_known_size"] == 1
+
+
+def test_requests_spanning_two_log_drains_are_counted(tmp_path):
+    blocker = ResourceBlocker(["analytics"], size_cache_path=str(tmp_path / "sizes.json"))
+    blocker._sizes[URL] = 92000
+    first = blocker.consume([entry("Network.requestWillBeSent", request={"url": URL})])
+    second = blocker.consume([entry("Network.loadingFailed", blockedReason="inspector")])
+    assert first["blocked_requests"] == 0
+    assert second["blocked_requests"] == 1 and second["known_bytes_saved"] == 92000
+    # finished and failed requests are forgotten
+    assert blocker.consume([entry("Network.loadingFailed", blockedReason="inspector")])["blocked_requests"] == 0
+
+
+def test_open_requests_are_capped(tmp_path):
+    blocker = ResourceBlocker(["analytics"], size_cache_path=str(tmp_path / "sizes.json"), pending_capacity=2)
+    blocker.consume([entry("Network.requestWillBeSent", requestId=str(i), request={"url": URL}) for i in range(5)])
+    assert len(blocker._urls) == 2
@@ -5,10 +5,22 @@ import os
 from datetime import datetime
 import time
 
+from artifacts import artifact_path
+from datasets import DATA_DIR, CaseReport, load_cases
 from pages import SeleniumPlaygroundPage
 
 logger = logging.getLogger(__name__)
 
+# Deadline budget (seconds) shared by all page waits of a test, keyed by parametrize id.
+# Tests not listed here use TEST_BUDGET_S (default 180).
+SCENARIO_BUDGETS = {
+    "Scenario_1_SimpleForm": 60,
+    "Scenario_2_TwoInputs": 60,
+    "Scenario_3_InputFormSubmit": 120,
+    "DataDriven_Sum": 600,
+    "DataDriven_Message": 600,
+}
+
 # --- Scenario Functions ---
 def scenario_1_simple_form_demo(page: SeleniumPlaygroundPage):
     message_to_enter = "Welcome to LambdaTest"
@@ -88,15 +100,20 @@ def scenario_3_input_form_submit(page: SeleniumPlaygroundPage):
     "Scenario_2_TwoInputs",
     "Scenario_3_InputFormSubmit"
 ])
-def test_selenium_playground_scenarios(scenario_number, driver):
-    page = SeleniumPlaygroundPage(driver)
-    
-    driver.get("https://www.lambdatest.com/selenium-playground")
-    logger.info(f"Starting Test Scenario {scenario_number} from Selenium Playground.")
-    
+def test_selenium_playground_scenarios(scenario_number, driver, page, screenshot_store, capture_ring):
     test_name = f"scenario_{scenario_number}"
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    driver.save_screenshot(f'screenshots/start_{test_name}_{timestamp}.png')
+
+    def start_shot():
+        # with CAPTURE_MODE=ring the start/end screenshots only reach disk if the test fails
+        if capture_ring is not None:
+            capture_ring.capture('start')
+        else:
+            screenshot_store.put(test_name, 'start', driver.get_screenshot_as_png())
+
+    # taken on the first loaded page: with NAVIGATION_MODE=direct open_playground loads nothing
+    page.on_first_page = start_shot
+    page.open_playground()
+    logger.info(f"Starting Test Scenario {scenario_number} from Selenium Playground.")
 
     if scenario_number == 1:
         scenario_1_simple_form_demo(page)
@@ -107,5 +124,34 @@ def test_selenium_playground_scenarios(scenario_number, driver):
     else:
         pytest.fail(f"Invalid scenario number: {scenario_number}")
 
-    driver.save_screenshot(f'screenshots/end_{test_name}_{timestamp}.png')
+    if capture_ring is not None:
+        capture_ring.capture('end')
+    else:
+        screenshot_store.put(test_name, 'end', driver.get_screenshot_as_png())
     logger.info(f"Finished Test Scenario {scenario_number} successfully.")
+
+
+# --- Data-driven cases: whole tables run inside one loaded Simple Form Demo page ---
+DATASETS = {
+    "sum": ("SUM_CASES", "sum_cases.csv", "run_sum_cases"),
+    "message": ("MESSAGE_CASES", "messages.json", "run_message_cases"),
+}
+
+
+@pytest.mark.parametrize("dataset", list(DATASETS), ids=["DataDriven_Sum", "DataDriven_Message"])
+def test_simple_form_data_driven(dataset, request, page):
+    env_var, default_file, method = DATASETS[dataset]
+    cases = load_cases(os.getenv(env_var, os.path.join(DATA_DIR, default_file)))
+
+    page.open_playground()
+    page.go_to_simple_form_demo()
+    report = CaseReport(artifact_path("reports", f"{request.node.name}.jsonl"))
+    try:
+        getattr(page, method)(cases, on_result=report)
+    finally:
+        report.close()
+    summary = report.summary()
+    logger.info(f"[DATA] {dataset}: {summary}")
+
+    failures = [f"row {r['row']}: expected '{r['expected']}', found '{r['actual']}'" for r in report.failed[:10]]
+    assert not report.failed, f"{len(report.failed)} of {summary['cases']} case(s) failed:\n" + "\n".join(failures)
@@ -0,0 +1,56 @@
+# python
+import threading
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from scheduler import DurationHistory, create_with_backoff, plan_lpt
+from stub_hub import start_hub
+
+
+def test_lpt_plan_balances_long_tests():
+    durations = {"a": 9, "b": 7, "c": 6, "d": 5, "e": 4, "f": 3}
+    shards, makespan = plan_lpt(list(durations), durations.get, 2)
+    loads = sorted(sum(durations[t] for t in s) for s in shards)
+    assert loads == [17, 17]
+    assert makespan == 17
+
+
+def test_history_estimates_unknown_tests_from_the_average(tmp_path):
+    history = DurationHistory(str(tmp_path / "durations.json"))
+    history.update("test_a", 4.0)
+    history.update("test_a", 2.0)
+    history.update("test_b", 6.0)
+    history.save()
+    reloaded = DurationHistory(history.path)
+    assert reloaded.estimate("test_a") == 3.0
+    assert reloaded.estimate("test_new") == 4.5
+
+
+def test_session_creation_waits_for_grid_capacity():
+    server, hub, url = start_hub(max_sessions=1)
+    try:
+        holder = webdriver.Remote(command_executor=url, options=ChromeOptions())
+        threading.Timer(0.3, holder.quit).start()
+        driver, waited = create_with_backoff(
+            lambda: webdriver.Remote(command_executor=url, options=ChromeOptions()),
+            retries=6, base_delay=0.1, max_delay=0.5)
+        driver.quit()
+    finally:
+        server.shutdown()
+    assert hub.rejected >= 1
+    assert waited > 0
+
+
+def test_non_capacity_errors_are_not_retried():
+    calls = []
+
+    def create():
+        calls.append(1)
+        raise WebDriverException("invalid argument: unknown capability")
+
+    with pytest.raises(WebDriverException):
+        create_with_backoff(create, retries=3, base_delay=0)
+    assert len(calls) == 1
@@ -0,0 +1,114 @@
+# python
+import io
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from artifacts import CaptureRing, get_writer
+from instrumentation import Instrumentation
+from visual_diff import VisualDiff
+
+
+def png(array):
+    buf = io.BytesIO()
+    Image.fromarray(array).save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def frames():
+    base = np.full((120, 200, 3), 240, dtype=np.uint8)
+    changed = base.copy()
+    changed[10:20, 30:50] = 0  # 200 px "regression"
+    return base, changed
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    """run(shots, masks=None): one test run's screenshots against the shared baseline dir."""
+    monkeypatch.setenv("ARTIFACT_ROOT", str(tmp_path / "out"))
+
+    def _run(shots, masks=None):
+        visual = VisualDiff(str(tmp_path / "baselines"), min_similarity=0.999, masks=masks)
+        for test, step, array in shots:
+            visual.begin(test)
+            visual.submit(step, png(array))
+        results = visual.drain()
+        visual.close()
+        return results, visual
+
+    return _run
+
+
+def test_first_run_writes_baselines_later_runs_compare(run, frames):
+    base, changed = frames
+    results, visual = run([("test_x", "start", base), ("test_x", "start", base)])
+    assert [r["status"] for r in results] == ["new", "new"]
+    assert sorted(os.listdir(os.path.join(visual.baseline_dir, "test_x"))) == ["start.png", "start_2.png"]
+
+    results, visual = run([("test_x", "start", base), ("test_x", "start", changed)])
+    same, regression = results
+    assert same["status"] == "pass" and same["changed_pixels"] == 0
+    assert regression["status"] == "fail" and regression["changed_pixels"] == 200
+    assert regression["bbox"] == [30, 10, 20, 10]
+    get_writer().flush()
+    diff = np.asarray(Image.open(regression["diff"]))
+    assert tuple(diff[15, 40]) == (255, 0, 0) and tuple(diff[100, 100]) != (255, 0, 0)
+
+
+def test_identical_shots_skip_decoding_and_shared_baselines_decode_once(run, frames):
+    base, changed = frames
+    run([("test_x", "start", base), ("test_x", "end", base), ("test_y", "end", base)])
+    results, visual = run([("test_x", "start", base), ("test_x", "end", changed), ("test_y", "end", changed)])
+    assert [r["status"] for r in results] == ["pass", "fail", "fail"]
+    stats = visual.stats()
+    assert stats["identical"] == 1
+    # test_x/end and test_y/end baselines have the same content: decoded once
+    assert stats["baseline_cache_misses"] == 1 and stats["baseline_cache_hits"] == 1
+
+
+def test_masked_regions_are_ignored(run, frames):
+    base, changed = frames
+    run([("test_x", "end", base)])
+    results, _ = run([("test_x", "end", changed)], masks={"test_x/*": [(25, 5, 40, 20)]})
+    assert results[0]["status"] == "pass" and results[0]["changed_pixels"] == 0 and "diff" not in results[0]
+
+
+def test_size_change_fails(run, frames):
+    base, _ = frames
+    run([("test_x", "end", base)])
+    results, _ = run([("test_x", "end", base[:100])])
+    assert results[0]["status"] == "fail" and results[0]["similarity"] == 0.0 and "size" in results[0]["reason"]
+
+
+class FakeDriver:
+    page_source = "<html></html>"
+
+    def __init__(self, array):
+        self.png = png(array)
+
+    def get_screenshot_as_png(self):
+        return self.png
+
+
+def test_top_level_step_shots_share_the_test_key_in_both_capture_modes(tmp_path, monkeypatch, frames):
+    monkeypatch.setenv("ARTIFACT_ROOT", str(tmp_path / "out"))
+    base, _ = frames
+    visual = VisualDiff(str(tmp_path / "baselines"))
+    driver = FakeDriver(base)
+    for mode, test in (("disk", "test_x[disk]"), ("ring", "test_x[ring]")):
+        visual.begin(test)
+        instr = Instrumentation(test)
+        instr.add_listener(CaptureRing(driver, visual=visual) if mode == "ring" else visual.step_listener(driver))
+        with instr.step("fill_form"):
+            for _ in range(3):
+                with instr.step("enter_message"):
+                    pass
+        with pytest.raises(ValueError), instr.step("submit"):
+            raise ValueError("failed steps are not compared")
+    results = visual.drain()
+    visual.close()
+    assert [(r["test"], r["step"]) for r in results] == [("test_x[disk]", "fill_form"), ("test_x[ring]", "fill_form")]
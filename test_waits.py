@@ -0,0 +1,106 @@
+# python
+import time
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+
+from stub_hub import StubPage, start_hub
+from waits import Budget, BudgetExceeded, WaitEngine
+
+
+@pytest.fixture
+def remote():
+    server, _, url = start_hub()
+    driver = webdriver.Remote(command_executor=url, options=ChromeOptions())
+    yield driver
+    driver.quit()
+    server.shutdown()
+
+
+def test_condition_is_polled_with_backoff_until_true(remote):
+    engine = WaitEngine(remote, poll=0.01, max_poll=0.08, backoff=2, observe=False)
+    calls = []
+
+    def ready(driver):
+        calls.append(time.perf_counter())
+        if len(calls) < 5:
+            raise NoSuchElementException()
+        return "ok"
+
+    assert engine.until(ready, timeout=5) == "ok"
+    gaps = [b - a for a, b in zip(calls, calls[1:])]
+    assert gaps[-1] > gaps[0]
+    assert engine.stats()["polls"] == 5
+    assert engine.stats()["timeouts"] == 0
+
+
+def test_negative_check_returns_at_its_own_timeout(remote):
+    engine = WaitEngine(remote, poll=0.02, max_poll=0.05)
+    start = time.perf_counter()
+    with pytest.raises(TimeoutException):
+        engine.until(lambda d: d.find_elements("id", "missing"), timeout=0.3, name="missing")
+    assert time.perf_counter() - start < 1.0
+    record = engine.records[-1]
+    assert record.timed_out and record.name == "missing" and record.polls > 1
+
+
+def test_waits_share_the_test_budget(remote):
+    engine = WaitEngine(remote, timeout=20, poll=0.02, max_poll=0.05)
+    engine.budget = Budget(0.5, "test_x")
+    with pytest.raises(TimeoutException):
+        engine.until(lambda d: False, timeout=0.2, name="first")
+    start = time.perf_counter()
+    with pytest.raises(BudgetExceeded, match="second .*first"):
+        engine.until(lambda d: False, name="second")
+    assert time.perf_counter() - start < 0.6
+    with pytest.raises(BudgetExceeded):
+        engine.until(lambda d: True, name="third")
+
+
+def test_page_loads_draw_from_the_budget(remote):
+    engine = WaitEngine(remote, observe=False)
+    engine.budget = Budget(5, "test_x")
+    engine.navigate("http://127.0.0.1/page", name="open_page")
+    assert remote.current_url == "http://127.0.0.1/page"
+    # the load may take at most what is left of the budget, not the driver's 300 s
+    assert remote.timeouts.page_load <= 5
+    assert "open_page" in engine.budget.spent
+
+    def hanging_load(url):
+        raise TimeoutException("timeout: Timed out receiving message from renderer")
+
+    remote.get = hanging_load
+    with pytest.raises(BudgetExceeded, match="open_page"):
+        engine.navigate("http://127.0.0.1/slow", name="open_page")
+
+    engine.restore_page_load_timeout()
+    assert remote.timeouts.page_load == 300
+
+
+class AnimatedPage(StubPage):
+    """A page whose attributes change every frame (a CSS spinner) while its nodes and text stay put."""
+
+    def script(self, session, script, args):
+        if 'MutationObserver' in script:
+            if 'attributes: true' in script:
+                return True
+            time.sleep(args[0] / 1000)
+            return False
+        return None
+
+
+def test_attribute_animations_do_not_cut_the_backoff_short():
+    server, _, url = start_hub(page=AnimatedPage())
+    driver = webdriver.Remote(command_executor=url, options=ChromeOptions())
+    try:
+        engine = WaitEngine(driver, poll=0.02, max_poll=0.08, backoff=2)
+        with pytest.raises(TimeoutException):
+            engine.until(lambda d: False, timeout=0.5, name="spinner")
+        record = engine.records[-1]
+        assert record.wakeups == 0
+        assert record.polls < 15
+    finally:
+        driver.quit()
+        server.shutdown()
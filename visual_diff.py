@@ -0,0 +1,286 @@
+# python
+"""Visual regression check of step screenshots against baseline images.
+
+Screenshots and baselines are decoded into numpy arrays and compared in one vectorized
+pass: per-pixel max channel delta above `threshold` counts as changed, masked regions
+(clocks, ads, cursors) are left out, and similarity = 1 - changed / compared pixels.
+For frames below `min_similarity`, changed pixels are drawn red over a faded copy of the
+screenshot in visual/<test>__<step>.diff.png.
+
+Baselines live in VISUAL_BASELINE_DIR/<test>/<step>.png, <test> being the test set with
+begin() (the pytest node name) whichever component took the screenshot; a missing baseline is
+written from the current screenshot (status 'new'), VISUAL_UPDATE=true overwrites them all. A screenshot
+byte-identical to its baseline passes without decoding. Decoded baselines are cached in memory
+by content (LRU), so baselines shared by many tests decode once; comparisons run on one background
+thread (numpy and Pillow release the GIL), so the test only pays for handing over the PNG bytes.
+
+numpy and Pillow are optional: without them VisualDiff.available() is False and the
+conftest fixture leaves the check off.
+"""
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # visual diffs are skipped without numpy + Pillow
+    np = None
+    Image = None
+
+from artifacts import artifact_path, get_writer
+
+logger = logging.getLogger(__name__)
+
+# red for changed pixels, blue tint for masked regions
+_CHANGED = (255, 0, 0)
+_MASKED = (90, 90, 200)
+
+
+def _safe(name):
+    return re.sub(r'[^\w.-]+', '_', name).strip('_') or 'unnamed'
+
+
+def decode(png):
+    """PNG bytes -> HxWx3 uint8 array."""
+    return np.asarray(Image.open(io.BytesIO(png)).convert('RGB'))
+
+
+def encode(array):
+    buf = io.BytesIO()
+    # speed over size: diff images are debugging output
+    Image.fromarray(array).save(buf, 'PNG', compress_level=1)
+    return buf.getvalue()
+
+
+def load_masks(path):
+    """Masks file: {"<test>/<step> glob": [[x, y, width, height], ...]}; '*' applies everywhere."""
+    if not path:
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return {pattern: [tuple(int(v) for v in rect) for rect in rects] for pattern, rects in json.load(f).items()}
+
+
+class VisualDiff:
+    def __init__(self, baseline_dir='baselines', threshold=16, min_similarity=0.999, masks=None, update=False,
+                 cache_size=16):
+        self.baseline_dir = baseline_dir
+        self.threshold = threshold
+        self.min_similarity = min_similarity
+        self.masks = masks or {}
+        self.update = update
+        # only touched by the single comparison thread: no locking needed
+        self._digests = {}     # baseline path -> (mtime_ns, sha256 of the file)
+        self._decoded = OrderedDict()  # sha256 -> decoded array, least recently used first
+        self.cache_size = cache_size
+        self._mask_cache = {}  # (rects, shape) -> bool array of compared pixels
+        self._seen = {}        # (test, step) -> occurrences, so repeated steps get their own baseline
+        self.test = None
+        self._pending = []
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='visual-diff')
+        self.results = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.identical = 0
+
+    @staticmethod
+    def available():
+        return np is not None and Image is not None
+
+    @classmethod
+    def from_env(cls):
+        """VISUAL_BASELINE_DIR (baselines), VISUAL_THRESHOLD (16 of 255), VISUAL_MIN_SIMILARITY (0.999),
+        VISUAL_MASKS (JSON file, see load_masks), VISUAL_UPDATE (false), VISUAL_CACHE_SIZE (16 decoded baselines)."""
+        return cls(
+            baseline_dir=os.getenv('VISUAL_BASELINE_DIR', 'baselines'),
+            threshold=int(os.getenv('VISUAL_THRESHOLD', '16')),
+            min_similarity=float(os.getenv('VISUAL_MIN_SIMILARITY', '0.999')),
+            masks=load_masks(os.getenv('VISUAL_MASKS')),
+            update=os.getenv('VISUAL_UPDATE', 'false').lower() == 'true',
+            cache_size=int(os.getenv('VISUAL_CACHE_SIZE', '16')),
+        )
+
+    def begin(self, test):
+        """Set the test that following screenshots belong to (their baseline directory)."""
+        self.test = test
+
+    def submit(self, step, png):
+        """Queue a screenshot of the current test for comparison; returns at once."""
+        test = self.test or 'unnamed'
+        with self._lock:
+            n = self._seen.get((test, step), 0) + 1
+            self._seen[(test, step)] = n
+            key = step if n == 1 else f"{step}_{n}"
+            self._pending.append(self._pool.submit(self._compare_safely, test, key, png))
+
+    def drain(self):
+        """Wait for the queued comparisons and return their results (the current test's, when called per test)."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return [r for r in (f.result() for f in pending) if r is not None]
+
+    def _compare_safely(self, test, step, png):
+        try:
+            result = self.compare(test, step, png)
+        except Exception as e:
+            logger.debug(f"[VISUAL] comparing {test}/{step} failed: {e}")
+            return None
+        with self._lock:
+            self.results.append(result)
+        if result['status'] == 'fail':
+            logger.warning(f"[VISUAL] {test}/{step}: similarity {result['similarity']:.4f} "
+                           f"< {self.min_similarity}, diff: {result.get('diff')}")
+        return result
+
+    def compare(self, test, step, png):
+        """Compare one screenshot with its baseline; returns the result dict."""
+        start = time.perf_counter()
+        path = os.path.join(self.baseline_dir, _safe(test), f"{_safe(step)}.png")
+        digest = hashlib.sha256(png).hexdigest()
+        result = {'test': test, 'step': step, 'baseline': path}
+        baseline_digest = None if self.update else self._baseline_digest(path)
+        if baseline_digest is None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(png)
+            self._digests[path] = (os.stat(path).st_mtime_ns, digest)
+            result.update(status='updated' if self.update else 'new', similarity=1.0)
+        elif baseline_digest == digest:
+            self.identical += 1
+            result.update(status='pass', similarity=1.0, changed_pixels=0)
+        else:
+            baseline = self._baseline(path, baseline_digest)
+            current = decode(png)
+            if baseline.shape != current.shape:
+                result.update(status='fail', similarity=0.0, reason=f"size {current.shape[1]}x{current.shape[0]} "
+                                                                    f"!= {baseline.shape[1]}x{baseline.shape[0]}")
+            else:
+                result.update(self._diff(test, step, current, baseline))
+        result['ms'] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    def _diff(self, test, step, current, baseline):
+        # |a - b| on uint8 without widening (max - min), then per channel: several times faster than .max(axis=2)
+        delta = np.maximum(current, baseline)
+        delta -= np.minimum(current, baseline)
+        t = self.threshold
+        changed = (delta[..., 0] > t) | (delta[..., 1] > t) | (delta[..., 2] > t)
+        compared = self._mask(f"{test}/{step}", current.shape[:2])
+        if compared is not None:
+            changed &= compared
+            total = int(np.count_nonzero(compared))
+        else:
+            total = changed.size
+        n = int(np.count_nonzero(changed))
+        similarity = 1.0 - n / total if total else 1.0
+        out = {'status': 'pass' if similarity >= self.min_similarity else 'fail',
+               'similarity': round(similarity, 6), 'changed_pixels': n}
+        if n:
+            rows = np.flatnonzero(changed.any(axis=1))
+            cols = np.flatnonzero(changed.any(axis=0))
+            out['bbox'] = [int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)]
+        if out['status'] == 'fail':
+            # encoding is the expensive part: only frames below min_similarity get a diff image
+            image = current // 3 + 170  # faded copy, stays uint8
+            if compared is not None:
+                image[~compared] = _MASKED
+            image[changed] = _CHANGED
+            out['diff'] = get_writer().submit(artifact_path('visual', f"{_safe(test)}__{_safe(step)}.diff.png"),
+                                              encode(image))
+        return out
+
+    def _baseline_digest(self, path):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+        cached = self._digests.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                cached = (mtime, hashlib.sha256(f.read()).hexdigest())
+            self._digests[path] = cached
+        return cached[1]
+
+    def _baseline(self, path, digest):
+        array = self._decoded.get(digest)
+        if array is not None:
+            self.cache_hits += 1
+            self._decoded.move_to_end(digest)
+            return array
+        self.cache_misses += 1
+        with open(path, 'rb') as f:
+            array = decode(f.read())
+        self._decoded[digest] = array
+        while len(self._decoded) > self.cache_size:
+            self._decoded.popitem(last=False)
+        return array
+
+    def _mask(self, key, shape):
+        """Boolean array of pixels to compare (False inside ignore rectangles), or None for no masks."""
+        rects = tuple(rect for pattern, rs in self.masks.items() if fnmatchcase(key, pattern) for rect in rs)
+        if not rects:
+            return None
+        mask = self._mask_cache.get((rects, shape))
+        if mask is None:
+            mask = np.ones(shape, dtype=bool)
+            for x, y, w, h in rects:
+                mask[max(y, 0):max(y + h, 0), max(x, 0):max(x + w, 0)] = False
+            self._mask_cache[(rects, shape)] = mask
+        return mask
+
+    def close(self):
+        self.drain()
+        self._pool.shutdown()
+
+    def step_listener(self, driver):
+        return StepShots(driver, self)
+
+    def stats(self):
+        statuses = {}
+        for r in self.results:
+            statuses[r['status']] = statuses.get(r['status'], 0) + 1
+        return {
+            'compared': len(self.results),
+            **statuses,
+            'baseline_cache_hits': self.cache_hits,
+            'baseline_cache_misses': self.cache_misses,
+            'identical': self.identical,
+            'avg_ms': round(sum(r['ms'] for r in self.results) / len(self.results), 1) if self.results else 0.0,
+        }
+
+
+class StepShots:
+    """Instrumentation listener: a screenshot after every passing top-level step goes to the visual diff.
+
+    Nested steps (the per-row steps of a data-driven run) are skipped: they would add a
+    baseline per row, churning whenever the table changes. Used with CAPTURE_MODE=disk;
+    in ring mode the capture ring's own step shots are compared.
+    """
+
+    def __init__(self, driver, visual):
+        self.driver = driver
+        self.visual = visual
+        self._depth = 0
+
+    def on_step_start(self, name):
+        self._depth += 1
+
+    def on_step_end(self, record):
+        self._depth = max(self._depth - 1, 0)
+        if self._depth or record.error is not None:
+            return
+        try:
+            png = self.driver.get_screenshot_as_png()
+        except Exception as e:
+            logger.debug(f"[VISUAL] screenshot after '{record.name}' failed: {e}")
+            return
+        self.visual.submit(record.name, png)
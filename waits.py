@@ -0,0 +1,232 @@
+# python
+import logging
+import os
+import time
+
+from selenium.common.exceptions import (NoSuchElementException, StaleElementReferenceException, TimeoutException,
+                                        WebDriverException)
+
+logger = logging.getLogger(__name__)
+
+# Resolves after the first DOM mutation or after arguments[0] ms, whichever comes first.
+# Attribute changes are left out: animated pages (spinners, transitions) change them
+# every frame, which would end every pause at once and poll without backoff.
+_JS_WAIT_FOR_MUTATION = """
+var done = arguments[arguments.length - 1], ms = arguments[0];
+var root = document.documentElement;
+if (!root || typeof MutationObserver === 'undefined') { setTimeout(function () { done(false); }, ms); return; }
+var observer = new MutationObserver(function () { clearTimeout(timer); observer.disconnect(); done(true); });
+var timer = setTimeout(function () { observer.disconnect(); done(false); }, ms);
+observer.observe(root, {subtree: true, childList: true, characterData: true});
+"""
+
+IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+
+class BudgetExceeded(AssertionError):
+    """The test's deadline budget ran out; the message carries the breakdown."""
+
+
+class Budget:
+    """Deadline shared by every wait and page load of one test: each gets at most the time left.
+
+    Wait and page-load time is booked per name (the page-object step), so when the
+    budget runs out the failure says where the time went.
+    """
+
+    def __init__(self, seconds, name=None):
+        self.seconds = seconds
+        self.name = name
+        self.started = time.perf_counter()
+        self.deadline = self.started + seconds
+        self.spent = {}
+
+    def remaining(self):
+        return self.deadline - time.perf_counter()
+
+    def charge(self, name, seconds):
+        self.spent[name] = self.spent.get(name, 0.0) + seconds
+
+    def breakdown(self):
+        elapsed = time.perf_counter() - self.started
+        waits = sorted(self.spent.items(), key=lambda kv: kv[1], reverse=True)
+        parts = [f"{name} {secs:.1f}s" for name, secs in waits]
+        other = elapsed - sum(self.spent.values())
+        return (f"budget {self.seconds:g}s for {self.name or 'test'} exhausted after {elapsed:.1f}s; "
+                f"waits: {', '.join(parts) or 'none'}; outside waits: {other:.1f}s")
+
+    def exceeded(self):
+        return BudgetExceeded(self.breakdown())
+
+
+class WaitRecord:
+    """Outcome of one wait: how long it took, how often the condition was checked and
+    how many of the pauses in between were cut short by a DOM mutation."""
+
+    def __init__(self, name):
+        self.name = name
+        self.elapsed = 0.0
+        self.polls = 0
+        self.wakeups = 0
+        self.timed_out = False
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'elapsed_s': round(self.elapsed, 4),
+            'polls': self.polls,
+            'wakeups': self.wakeups,
+            'timed_out': self.timed_out,
+        }
+
+
+class WaitEngine:
+    """The one place the page object waits.
+
+    Meant to run with the driver's implicit wait at 0 (see drivers.create_driver), so a
+    find_element inside a condition returns at once instead of blocking up to the
+    implicit timeout. Between checks it pauses `poll` seconds, growing by `backoff`
+    up to `max_poll`. With `observe`, the pause is spent in an in-page MutationObserver
+    (execute_async_script) that returns as soon as nodes or text change, so conditions
+    are re-checked right after the page updates; if the script cannot run (page unloading,
+    driver without async script support) the pause falls back to a plain sleep.
+    """
+
+    def __init__(self, driver, timeout=20, poll=0.05, max_poll=0.5, backoff=1.5, observe=True):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll = poll
+        self.max_poll = max(poll, max_poll)
+        self.backoff = backoff
+        self.observe = observe
+        self.records = []
+        # optional Budget: caps every wait (and page load, see navigate) at the time the test has left
+        self.budget = None
+        self._observer_failures = 0
+        self._page_load_timeout = None  # the driver's own page load timeout, read before the first clamp
+        self._page_load_clamped = False
+
+    @classmethod
+    def from_env(cls, driver, timeout=20):
+        """WAIT_POLL_MS (50), WAIT_MAX_POLL_MS (500), WAIT_BACKOFF (1.5), WAIT_OBSERVE (true)."""
+        return cls(
+            driver, timeout,
+            poll=float(os.getenv('WAIT_POLL_MS', '50')) / 1000,
+            max_poll=float(os.getenv('WAIT_MAX_POLL_MS', '500')) / 1000,
+            backoff=float(os.getenv('WAIT_BACKOFF', '1.5')),
+            observe=os.getenv('WAIT_OBSERVE', 'true').lower() == 'true',
+        )
+
+    def until(self, condition, timeout=None, name=None, message=''):
+        """Return the first truthy value of condition(driver); TimeoutException after `timeout` seconds.
+
+        With a budget the wait is cut to the time left, and running out of budget raises
+        BudgetExceeded (with the breakdown) instead of TimeoutException.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        record = WaitRecord(name or getattr(condition, '__name__', type(condition).__name__))
+        budget_bound = False
+        if self.budget is not None:
+            remaining = self.budget.remaining()
+            if remaining <= 0:
+                raise self.budget.exceeded()
+            budget_bound = remaining < timeout
+            timeout = min(timeout, remaining)
+        self.records.append(record)
+        start = time.perf_counter()
+        deadline = start + timeout
+        delay = self.poll
+        try:
+            while True:
+                record.polls += 1
+                try:
+                    value = condition(self.driver)
+                    if value:
+                        return value
+                except IGNORED_EXCEPTIONS:
+                    pass
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    record.timed_out = True
+                    break
+                if self._pause(min(delay, remaining)):
+                    record.wakeups += 1
+                delay = min(delay * self.backoff, self.max_poll)
+        finally:
+            record.elapsed = time.perf_counter() - start
+            if self.budget is not None:
+                self.budget.charge(record.name, record.elapsed)
+        if budget_bound:
+            raise self.budget.exceeded()
+        raise TimeoutException(message or f"Condition '{record.name}' not met within {timeout:.1f}s")
+
+    def navigate(self, url, name=None):
+        """driver.get(url), counted against the budget like a wait.
+
+        The driver's page load timeout is cut to the time the test has left, so a hanging
+        load raises BudgetExceeded instead of running for the driver's own timeout, and
+        the load time is booked under `name`. Without a budget this is driver.get(url).
+        """
+        if self.budget is None:
+            return self.driver.get(url)
+        name = name or 'navigate'
+        remaining = self.budget.remaining()
+        if remaining <= 0:
+            raise self.budget.exceeded()
+        if self._page_load_timeout is None:
+            self._page_load_timeout = self.driver.timeouts.page_load
+        budget_bound = remaining < self._page_load_timeout
+        if budget_bound:
+            self.driver.set_page_load_timeout(remaining)
+            self._page_load_clamped = True
+        start = time.perf_counter()
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            if budget_bound:
+                raise self.budget.exceeded() from None
+            raise
+        finally:
+            self.budget.charge(name, time.perf_counter() - start)
+
+    def restore_page_load_timeout(self):
+        """Put back the page load timeout navigate() cut down (drivers outlive the test in a pool)."""
+        if not self._page_load_clamped:
+            return
+        try:
+            self.driver.set_page_load_timeout(self._page_load_timeout)
+        except WebDriverException as e:
+            logger.debug(f"[WAITS] restoring the page load timeout failed: {e}")
+        self._page_load_clamped = False
+
+    def _pause(self, seconds):
+        """Sleep up to `seconds`; returns True when a DOM mutation ended the pause early."""
+        if self.observe:
+            start = time.perf_counter()
+            try:
+                mutated = self.driver.execute_async_script(_JS_WAIT_FOR_MUTATION, int(seconds * 1000))
+                self._observer_failures = 0
+                if mutated:
+                    return True
+            except WebDriverException as e:
+                # navigation in progress, or no async script support: after a few failures in a row stop trying
+                self._observer_failures += 1
+                if self._observer_failures >= 5:
+                    logger.debug(f"[WAITS] MutationObserver wake-ups disabled: {e}")
+                    self.observe = False
+            seconds -= time.perf_counter() - start
+            if seconds <= 0:
+                return False
+        time.sleep(seconds)
+        return False
+
+    def stats(self):
+        records = self.records
+        return {
+            'waits': len(records),
+            'timeouts': sum(r.timed_out for r in records),
+            'total_s': round(sum(r.elapsed for r in records), 4),
+            'max_s': round(max((r.elapsed for r in records), default=0.0), 4),
+            'polls': sum(r.polls for r in records),
+            'wakeups': sum(r.wakeups for r in records),
+        }